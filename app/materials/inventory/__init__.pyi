@@ -1,12 +1,12 @@
 from app.materials.inventory.snapshot import Snapshot as Snapshot
 
-from typing import NamedTuple, TypedDict, Unpack, Generator, overload
+from typing import NamedTuple, TypedDict, Unpack, Generator, Callable, overload
 import datetime as dt
 from app.support import FloatRange
 from app.support.logging import HasLogger
 from app.support.grouped import Atom, Grouped, GroupedView
 from app.style import GreigeStyle
-from app.materials.roll import SizeClass, Roll, RollView, RollAlloc
+from app.materials.roll import SizeClass, KnitPlant, Roll, RollView, RollAlloc
 
 class PortLoad(NamedTuple):
     roll1: RollAlloc
@@ -40,6 +40,7 @@ class SizeGroup(Grouped[str, str]):
     def get(self, id: str) -> RollView: ...
     def add(self, data: Roll) -> None: ...
     def remove(self, dview: RollView, remkey: bool = False) -> Roll: ...
+    def update[R](self, dview: RollView, func: Callable[[Roll], R]) -> R: ...
     def view(self) -> 'SizeView': ...
 
 class SizeView(GroupedView[str, str]):
@@ -54,6 +55,7 @@ class SizeView(GroupedView[str, str]):
     def get(self, id: str) -> RollView: ...
     def add(self, data: Roll) -> None: ...
     def remove(self, dview: RollView, remkey: bool = False) -> Roll: ...
+    def update[R](self, dview: RollView, func: Callable[[Roll], R]) -> R: ...
 
 class StyleGroup(Grouped[str, SizeClass]):
     def __init__(self, **kwargs: Unpack[_StyleProps]) -> None: ...
@@ -69,6 +71,7 @@ class StyleGroup(Grouped[str, SizeClass]):
     def get(self, id: str) -> RollView: ...
     def add(self, data: Roll) -> None: ...
     def remove(self, dview: RollView, remkey: bool = False) -> Roll: ...
+    def update[R](self, dview: RollView, func: Callable[[Roll], R]) -> R: ...
     def view(self) -> 'StyleView': ...
 
 class StyleView(GroupedView[str, SizeClass]):
@@ -85,13 +88,22 @@ class StyleView(GroupedView[str, SizeClass]):
     def get(self, id: str) -> RollView: ...
     def add(self, data: Roll) -> None: ...
     def remove(self, dview: RollView, remkey: bool = False) -> Roll: ...
+    def update[R](self, dview: RollView, func: Callable[[Roll], R]) -> R: ...
 
-class Inventory(HasLogger, Grouped[str, GreigeStyle], attrs=('_logger','logger')):
+class Inventory(HasLogger, Grouped[str, GreigeStyle], attrs=('_logger','logger','snapshot'),
+                priv_attrs=('snapshot','n_new','avail','roll_lbs','n_keys','keys','index',
+                            'entries','versions','committed')):
     """
     A class for Inventory objects. Organizes Roll objects by their
     item and size. Includes methods for allocating rolls to ports.
+    Also keeps each greige style's rolls sorted by available date
+    and size, with ties in the order the rolls are iterated.
     """
     def __init__(self) -> None: ...
+    @property
+    def snapshot(self) -> Snapshot | None:
+        """The currently active inventory snapshot (if any)."""
+        ...
     @overload
     def __getitem__(self, key: tuple[()]) -> 'InvView': ...
     @overload
@@ -104,8 +116,110 @@ class Inventory(HasLogger, Grouped[str, GreigeStyle], attrs=('_logger','logger')
     def iterkeys(self) -> Generator[tuple[GreigeStyle, SizeClass, str]]: ...
     def itervalues(self) -> Generator[RollView]: ...
     def get(self, id: str) -> RollView: ...
-    def add(self, data: Roll) -> None: ...
-    def remove(self, dview: RollView, remkey: bool = False) -> Roll: ...
+    def add(self, data: Roll) -> None:
+        """
+        Add the provided roll to this object. The roll is linked to
+        the active snapshot, its pounds are added to the available
+        pounds of its greige style and it is placed in the sorted
+        index of its greige style.
+        """
+        ...
+    def remove(self, dview: RollView, remkey: bool = False) -> Roll:
+        """
+        Remove the viewed roll from this object, along with its pounds
+        from the available pounds of its greige style and its entry
+        in the sorted index.
+        """
+        ...
+    def update[R](self, dview: RollView, func: Callable[[Roll], R]) -> R:
+        """
+        Mutate the viewed roll in place by calling 'func' on it and
+        return the result. The roll is relinked to the active snapshot
+        and the available pounds and sorted index are updated as if it
+        had been removed and added again; it only moves between size
+        groups if its size changed.
+        """
+        ...
+    def _sorted_rolls(self, greige: GreigeStyle, max_date: dt.datetime | None = None) \
+        -> list[tuple[dt.datetime, int, int, RollView]]:
+        """
+        A copy of the sorted index of the given greige style, cut off
+        after the rolls available by 'max_date' (if provided).
+        """
+        ...
+    def version(self, greige: GreigeStyle) -> int:
+        """
+        A counter for the committed rolls of the given greige style. It
+        changes whenever a roll of the greige is added with a committed
+        weight that differs from the last one seen, but not when only
+        snapshot allocations change.
+        """
+        ...
+    def avail_lbs(self, greige: GreigeStyle) -> float:
+        """
+        The pounds of the given greige style available in inventory
+        under the active snapshot. Rolls are only changed outside of
+        the inventory, so this total is kept live by 'add' and 'remove'.
+        """
+        ...
+    def set_snapshot(self, snapshot: Snapshot | None) -> None:
+        """
+        Make the given snapshot (if any) the active one. Only the rolls
+        with allocations in the previous or the new snapshot are
+        updated, so switching snapshots does not depend on the size of
+        the inventory.
+        """
+        ...
+    def apply_snap(self, snapshot: Snapshot | None) -> None:
+        """
+        Permanently applies the allocations stored on the given
+        snapshot (if any) to the rolls they were taken from.
+        """
+        ...
+    def add_new_roll(self, greige: GreigeStyle, lbs: float,
+                     avail_date: dt.datetime) -> RollView:
+        """
+        Adds a placeholder roll for greige that is not in inventory yet
+        and returns a view of it. Placeholder ids are numbered by this
+        inventory in the order they are created, so copies of it mint
+        the same ids.
+
+            greige:
+              The greige style of the new roll.
+            lbs:
+              The weight of the new roll.
+            avail_date:
+              The date the new roll is expected to be available.
+        """
+        ...
+    def checkpoint(self) -> tuple[Snapshot | None, int, dict[tuple[GreigeStyle, SizeClass],
+                                                             dict[str, int]], int]:
+        """
+        Returns what 'rollback' needs to return this object to its
+        current state: the active snapshot, the number of placeholder
+        rolls created so far and the position of every roll among the
+        ties of its size group.
+        """
+        ...
+    def new_rolls(self, checkpoint: tuple[Snapshot | None, int,
+                                          dict[tuple[GreigeStyle, SizeClass], dict[str, int]],
+                                          int]) -> list[RollView]:
+        """
+        The placeholder rolls created since the checkpoint was taken,
+        in the order they were created.
+        """
+        ...
+    def rollback(self, checkpoint: tuple[Snapshot | None, int,
+                                         dict[tuple[GreigeStyle, SizeClass], dict[str, int]],
+                                         int]) -> None:
+        """
+        Undoes temporary work done since the checkpoint was taken.
+        Reactivates its snapshot, removes the placeholder rolls created
+        since (so the next one reuses the first removed id), and puts
+        every roll back in its old position among the ties of its size
+        group. Allocations committed since are not undone.
+        """
+        ...
     def get_starts(self, greige: GreigeStyle, jet_rng: FloatRange,
                    max_date: dt.datetime | None = None) -> Generator[RollView]:
         """
@@ -141,8 +255,8 @@ class Inventory(HasLogger, Grouped[str, GreigeStyle], attrs=('_logger','logger')
         """
         ...
     def get_comb_loads(self, greige: GreigeStyle, snapshot: Snapshot, prev_wts: list[float],
-                       jet_rng: FloatRange, max_date: dt.datetime | None = None) \
-                        -> Generator[PortLoad]:
+                       jet_rng: FloatRange, prev_plts: list[KnitPlant],
+                       max_date: dt.datetime | None = None) -> Generator[PortLoad]:
         """
         Generates port loads from combining partial rolls in inventory.
 
@@ -156,6 +270,16 @@ class Inventory(HasLogger, Grouped[str, GreigeStyle], attrs=('_logger','logger')
               ports.
             jet_rng:
               The range of allowed weights in each jet port.
+            prev_plts:
+              The list of knit plants used to load previous ports.
+            max_date:
+              The latest allowed availability date for a roll.
+
+        Partial rolls are filtered by plant and availability date and
+        sorted by weight, and each port takes the pair whose combined
+        weight is closest to the middle of the allowed range. If no
+        pair lands inside the range, the lightest pair above it is used
+        and its smaller roll is trimmed to fit.
 
         Returns a generator that will yield PortLoad objects resulting
         from allocating and combining partial rolls of the given greige
@@ -186,10 +310,24 @@ class Inventory(HasLogger, Grouped[str, GreigeStyle], attrs=('_logger','logger')
         ...
     def view(self) -> InvView: ...
 
-class InvView(GroupedView[str, GreigeStyle],
-              funcs=('get_starts','get_roll_loads','get_comb_loads','get_port_loads')):
+class InvView(GroupedView[str, GreigeStyle], attrs=('snapshot',),
+              funcs=('avail_lbs','get_starts','get_roll_loads','get_comb_loads',
+                     'get_port_loads')):
     """A class for views of Inventory objects."""
     def __init__(self, link: Inventory) -> None: ...
+    @property
+    def snapshot(self) -> Snapshot | None:
+        """The currently active inventory snapshot (if any)."""
+        ...
+    def version(self, greige: GreigeStyle) -> int:
+        """A counter for the committed rolls of the given greige style."""
+        ...
+    def avail_lbs(self, greige: GreigeStyle) -> float:
+        """
+        The pounds of the given greige style available in inventory
+        under the active snapshot.
+        """
+        ...
     @overload
     def __getitem__(self, key: tuple[()]) -> 'InvView': ...
     @overload
@@ -204,6 +342,7 @@ class InvView(GroupedView[str, GreigeStyle],
     def get(self, id: str) -> RollView: ...
     def add(self, data: Roll) -> None: ...
     def remove(self, dview: RollView, remkey: bool = False) -> Roll: ...
+    def update[R](self, dview: RollView, func: Callable[[Roll], R]) -> R: ...
     def get_starts(self, greige: GreigeStyle,
                    max_date: dt.datetime | None = None) -> Generator[RollView]:
         """
@@ -239,8 +378,8 @@ class InvView(GroupedView[str, GreigeStyle],
         """
         ...
     def get_comb_loads(self, greige: GreigeStyle, snapshot: Snapshot, prev_wts: list[float],
-                       jet_rng: FloatRange, max_date: dt.datetime | None = None) \
-                        -> Generator[PortLoad]:
+                       jet_rng: FloatRange, prev_plts: list[KnitPlant],
+                       max_date: dt.datetime | None = None) -> Generator[PortLoad]:
         """
         Generates port loads from combining partial rolls in inventory.
 
@@ -254,6 +393,16 @@ class InvView(GroupedView[str, GreigeStyle],
               ports.
             jet_rng:
               The range of allowed weights in each jet port.
+            prev_plts:
+              The list of knit plants used to load previous ports.
+            max_date:
+              The latest allowed availability date for a roll.
+
+        Partial rolls are filtered by plant and availability date and
+        sorted by weight, and each port takes the pair whose combined
+        weight is closest to the middle of the allowed range. If no
+        pair lands inside the range, the lightest pair above it is used
+        and its smaller roll is trimmed to fit.
 
         Returns a generator that will yield PortLoad objects resulting
         from allocating and combining partial rolls of the given greige
@@ -1,9 +1,10 @@
 #!/usr/bin/env python
 
 from typing import NamedTuple
+from bisect import bisect_left, bisect_right, insort
 import datetime as dt
 
-from app.support import FloatRange, min_float_rng
+from app.support import FloatRange, ExactSum, min_float_rng, setter_like
 from app.support.grouped import Atom, Grouped, GroupedView
 from app.support.logging import Logger, HasLogger, FailedYield, logged_generator
 from app.style import greige as grg_mod, GreigeStyle
@@ -11,6 +12,29 @@ from ..roll import Roll, RollView, RollAlloc, SizeClass, LARGE, NORMAL, SMALL, H
     PARTIAL, KnitPlant, ANY
 from .snapshot import Snapshot
 
+_SIZE_RANKS = {
+    NORMAL: 0, HALF: 1, LARGE: 2, SMALL: 3, PARTIAL: 4
+}
+
+def _best_partial_pair(rviews: list[RollView], wt_rng: FloatRange):
+    wts = [rview.lbs for rview in rviews]
+    target = wt_rng.average()
+    best, best_key = None, None
+    for i, wt in enumerate(wts):
+        j = bisect_left(wts, target - wt, lo=i+1)
+        for k in (j-1, j):
+            if k <= i or k >= len(wts): continue
+            total = wt + wts[k]
+            if wt_rng.contains(total):
+                key = (0, abs(total - target))
+            elif wt_rng.is_below(total):
+                key = (1, total)
+            else:
+                continue
+            if best_key is None or key < best_key:
+                best, best_key = (rviews[i], rviews[k]), key
+    return best
+
 def rloads_args(slf, rview, snapshot, prev_wts, jet_rng, prev_plts):
     return {
         'desc1': f'Allocating pieces of roll {rview.id} to ports',
@@ -74,9 +98,9 @@ class StyleGroup(Grouped[str, SizeClass]):
 class StyleView(GroupedView[str, SizeClass]):
     pass
 
-_CTR = 0
-
-class Inventory(HasLogger, Grouped[str, GreigeStyle], attrs=('_logger','logger')):
+class Inventory(HasLogger, Grouped[str, GreigeStyle], attrs=('_logger','logger','snapshot'),
+                priv_attrs=('snapshot','n_new','avail','roll_lbs','n_keys','keys','index',
+                            'entries','versions','committed')):
 
     _logger = Logger()
 
@@ -86,31 +110,177 @@ class Inventory(HasLogger, Grouped[str, GreigeStyle], attrs=('_logger','logger')
     
     def __init__(self):
         Grouped.__init__(self, InvView(self), 'item', 'size', 'id')
+        self.__snapshot = None
+        self.__n_new = 0
+        self.__avail: dict[GreigeStyle, ExactSum] = {}
+        self.__roll_lbs: dict[str, float] = {}
+        self.__n_keys = 0
+        self.__keys: dict[tuple[GreigeStyle, SizeClass], dict[str, int]] = {}
+        self.__index: dict[GreigeStyle, list[tuple[dt.datetime, int, int, RollView]]] = {}
+        self.__entries: dict[str, tuple[dt.datetime, int, int, RollView]] = {}
+        self.__versions: dict[GreigeStyle, int] = {}
+        self.__committed: dict[str, float] = {}
 
     @property
     def logger(self):
         return type(self)._logger
+    
+    @property
+    def snapshot(self):
+        return self.__snapshot
 
     def make_group(self, data, **kwargs):
         return StyleGroup(item=data.item)
     
+    def _track(self, rview: RollView, prev_entry = None):
+        if rview.item not in self.__avail:
+            self.__avail[rview.item] = ExactSum()
+        self.__avail[rview.item].add(rview.lbs)
+        self.__roll_lbs[rview.id] = rview.lbs
+
+        committed = rview.lbs
+        if rview.snapshot is not None:
+            committed += rview.snapshot.lbs_used(rview.id)
+        committed = round(committed, 6)
+        if self.__committed.get(rview.id) != committed:
+            self.__committed[rview.id] = committed
+            self.__versions[rview.item] = self.__versions.get(rview.item, 0) + 1
+
+        grp_key = (rview.item, rview.size)
+        if grp_key not in self.__keys:
+            self.__keys[grp_key] = {}
+        if rview.id not in self.__keys[grp_key]:
+            self.__n_keys += 1
+            self.__keys[grp_key][rview.id] = self.__n_keys
+        
+        if rview.item not in self.__index:
+            self.__index[rview.item] = []
+        entry = (rview.avail_date, _SIZE_RANKS[rview.size], self.__keys[grp_key][rview.id],
+                 rview.view())
+        if entry == prev_entry:
+            return
+        
+        index = self.__index[rview.item]
+        if prev_entry is not None:
+            del index[bisect_left(index, prev_entry)]
+        self.__entries[rview.id] = entry
+        insort(index, entry)
+
+    @setter_like
+    def add(self, data: Roll):
+        data.snapshot = self.__snapshot
+        Grouped.add(self, data)
+        self._track(data)
+    
+    @setter_like
+    def update(self, dview: RollView, func):
+        def apply(roll: Roll):
+            ret = func(roll)
+            roll.snapshot = self.__snapshot
+            return ret
+        
+        entry = self.__entries[dview.id]
+        self.__avail[dview.item].sub(self.__roll_lbs.pop(dview.id))
+        try:
+            return Grouped.update(self, dview, apply)
+        finally:
+            self._track(self.get(dview.id), entry)
+    
+    @setter_like
+    def remove(self, dview: RollView, remkey = False):
+        ret: Roll = Grouped.remove(self, dview, remkey=remkey)
+        self.__avail[ret.item].sub(self.__roll_lbs.pop(ret.id))
+
+        entry = self.__entries.pop(ret.id)
+        index = self.__index[ret.item]
+        del index[bisect_left(index, entry)]
+
+        if remkey:
+            size = ret.size
+            if ret.item not in self:
+                for grp_key in list(self.__keys):
+                    if grp_key[0] == ret.item:
+                        del self.__keys[grp_key]
+            elif size not in self[ret.item]:
+                del self.__keys[ret.item, size]
+            else:
+                del self.__keys[ret.item, size][ret.id]
+        return ret
+    
+    def _sorted_rolls(self, greige: GreigeStyle, max_date = None):
+        index = self.__index.get(greige, [])
+        if max_date is None:
+            return index[:]
+        return index[:bisect_right(index, max_date, key=lambda e: e[0])]
+    
+    def version(self, greige: GreigeStyle):
+        return self.__versions.get(greige, 0)
+    
+    def avail_lbs(self, greige: GreigeStyle):
+        if greige not in self.__avail:
+            return 0
+        return self.__avail[greige].value
+    
+    @setter_like
+    def set_snapshot(self, snapshot: Snapshot | None):
+        prev: Snapshot | None = self.__snapshot
+        self.__snapshot = snapshot
+
+        touched: dict[str, None] = {}
+        if prev is not None:
+            touched.update(dict.fromkeys(prev.roll_ids))
+        if snapshot is not None:
+            touched.update(dict.fromkeys(snapshot.roll_ids))
+        
+        for roll_id in touched:
+            self.update(self.get(roll_id), lambda r: None)
+    
+    @setter_like
+    def apply_snap(self, snapshot: Snapshot | None):
+        if snapshot is None:
+            return
+        for roll_id in snapshot.roll_ids:
+            self.update(self.get(roll_id), lambda r: r.apply_snap(snapshot))
+    
+    @setter_like
+    def add_new_roll(self, greige: GreigeStyle, lbs: float, avail_date: dt.datetime):
+        self.__n_new += 1
+        newroll = Roll(f'NEW{self.__n_new:06}', greige, lbs, avail_date, ANY)
+        self.add(newroll)
+        return newroll.view()
+    
+    def checkpoint(self):
+        keys = {grp_key: dict(ids) for grp_key, ids in self.__keys.items()}
+        return self.__snapshot, self.__n_new, keys, self.__n_keys
+    
+    def new_rolls(self, checkpoint):
+        return [self.get(f'NEW{n:06}') for n in range(checkpoint[1] + 1, self.__n_new + 1)]
+    
+    @setter_like
+    def rollback(self, checkpoint):
+        snapshot, n_new, keys, n_keys = checkpoint
+        self.set_snapshot(snapshot)
+        while self.__n_new > n_new:
+            roll: Roll = self.remove(self.get(f'NEW{self.__n_new:06}'), remkey=True)
+            del self.__committed[roll.id]
+            self.__versions[roll.item] += 1
+            self.__n_new -= 1
+        
+        self.__keys = keys
+        self.__n_keys = n_keys
+        for roll_id, entry in list(self.__entries.items()):
+            rview: RollView = entry[3]
+            if keys.get((rview.item, rview.size), {}).get(roll_id) != entry[2]:
+                self.update(rview, lambda r: None)
+    
     def get_starts(self, greige: GreigeStyle, jet_rng: FloatRange, max_date = None):
         if greige not in self:
             return
-        
-        sizes = {
-            NORMAL: 0, HALF: 1, LARGE: 2, SMALL: 3, PARTIAL: 4
-        }
-
-        views: list[RollView] = list(self[greige].itervalues())
-        views = sorted(views, key=lambda r: (r.avail_date, sizes[r.size]))
 
-        for rview in views:
+        for _, _, _, rview in self._sorted_rolls(greige, max_date):
             wt_fact = 2
             if rview.size == HALF:
                 wt_fact = 1
-            if max_date is not None and rview.avail_date > max_date:
-                continue
             if jet_rng.contains(rview.lbs / wt_fact):
                 yield rview
     
@@ -143,10 +313,8 @@ class Inventory(HasLogger, Grouped[str, GreigeStyle], attrs=('_logger','logger')
         while rview.lbs + 1 >= port_wt:
             cur_wt = min(rview.lbs, port_wt)
             prev_wts.append(cur_wt)
-            roll: Roll = self.remove(rview)
-            piece = roll.allocate(cur_wt, snapshot=snapshot)
-            self.add(roll)
-            prev_plts.append(roll.plant)
+            piece = self.update(rview, lambda r: r.allocate(cur_wt, snapshot=snapshot))
+            prev_plts.append(rview.plant)
             yield PortLoad(piece, None, cur_wt, piece.avail_date)
     
     @logged_generator(comb_args, comb_yld)
@@ -156,52 +324,36 @@ class Inventory(HasLogger, Grouped[str, GreigeStyle], attrs=('_logger','logger')
             yield FailedYield(desc1=f'No partial rolls of {greige}')
             return
         
-        for id1 in self[greige, PARTIAL]:
-            for id2 in self[greige, PARTIAL]:
-                rview1: RollView = self[greige, PARTIAL, id1]
-                rview2: RollView = self[greige, PARTIAL, id2]
-                if rview1 == rview2: continue
-                if rview1.lbs < 50 or rview2.lbs < 50: continue
-                if max_date is not None and (rview1.avail_date > max_date or \
-                    rview2.avail_date > max_date): continue
-                if prev_plts and (rview1.plant not in prev_plts + [ANY] or \
-                    rview2.plant not in prev_plts + [ANY]): continue
-
-                if not prev_wts:
-                    wt_rng = jet_rng
-                else:
-                    wt_rng = FloatRange(max(prev_wts)-20, min(prev_wts)+20)
-                
-                if wt_rng.is_below(rview1.lbs) or wt_rng.is_below(rview2.lbs): continue
-
-                roll1: Roll = self.remove(rview1)
-                roll2: Roll = self.remove(rview2)
-                piece1, piece2 = None, None
-                if wt_rng.contains(roll1.lbs + roll2.lbs):
-                    piece1 = roll1.allocate(roll1.lbs, snapshot=snapshot)
-                    piece2 = roll2.allocate(roll2.lbs, snapshot=snapshot)
-                elif wt_rng.is_below(roll1.lbs + roll2.lbs):
-                    wt1, wt2 = roll1.lbs, roll2.lbs
-                    if roll1.lbs > roll2.lbs:
-                        wt2 = wt_rng.maxval - roll1.lbs - 1
-                    else:
-                        wt1 = wt_rng.maxval - roll2.lbs - 1
-                    
-                    piece1 = roll1.allocate(wt1, snapshot=snapshot)
-                    piece2 = roll2.allocate(wt2, snapshot=snapshot)
-
-                self.add(roll1)
-                self.add(roll2)
-                if piece1 and piece2:
-                    pload = PortLoad(piece1, piece2, piece1.lbs + piece2.lbs,
-                                     max(piece1.avail_date, piece2.avail_date))
-                    prev_wts.append(pload.lbs)
-                    prev_plts.append(roll1.plant)
-                    yield pload
-                else:
-                    yield FailedYield(desc1=f'Combined rolls too small',
-                                      desc2=f'roll1={roll1}, roll2={roll2}',
-                                      desc3=f'range=({wt_rng.minval:.2f} lbs to {wt_rng.maxval:.2f})')
+        partials = [e[3] for e in self._sorted_rolls(greige, max_date)
+                    if e[1] == _SIZE_RANKS[PARTIAL]]
+        while True:
+            if not prev_wts:
+                wt_rng = jet_rng
+            else:
+                wt_rng = FloatRange(max(prev_wts)-20, min(prev_wts)+20)
+            plts = prev_plts + [ANY]
+
+            rviews = sorted(filter(lambda r: r.lbs >= 50 and not wt_rng.is_below(r.lbs) and \
+                                   (not prev_plts or r.plant in plts), partials),
+                            key=lambda r: r.lbs)
+            pair = _best_partial_pair(rviews, wt_rng)
+            if pair is None:
+                yield FailedYield(desc1=f'No pair of partial rolls fits the port range',
+                                  desc2=f'{len(rviews)} candidate rolls',
+                                  desc3=f'range=({wt_rng.minval:.2f} lbs to {wt_rng.maxval:.2f})')
+                return
+
+            wt1, wt2 = pair[0].lbs, pair[1].lbs
+            if wt_rng.is_below(wt1 + wt2):
+                wt1 = wt_rng.maxval - wt2 - 1
+            piece1 = self.update(pair[0], lambda r: r.allocate(wt1, snapshot=snapshot))
+            piece2 = self.update(pair[1], lambda r: r.allocate(wt2, snapshot=snapshot))
+
+            pload = PortLoad(piece1, piece2, piece1.lbs + piece2.lbs,
+                             max(piece1.avail_date, piece2.avail_date))
+            prev_wts.append(pload.lbs)
+            prev_plts.append(pair[0].plant)
+            yield pload
     
     @logged_generator(ploads_args, ploads_yld)
     def get_port_loads(self, greige: GreigeStyle, snapshot: Snapshot, jet_rng: FloatRange,
@@ -215,15 +367,7 @@ class Inventory(HasLogger, Grouped[str, GreigeStyle], attrs=('_logger','logger')
         if start:
             yield from self.get_roll_loads(start, snapshot, prev_wts, jet_rng, prev_plts)
 
-        sizes = {
-            NORMAL: 0, HALF: 1, LARGE: 2, SMALL: 3, PARTIAL: 4
-        }
-
-        views: list[RollView] = list(self[greige].itervalues())
-        views = sorted(views, key=lambda r: (r.avail_date, sizes[r.size]))
-
-        for rview in views:
-            if max_date is not None and rview.avail_date > max_date: continue
+        for _, _, _, rview in self._sorted_rolls(greige, max_date):
             if rview.size == PARTIAL: continue
             yield from self.get_roll_loads(rview, snapshot, prev_wts, jet_rng,
                                            prev_plts)
@@ -233,7 +377,6 @@ class Inventory(HasLogger, Grouped[str, GreigeStyle], attrs=('_logger','logger')
         
         if max_date is not None and create:
             for _ in range(8):
-                globals()['_CTR'] += 1
                 if prev_wts:
                     wt_rng = FloatRange(max(prev_wts)-20, min(prev_wts)+20)
                 else:
@@ -244,13 +387,11 @@ class Inventory(HasLogger, Grouped[str, GreigeStyle], attrs=('_logger','logger')
                 if 'ANMUT' in greige.id:
                     wt = wt_rng.average()
 
-                newroll = Roll(f'NEW{globals()['_CTR']:06}', greige, wt, max_date,
-                               ANY)
-                newroll.snapshot = snapshot
-                self.add(newroll)
-                yield from self.get_roll_loads(newroll.view(), snapshot, prev_wts, jet_rng,
+                newroll = self.add_new_roll(greige, wt, max_date)
+                yield from self.get_roll_loads(newroll, snapshot, prev_wts, jet_rng,
                                                prev_plts)
 
-class InvView(GroupedView[str, GreigeStyle],
-              funcs=('get_starts','get_roll_loads','get_comb_loads','get_port_loads')):
+class InvView(GroupedView[str, GreigeStyle], attrs=('snapshot',),
+              funcs=('version','avail_lbs','get_starts','get_roll_loads','get_comb_loads',
+                     'get_port_loads')):
     pass
\ No newline at end of file
@@ -1,12 +1,53 @@
+from typing import Protocol
 from app.support import HasID, SuperImmut
+from app.materials.roll import RollAlloc
 
-class Snapshot(HasID[int], SuperImmut, attrs=('_prefix','id'), priv_attrs=('id',),
-               frozen=('*id',)):
+class _Lot(Protocol):
+    def release(self) -> None: ...
+
+class Snapshot(HasID[int], SuperImmut, attrs=('_prefix','id','roll_ids','lots'),
+               priv_attrs=('id','allocs','lots'), frozen=('*id','*allocs','*lots')):
     """
     A class for uniquely identifying snapshots of inventory positions.
     Allows you to compare many different versions of the inventory
-    without copying it over each time.
+    without copying it over each time. Each snapshot owns the temporary
+    allocations made within it, so only the rolls it touches differ
+    from the committed inventory. It also holds the tentative dyelots
+    built from those allocations, which are released along with the
+    snapshot if it is discarded.
     """
     def __init__(self) -> None:
         """Initialize a new Snapshot object."""
+        ...
+    @property
+    def roll_ids(self) -> tuple[str, ...]:
+        """The ids of the rolls with temporary allocations in this snapshot."""
+        ...
+    @property
+    def lots(self) -> tuple[_Lot, ...]:
+        """The tentative dyelots built on this snapshot."""
+        ...
+    def lbs_used(self, roll_id: str) -> float:
+        """The pounds of the given roll allocated within this snapshot."""
+        ...
+    def add_piece(self, piece: RollAlloc) -> None:
+        """Record a temporary allocation in this snapshot."""
+        ...
+    def remove_piece(self, piece: RollAlloc) -> None:
+        """Remove a temporary allocation from this snapshot."""
+        ...
+    def pop_pieces(self, roll_id: str) -> tuple[RollAlloc, ...]:
+        """
+        Remove and return all the temporary allocations of the given
+        roll in this snapshot, in the order they were made.
+        """
+        ...
+    def add_lot(self, lot: _Lot) -> None:
+        """Record a tentative dyelot built on this snapshot."""
+        ...
+    def release_lots(self) -> tuple[_Lot, ...]:
+        """
+        Release all the tentative dyelots built on this snapshot.
+        Returns the released dyelots.
+        """
         ...
\ No newline at end of file
@@ -4,12 +4,12 @@ from app.support import HasID, SuperImmut
 
 _CTR = 0
 
-class Snapshot(HasID[int], SuperImmut, attrs=('_prefix','id'), priv_attrs=('id',),
-               frozen=('*id',)):
+class Snapshot(HasID[int], SuperImmut, attrs=('_prefix','id','roll_ids','lots'),
+               priv_attrs=('id','allocs','lots'), frozen=('*id','*allocs','*lots')):
     
     def __init__(self):
         globals()['_CTR'] += 1
-        SuperImmut.__init__(self, priv={'id': globals()['_CTR']})
+        SuperImmut.__init__(self, priv={'id': globals()['_CTR'], 'allocs': {}, 'lots': {}})
 
     @property
     def _prefix(self):
@@ -17,4 +17,43 @@ class Snapshot(HasID[int], SuperImmut, attrs=('_prefix','id'), priv_attrs=('id',
     
     @property
     def id(self):
-        return self.__id
\ No newline at end of file
+        return self.__id
+    
+    @property
+    def roll_ids(self):
+        return tuple(self.__allocs.keys())
+    
+    @property
+    def lots(self):
+        return tuple(self.__lots.keys())
+    
+    def lbs_used(self, roll_id):
+        if roll_id not in self.__allocs:
+            return 0
+        return sum(map(lambda p: p.lbs, self.__allocs[roll_id]))
+    
+    def add_piece(self, piece):
+        if piece.roll_id not in self.__allocs:
+            self.__allocs[piece.roll_id] = {}
+        self.__allocs[piece.roll_id][piece] = None
+    
+    def remove_piece(self, piece):
+        pieces: dict = self.__allocs[piece.roll_id]
+        del pieces[piece]
+        if not pieces:
+            del self.__allocs[piece.roll_id]
+    
+    def pop_pieces(self, roll_id):
+        if roll_id not in self.__allocs:
+            return tuple()
+        return tuple(self.__allocs.pop(roll_id))
+    
+    def add_lot(self, lot):
+        self.__lots[lot] = None
+    
+    def release_lots(self):
+        lots = tuple(self.__lots.keys())
+        self.__lots.clear()
+        for lot in lots:
+            lot.release()
+        return lots
\ No newline at end of file
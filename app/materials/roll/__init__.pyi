@@ -25,15 +25,17 @@ class Roll(HasLogger, Data[str],
            mod_in_group=False,
            attrs=('_logger','logger','item','size','lbs','avail_date','snapshot',
                   'init_wt','plant'),
-           priv_attrs=('cur_wt','allocs','temp_allocs'),
+           priv_attrs=('cur_wt','allocs','cache'),
            frozen=('init_wt','item','avail_date','plant')):
     """
-    A class for Roll objects.
+    A class for Roll objects. Rolls cannot change while they are in
+    a group, so their weight and size are computed once when they are
+    added and read from a cache until they are removed.
     """
     item: GreigeStyle
     init_wt: float
     avail_date: dt.datetime
-    snapshot: Snapshot | None # The currently active inventory "snapshot"
+    snapshot: Snapshot | None # The inventory "snapshot" this roll's weight reflects
     plant: KnitPlant
     def __init__(self, id: str, item: GreigeStyle, lbs: float,
                  avail_date: dt.datetime, plant: KnitPlant) -> None:
@@ -48,6 +50,9 @@ class Roll(HasLogger, Data[str],
               The weight of this roll.
         """
         ...
+    def _set_in_group(self, in_group: bool) -> None:
+        """Mark this roll as in or out of a group, filling or clearing the cache."""
+        ...
     @property
     def lbs(self) -> float:
         """The current weight of this roll."""
@@ -65,9 +70,9 @@ class Roll(HasLogger, Data[str],
             snapshot: (default None)
               The Snapshot object (if any) to link the allocation to.
               If this is provided, the allocation is treated as a temporary
-              usage applied within one inventory "snapshot". If this snapshot
-              is not active, the roll will behave as though any linked
-              allocations did not occur.
+              usage applied within one inventory "snapshot" and is stored on
+              that snapshot. If this snapshot is not active, the roll will
+              behave as though any linked allocations did not occur.
         
         Returns the RollAlloc object representing the used portion.
         """
@@ -80,8 +85,8 @@ class Roll(HasLogger, Data[str],
         ...
     def apply_snap(self, snapshot: Snapshot | None = None) -> None:
         """
-        Applies the given snapshot (if any) permanently). Removes all stored
-        snapshots for garbage collection.
+        Applies the given snapshot's allocations of this roll (if any)
+        permanently. The applied allocations are removed from the snapshot.
         """
         ...
     def view(self) -> RollView: ...
@@ -93,7 +98,7 @@ class RollView(DataView[str], attrs=('item','size','lbs','avail_date','snapshot'
     item: GreigeStyle
     init_wt: float
     avail_date: dt.datetime
-    snapshot: Snapshot | None # The currently active inventory "snapshot"
+    snapshot: Snapshot | None # The inventory "snapshot" this roll's weight reflects
     plant: KnitPlant
     def __init__(self, link: Roll) -> None: ...
     @property
@@ -113,9 +118,9 @@ class RollView(DataView[str], attrs=('item','size','lbs','avail_date','snapshot'
             snapshot: (default None)
               The Snapshot object (if any) to link the allocation to.
               If this is provided, the allocation is treated as a temporary
-              usage applied within one inventory "snapshot". If this snapshot
-              is not active, the roll will behave as though any linked
-              allocations did not occur.
+              usage applied within one inventory "snapshot" and is stored on
+              that snapshot. If this snapshot is not active, the roll will
+              behave as though any linked allocations did not occur.
         
         Returns the RollAlloc object representing the used portion.
         """
@@ -128,7 +133,7 @@ class RollView(DataView[str], attrs=('item','size','lbs','avail_date','snapshot'
         ...
     def apply_snap(self, snapshot: Snapshot | None = None) -> None:
         """
-        Applies the given snapshot (if any) permanently). Removes all stored
-        snapshots for garbage collection.
+        Applies the given snapshot's allocations of this roll (if any)
+        permanently. The applied allocations are removed from the snapshot.
         """
         ...
\ No newline at end of file
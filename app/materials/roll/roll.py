@@ -69,7 +69,7 @@ class RollAlloc(HasID[int], SuperImmut,
 class Roll(HasLogger, Data[str], mod_in_group=False,
            attrs=('_logger','logger','item','size','init_wt','lbs','avail_date',
                   'snapshot','plant'),
-           priv_attrs=('cur_wt','allocs','temp_allocs'),
+           priv_attrs=('cur_wt','allocs','cache'),
            frozen=('item','init_wt','avail_date','plant')):
     
     _logger = Logger()
@@ -80,7 +80,7 @@ class Roll(HasLogger, Data[str], mod_in_group=False,
 
     def __init__(self, id, item, lbs, avail_date, plant):
         Data.__init__(self, id, 'Roll', RollView(self),
-                      priv={'cur_wt': lbs, 'allocs': set(), 'temp_allocs': {}},
+                      priv={'cur_wt': lbs, 'allocs': set(), 'cache': None},
                       init_wt=lbs, item=item, avail_date=avail_date, snapshot=None,
                       plant=plant)
 
@@ -91,14 +91,24 @@ class Roll(HasLogger, Data[str], mod_in_group=False,
     def logger(self):
         return type(self)._logger
 
+    def _set_in_group(self, in_group):
+        super(SuperImmut, self).__setattr__('_Roll__cache', None)
+        if in_group:
+            super(SuperImmut, self).__setattr__('_Roll__cache', (self.lbs, self.size))
+        Data._set_in_group(self, in_group)
+
     @property
     def lbs(self):
-        if self.snapshot is None or self.snapshot not in self.__temp_allocs:
+        if self.__cache is not None:
+            return self.__cache[0]
+        if self.snapshot is None:
             return self.__cur_wt
-        return self.__cur_wt - sum(map(lambda p: p.lbs, self.__temp_allocs[self.snapshot]))
+        return self.__cur_wt - self.snapshot.lbs_used(self.id)
     
     @property
     def size(self):
+        if self.__cache is not None:
+            return self.__cache[1]
         grg: GreigeStyle = self.item
         if grg.port_rng.is_above(self.lbs):
             return PARTIAL
@@ -120,12 +130,10 @@ class Roll(HasLogger, Data[str], mod_in_group=False,
             self.__allocs.add(ret)
             self.__cur_wt -= lbs
         else:
-            if snapshot not in self.__temp_allocs:
-                self.__temp_allocs[snapshot] = set()
-            temp_lbs = self.__cur_wt - sum(map(lambda p: p.lbs, self.__temp_allocs[snapshot]))
+            temp_lbs = self.__cur_wt - snapshot.lbs_used(self.id)
             if temp_lbs + 1 < lbs:
                 raise ValueError(f'{lbs:.2f} lbs exceeds remaining weight in roll ({temp_lbs:.2f})')
-            self.__temp_allocs[snapshot].add(ret)
+            snapshot.add_piece(ret)
         return ret
     
     @setter_like
@@ -135,16 +143,15 @@ class Roll(HasLogger, Data[str], mod_in_group=False,
             self.__allocs.remove(piece)
             self.__cur_wt += piece.lbs
         else:
-            self.__temp_allocs[snapshot].remove(piece)
+            snapshot.remove_piece(piece)
 
     @setter_like
     def apply_snap(self, snapshot = None):
-        if snapshot and snapshot in self.__temp_allocs:
-            for item in self.__temp_allocs[snapshot]:
-                self.__allocs.add(item)
-                self.__cur_wt -= item.lbs
-        
-        self.__temp_allocs.clear()
+        if snapshot is None:
+            return
+        for item in snapshot.pop_pieces(self.id):
+            self.__allocs.add(item)
+            self.__cur_wt -= item.lbs
 
 class RollView(DataView[str], attrs=('item','size','lbs','avail_date','snapshot',
                                      'init_wt','plant'),
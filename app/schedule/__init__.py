@@ -2,9 +2,9 @@
 
 from . import jet
 from .dyelot import DyeLot, DyeLotView
-from .jet import Job, JetSched, Jet
+from .jet import Job, JetSched, JobPlan, SchedProbe, Jet
 from .demand import *
 
-__all__ = ['DyeLot', 'DyeLotView', 'Job', 'JetSched', 'Order', 'OrderView', 'Req',
-           'ColorGroup', 'ColorView', 'GreigeGroup', 'GreigeView', 'DateGroup',
+__all__ = ['DyeLot', 'DyeLotView', 'Job', 'JetSched', 'JobPlan', 'SchedProbe', 'Order',
+           'OrderView', 'Req', 'ColorGroup', 'ColorView', 'GreigeGroup', 'GreigeView', 'DateGroup',
            'DateView', 'Demand', 'DemandView', 'Jet', 'jet']
\ No newline at end of file
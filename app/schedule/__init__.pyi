@@ -1,6 +1,7 @@
 from app.schedule import jet as jet
 from app.schedule.dyelot import DyeLot as DyeLot, DyeLotView as DyeLotView
-from app.schedule.jet import Job as Job, JetSched as JetSched, Jet as Jet
+from app.schedule.jet import Job as Job, JetSched as JetSched, JobPlan as JobPlan, \
+    SchedProbe as SchedProbe, Jet as Jet
 from app.schedule.demand import Order as Order, OrderView as OrderView, Req as Req, \
     ColorGroup as ColorGroup, ColorView as ColorView, GreigeGroup as GreigeGroup, \
     GreigeView as GreigeView, DateGroup as DateGroup, DateView as DateView, Demand as Demand, \
@@ -115,10 +115,17 @@ class DateView(GroupedView[str, GreigeStyle]):
     def add(self, data: Order) -> None: ...
     def remove(self, dview: OrderView, remkey: bool = False) -> Order: ...
 
-class Demand(HasLogger, Grouped[str, dt.datetime], attrs=('_logger','logger')):
+class Demand(HasLogger, Grouped[str, dt.datetime], attrs=('_logger','logger'),
+             priv_attrs=('grg_orders','needed','dirty','last_dues','pnum_dates','pairs','seqs',
+                         'n_seq','stale','n_listened')):
     """
     A class for Demand objects. Organizes Order objects by
-    their due date, greige style, and color.
+    their due date, greige style, and color. Also keeps a
+    per-greige ledger of the remaining pounds needed by due
+    date, refreshed whenever an order is added or removed or
+    the production of its requirement changes, and an index
+    of the orders for each greige style and color in due
+    date order, along with their remaining pounds.
     """
     def __init__(self) -> None: ...
     @overload
@@ -135,18 +142,60 @@ class Demand(HasLogger, Grouped[str, dt.datetime], attrs=('_logger','logger')):
     def iterkeys(self) -> Generator[tuple[dt.datetime, GreigeStyle, Color, str]]: ...
     def itervalues(self) -> Generator[OrderView]: ...
     def get(self, id: str) -> OrderView: ...
-    def add(self, data: Order) -> None: ...
-    def remove(self, dview: OrderView, remkey: bool = False) -> Order: ...
+    def add(self, data: Order) -> None:
+        """
+        Add the provided order to this object. The first order of a
+        requirement registers this object as a listener on it.
+        """
+        ...
+    def remove(self, dview: OrderView, remkey: bool = False) -> Order:
+        """
+        Remove the viewed order from this object. Removing the last
+        order of a requirement deregisters this object from it.
+        """
+        ...
+    def _prod_changed(self, req: Req) -> None:
+        """
+        Marks the greige style and color of the requirement as
+        needing a refresh.
+        """
+        ...
     def get_matches(self, order: Order) -> Generator[OrderView]:
         """
-        Generate views of the orders that match this one on
-        color and greige style and can be combined with this
-        order on one jet.
+        Generate views of the orders that match this one on color
+        and greige style and can be combined with this order on one
+        jet, in due date order. The orders stay in this object.
+        """
+        ...
+    def needed_greige(self) -> Generator[GreigeStyle]:
+        """Generate the greige styles that still have pounds needed."""
+        ...
+    def needed_lbs(self, greige: GreigeStyle) -> list[tuple[dt.datetime, float]]:
+        """
+        Returns pairs of due dates and the total remaining pounds
+        of the greige style needed by the orders due then, sorted
+        by due date. Only orders with pounds remaining count.
+        """
+        ...
+    def last_due_date(self, pnum: int) -> dt.datetime | None:
+        """
+        Returns the due date of the last order with the given
+        priority number, or None if there is no such order. Only
+        recomputed when a due date of that priority number is
+        added or removed.
+        """
+        ...
+    def get_order(self, id: str) -> Order:
+        """
+        Returns the order with the given id itself, for callers
+        that need to assign lots to it. Raises a ValueError if
+        this object does not contain such an order.
         """
         ...
     def view(self) -> DemandView: ...
 
-class DemandView(GroupedView[str, dt.datetime]):
+class DemandView(GroupedView[str, dt.datetime],
+                 funcs=('needed_greige','needed_lbs','last_due_date')):
     """
     A class for views of Demand objects.
     """
@@ -173,4 +222,20 @@ class DemandView(GroupedView[str, dt.datetime]):
         color and greige style and can be combined with this
         order on one jet.
         """
+        ...
+    def needed_greige(self) -> Generator[GreigeStyle]:
+        """Generate the greige styles that still have pounds needed."""
+        ...
+    def needed_lbs(self, greige: GreigeStyle) -> list[tuple[dt.datetime, float]]:
+        """
+        Returns pairs of due dates and the total remaining pounds
+        of the greige style needed by the orders due then, sorted
+        by due date. Only orders with pounds remaining count.
+        """
+        ...
+    def last_due_date(self, pnum: int) -> dt.datetime | None:
+        """
+        Returns the due date of the last order with the given
+        priority number, or None if there is no such order.
+        """
         ...
\ No newline at end of file
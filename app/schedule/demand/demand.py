@@ -1,10 +1,13 @@
 #!/usr/bin/env python
 
+from bisect import bisect_left, insort
 import datetime as dt
+import math
 
+from app.support import setter_like
 from app.support.grouped import Grouped, GroupedView, Atom
 from app.support.logging import HasLogger, Logger, ProcessDesc, FailedYield, logged_generator
-from app.style import Color, GreigeStyle
+from app.style import Color, GreigeStyle, FabricStyle
 from .order import Order, OrderView
 
 def matches_args(slf, order: Order) -> ProcessDesc:
@@ -51,7 +54,9 @@ class DateGroup(Grouped[str, GreigeStyle]):
 class DateView(GroupedView[str, GreigeStyle]):
     pass
 
-class Demand(HasLogger, Grouped[str, dt.datetime], attrs=('_logger','logger')):
+class Demand(HasLogger, Grouped[str, dt.datetime], attrs=('_logger','logger'),
+             priv_attrs=('grg_orders','needed','dirty','last_dues','pnum_dates','pairs','seqs',
+                         'n_seq','stale','n_listened')):
 
     _logger = Logger()
 
@@ -61,6 +66,16 @@ class Demand(HasLogger, Grouped[str, dt.datetime], attrs=('_logger','logger')):
 
     def __init__(self):
         Grouped.__init__(self, DemandView(self), 'due_date', 'greige', 'color', 'id')
+        self.__grg_orders: dict[GreigeStyle, dict[str, Order]] = {}
+        self.__needed: dict[GreigeStyle, list[tuple[dt.datetime, float]]] = {}
+        self.__dirty: set[GreigeStyle] = set()
+        self.__last_dues: dict[int, dt.datetime | None] = {}
+        self.__pnum_dates: dict[int, dict[dt.datetime, int]] = {}
+        self.__pairs: dict[tuple[GreigeStyle, Color], list[list]] = {}
+        self.__seqs: dict[tuple[dt.datetime, GreigeStyle, Color], dict[str, int]] = {}
+        self.__n_seq = 0
+        self.__stale: set[tuple[GreigeStyle, Color]] = set()
+        self.__n_listened: dict[FabricStyle, int] = {}
 
     @property
     def logger(self):
@@ -69,25 +84,114 @@ class Demand(HasLogger, Grouped[str, dt.datetime], attrs=('_logger','logger')):
     def make_group(self, data, **kwargs):
         return DateGroup(due_date=data.due_date)
     
+    @setter_like
+    def add(self, data: Order):
+        Grouped.add(self, data)
+        if data.greige not in self.__grg_orders:
+            self.__grg_orders[data.greige] = {}
+        self.__grg_orders[data.greige][data.id] = data
+        if data.item not in self.__n_listened:
+            self.__n_listened[data.item] = 0
+            data.add_listener(self._prod_changed)
+        self.__n_listened[data.item] += 1
+        self.__dirty.add(data.greige)
+        dates = self.__pnum_dates.setdefault(data.pnum, {})
+        if data.due_date not in dates:
+            dates[data.due_date] = 0
+            self.__last_dues.pop(data.pnum, None)
+        dates[data.due_date] += 1
+
+        pair = (data.greige, data.color)
+        seqs = self.__seqs.setdefault((data.due_date, *pair), {})
+        if data.id not in seqs:
+            self.__n_seq += 1
+            seqs[data.id] = self.__n_seq
+        insort(self.__pairs.setdefault(pair, []),
+               [data.due_date, seqs[data.id], data, data.total_lbs])
+    
+    @setter_like
+    def remove(self, dview: OrderView, remkey = False):
+        ret: Order = Grouped.remove(self, dview, remkey=remkey)
+        del self.__grg_orders[ret.greige][ret.id]
+        self.__n_listened[ret.item] -= 1
+        if self.__n_listened[ret.item] == 0:
+            del self.__n_listened[ret.item]
+            ret.remove_listener(self._prod_changed)
+        self.__dirty.add(ret.greige)
+        dates = self.__pnum_dates[ret.pnum]
+        dates[ret.due_date] -= 1
+        if dates[ret.due_date] == 0:
+            del dates[ret.due_date]
+            self.__last_dues.pop(ret.pnum, None)
+
+        pair = (ret.greige, ret.color)
+        entries = self.__pairs[pair]
+        seqs = self.__seqs[(ret.due_date, *pair)]
+        del entries[bisect_left(entries, [ret.due_date, seqs[ret.id]])]
+        if remkey:
+            del seqs[ret.id]
+            idx = bisect_left(entries, [ret.due_date])
+            if idx == len(entries) or entries[idx][0] != ret.due_date:
+                del self.__seqs[(ret.due_date, *pair)]
+        return ret
+    
+    def _prod_changed(self, req):
+        self.__dirty.add(req.item.greige)
+        self.__stale.add((req.item.greige, req.item.color))
+    
+    def needed_greige(self):
+        for greige in self.__grg_orders:
+            if self.needed_lbs(greige):
+                yield greige
+    
+    def needed_lbs(self, greige: GreigeStyle):
+        if greige not in self.__grg_orders:
+            return []
+        if greige in self.__dirty:
+            self.__dirty.remove(greige)
+            needed: dict[dt.datetime, list[float]] = {}
+            for order in self.__grg_orders[greige].values():
+                rem_lbs = min(order.init_lbs, order.total_lbs)
+                if rem_lbs <= 0: continue
+                if order.due_date not in needed:
+                    needed[order.due_date] = []
+                needed[order.due_date].append(rem_lbs)
+            self.__needed[greige] = [(date, math.fsum(needed[date])) for date in sorted(needed)]
+        return self.__needed[greige]
+    
+    def last_due_date(self, pnum: int):
+        if pnum not in self.__last_dues:
+            dates = self.__pnum_dates.get(pnum, {})
+            self.__last_dues[pnum] = None
+            for date in self:
+                if date in dates:
+                    self.__last_dues[pnum] = date
+        return self.__last_dues[pnum]
+    
+    def get_order(self, id: str):
+        return self.__grg_orders[self.get(id).greige][id]
+    
     @logged_generator(matches_args, matches_yld)
     def get_matches(self, order: Order):
-        dates = sorted(self)
-        for date in dates:
-            if order.greige not in self[date]: continue
-            if order.color not in self[date, order.greige]: continue
-
-            for view in self[date, order.greige, order.color].itervalues():
-                match: OrderView = view
-                if match.total_lbs <= 0: continue
-                if match.item == order.item: continue
-                total_lbs = order.total_lbs + match.total_lbs
-                needed_ports = total_lbs / order.greige.port_rng.average()
-                if needed_ports > 8:
-                    yield FailedYield(desc1='Combined pounds exceeds maximum jet size',
-                                      desc2=f'combined pounds={total_lbs:.2f}',
-                                      desc3=f'minimum ports needed={needed_ports:.1f}')
-                else:
-                    yield match
-
-class DemandView(GroupedView[str, dt.datetime]):
+        pair = (order.greige, order.color)
+        entries = self.__pairs.get(pair, [])
+        if pair in self.__stale:
+            self.__stale.remove(pair)
+            for entry in entries:
+                entry[3] = entry[2].total_lbs
+
+        for _, _, match, match_lbs in entries:
+            if match_lbs <= 0: continue
+            if match.item == order.item: continue
+            total_lbs = order.total_lbs + match_lbs
+            needed_ports = total_lbs / order.greige.port_rng.average()
+            if needed_ports > 8:
+                yield FailedYield(desc1='Combined pounds exceeds maximum jet size',
+                                  desc2=f'combined pounds={total_lbs:.2f}',
+                                  desc3=f'minimum ports needed={needed_ports:.1f}')
+            else:
+                yield match.view()
+
+class DemandView(GroupedView[str, dt.datetime],
+                 funcs=('needed_greige','needed_lbs','last_due_date')):
     pass
\ No newline at end of file
@@ -1,8 +1,8 @@
-from typing import Protocol
+from typing import Protocol, Callable, Any
 import datetime as dt
 from app.support.grouped import Data, DataView
 from app.style import FabricStyle, GreigeStyle, Color
-from app.materials import PortLoad
+from app.materials import PortLoad, Snapshot
 from app.schedule import DyeLot, DyeLotView
 
 class _Req(Protocol):
@@ -10,10 +10,16 @@ class _Req(Protocol):
     @property
     def lots(self) -> list[DyeLotView]: ...
     @property
+    def active_lots(self) -> list[DyeLotView]: ...
+    @property
+    def cum_yds(self) -> tuple[float, ...]: ...
+    @property
     def total_yds_prod(self) -> float: ...
     def total_yds_by(date: dt.datetime) -> float: ...
-    def assign(rolls: list[PortLoad]) -> DyeLot: ...
+    def assign(rolls: list[PortLoad], snapshot: Snapshot | None = None) -> DyeLot: ...
     def unassign(lview: DyeLotView) -> DyeLot: ...
+    def add_listener(func: Callable[[Any], None]) -> None: ...
+    def remove_listener(func: Callable[[Any], None]) -> None: ...
 
 class Order(Data[str], mod_in_group=True,
             attrs=('item','greige','color','yds','init_yds','cum_yds','total_yds',
@@ -94,12 +100,24 @@ class Order(Data[str], mod_in_group=True,
         they will be compared to this order's due date.
         """
         ...
-    def assign(self, ports: list[PortLoad]) -> DyeLot:
-        """Assign the given ports to this order. Returns the resulting dyelot."""
+    def assign(self, ports: list[PortLoad], snapshot: Snapshot | None = None) -> DyeLot:
+        """
+        Assign the given ports to this order. Returns the resulting
+        dyelot, which is tentative if built on a snapshot.
+        """
         ...
     def unassign(self, lview: DyeLotView) -> DyeLot:
         """Unassign the given dyelot from this order. Returns the unassigned dyelot."""
         ...
+    def add_listener(self, func: Callable[[Any], None]) -> None:
+        """
+        Registers a function to call with this order's requirement
+        whenever its production changes.
+        """
+        ...
+    def remove_listener(self, func: Callable[[Any], None]) -> None:
+        """Removes one registration of the given function."""
+        ...
 
 class OrderView(DataView[str],
                 attrs=('item','greige','color','yds','init_yds','cum_yds','total_yds',
@@ -160,8 +178,11 @@ class OrderView(DataView[str],
         they will be compared to this order's due date.
         """
         ...
-    def assign(self, ports: list[PortLoad]) -> DyeLot:
-        """Assign the given ports to this order. Returns the resulting dyelot."""
+    def assign(self, ports: list[PortLoad], snapshot: Snapshot | None = None) -> DyeLot:
+        """
+        Assign the given ports to this order. Returns the resulting
+        dyelot, which is tentative if built on a snapshot.
+        """
         ...
     def unassign(self, lview: DyeLotView) -> DyeLot:
         """Unassign the given dyelot from this order. Returns the unassigned dyelot."""
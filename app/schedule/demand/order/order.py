@@ -1,12 +1,12 @@
 #!/usr/bin/env python
 
-from typing import Protocol
+from typing import Protocol, Callable, Any
 import datetime as dt
 
 from app.support import setter_like
 from app.support.grouped import Data, DataView
 from app.style import FabricStyle
-from app.materials import PortLoad
+from app.materials import PortLoad, Snapshot
 from ...dyelot import DyeLot, DyeLotView
 
 class _Req(Protocol):
@@ -14,10 +14,16 @@ class _Req(Protocol):
     @property
     def lots(self) -> list[DyeLotView]: ...
     @property
+    def active_lots(self) -> list[DyeLotView]: ...
+    @property
+    def cum_yds(self) -> tuple[float, ...]: ...
+    @property
     def total_yds_prod(self) -> float: ...
     def total_yds_by(date: dt.datetime) -> float: ...
-    def assign(rolls: list[PortLoad]) -> DyeLot: ...
+    def assign(rolls: list[PortLoad], snapshot: Snapshot | None = None) -> DyeLot: ...
     def unassign(lview: DyeLotView) -> DyeLot: ...
+    def add_listener(func: Callable[[Any], None]) -> None: ...
+    def remove_listener(func: Callable[[Any], None]) -> None: ...
 
 class Order(Data[str], mod_in_group=True,
             attrs=('item','greige','color','yds','init_yds','cum_yds','total_yds',
@@ -79,15 +85,18 @@ class Order(Data[str], mod_in_group=True,
         
         r: _Req = self.__req
         max_late_time = next_avail - self.due_date
-        lots: list[DyeLotView] = sorted(filter(lambda l: not l.end is None, r.lots),
-                                        key=lambda l: l.end)
+        lots: list[DyeLotView] = r.active_lots
         if not lots:
             return [(self.yds, max_late_time)]
         
+        cum_yds = r.cum_yds
         last_late = self.__init_cum_yds
         idx = 0
+        j = len(lots)
         for i in range(len(lots), 0, -1):
-            total_prod = r.total_yds_by(lots[i-1].end)
+            while lots[j-1].end > lots[i-1].end:
+                j -= 1
+            total_prod = cum_yds[j-1]
             if self.__init_cum_yds - total_prod > 0:
                 last_late = min(self.__init_cum_yds - total_prod, self.init_yds)
                 idx = i
@@ -107,12 +116,18 @@ class Order(Data[str], mod_in_group=True,
         return table
     
     @setter_like
-    def assign(self, ports):
-        return self.__req.assign(ports)
+    def assign(self, ports, snapshot = None):
+        return self.__req.assign(ports, snapshot)
     
     @setter_like
     def unassign(self, lview):
         return self.__req.unassign(lview)
+    
+    def add_listener(self, func):
+        self.__req.add_listener(func)
+    
+    def remove_listener(self, func):
+        self.__req.remove_listener(func)
 
 class OrderView(DataView[str],
                 attrs=('item','greige','color','yds','init_yds','cum_yds','total_yds',
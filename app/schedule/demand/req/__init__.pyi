@@ -1,16 +1,22 @@
+from typing import Callable
 import datetime as dt
 from app.support import HasID, SuperImmut
 from app.style import FabricStyle
-from app.materials import PortLoad
+from app.materials import PortLoad, Snapshot
 from app.schedule import DyeLot, DyeLotView
 from app.schedule.demand.order import Order
 
 class Req(HasID[str], SuperImmut,
-          attrs=('_prefix','id','item','orders','lots'),
-          priv_attrs=('id','lots'), frozen=('*id','item','orders')):
+          attrs=('_prefix','id','item','orders','lots','active_lots','cum_yds'),
+          priv_attrs=('id','lots','listeners','n_assigned','seqs','active','keys','cum',
+                      'sums'),
+          frozen=('*id','*listeners','*seqs','*active','*keys','*cum','*sums','item',
+                  'orders')):
     """
     A class for Req objects. Represents all the orders
-    on a single item.
+    on a single item. Keeps its scheduled lots sorted by
+    end date with the running total of their yards, so
+    production by a date is a binary search.
     """
     item: FabricStyle # the item of this requirement
     orders: tuple[Order, ...] # the orders that compose this requirement
@@ -32,15 +38,50 @@ class Req(HasID[str], SuperImmut,
         """The DyeLots assigned to this requirement."""
         ...
     @property
+    def active_lots(self) -> list[DyeLotView]:
+        """
+        The scheduled DyeLots of this requirement, sorted by end
+        date. Lots ending together are in the order they were assigned.
+        """
+        ...
+    @property
+    def cum_yds(self) -> tuple[float, ...]:
+        """
+        The running total of the yards of 'active_lots'. Each total
+        is kept exactly and rounded once, so it does not depend on
+        the order the lots were scheduled in.
+        """
+        ...
+    @property
     def total_yds_prod(self) -> float:
         """The total yards of this item that will be produced by the schedule."""
         ...
     def total_yds_by(self, date: dt.datetime) -> float:
         """The total yards of this item that will be produced by the given date."""
         ...
-    def assign(self, ports: list[PortLoad]) -> DyeLot:
-        """Assigns the given ports to this requirement. Returns the resulting dyelot."""
+    def assign(self, ports: list[PortLoad], snapshot: Snapshot | None = None) -> DyeLot:
+        """
+        Assigns the given ports to this requirement. Returns the
+        resulting dyelot. If a snapshot is given, the dyelot is
+        tentative and is released when the snapshot is discarded.
+        """
         ...
     def unassign(self, lview: DyeLotView) -> DyeLot:
         """Unassigns the given dyelot from this requirement. Returns the unassigned dyelot."""
+        ...
+    def add_listener(self, func: Callable[['Req'], None]) -> None:
+        """
+        Registers a function to call with this requirement whenever
+        one of its lots is scheduled, unscheduled or moved.
+        """
+        ...
+    def remove_listener(self, func: Callable[['Req'], None]) -> None:
+        """Removes one registration of the given function."""
+        ...
+    def _update_lot(self, lot: DyeLot) -> None:
+        """
+        Called when one of this requirement's lots is scheduled,
+        unscheduled, moved or unassigned. Updates the production
+        index and notifies the listeners.
+        """
         ...
\ No newline at end of file
@@ -1,12 +1,17 @@
 #!/usr/bin/env python
 
-from app.support import HasID, SuperImmut
+from bisect import bisect_left, bisect_right
+
+from app.support import ExactSum, HasID, SuperImmut
 from ...dyelot import DyeLot, DyeLotView
 from ..order import Order
 
 class Req(HasID[str], SuperImmut,
-          attrs=('_prefix','id','item','orders','lots'),
-          priv_attrs=('id','lots'), frozen=('*id','item','orders')):
+          attrs=('_prefix','id','item','orders','lots','active_lots','cum_yds'),
+          priv_attrs=('id','lots','listeners','n_assigned','seqs','active','keys','cum',
+                      'sums'),
+          frozen=('*id','*listeners','*seqs','*active','*keys','*cum','*sums','item',
+                  'orders')):
     
     def __init__(self, item, buckets):
         orders: list[Order] = []
@@ -19,7 +24,10 @@ class Req(HasID[str], SuperImmut,
             if yds > 0:
                 orders.append(Order(self, item, pnum, due_date, yds, total_yds))
 
-        SuperImmut.__init__(self, priv={'id': item.id, 'lots': []}, item=item, orders=tuple(orders))
+        SuperImmut.__init__(self, priv={'id': item.id, 'lots': [], 'listeners': [],
+                                        'n_assigned': 0, 'seqs': {}, 'active': [], 'keys': {},
+                                        'cum': [0], 'sums': [ExactSum()]},
+                            item=item, orders=tuple(orders))
     
     @property
     def _prefix(self):
@@ -33,19 +41,62 @@ class Req(HasID[str], SuperImmut,
     def lots(self) -> list[DyeLotView]:
         return list(map(lambda l: l.view(), self.__lots))
     
+    @property
+    def active_lots(self) -> list[DyeLotView]:
+        return list(map(lambda a: a[2].view(), self.__active))
+    
+    @property
+    def cum_yds(self):
+        return tuple(self.__cum[1:])
+    
     @property
     def total_yds_prod(self):
-        return sum(map(lambda lview: lview.yds, filter(lambda lview: not lview.end is None, self.lots)))
+        return self.__cum[-1]
     
     def total_yds_by(self, date):
-        return sum(map(lambda lview: lview.yds,
-                       filter(lambda lview: not lview.end is None and lview.end <= date, self.lots)))
+        return self.__cum[bisect_right(self.__active, date, key=lambda a: a[0])]
     
-    def assign(self, ports):
-        newlot = DyeLot.new_lot(self.item, ports)
+    def assign(self, ports, snapshot = None):
+        newlot = DyeLot.new_lot(self.item, ports, req=self)
         self.__lots.append(newlot)
+        self.__n_assigned += 1
+        self.__seqs[newlot.id] = self.__n_assigned
+        if snapshot is not None:
+            snapshot.add_lot(newlot)
         return newlot
     
     def unassign(self, lview):
-        lot = self.__lots.remove(lview)
-        return lot
\ No newline at end of file
+        lot: DyeLot = self.__lots.pop(self.__lots.index(lview))
+        del self.__seqs[lot.id]
+        self._update_lot(lot)
+        return lot
+    
+    def add_listener(self, func):
+        self.__listeners.append(func)
+    
+    def remove_listener(self, func):
+        self.__listeners.remove(func)
+    
+    def _update_lot(self, lot):
+        idx = len(self.__active)
+        key = self.__keys.pop(lot.id, None)
+        if key is not None:
+            idx = bisect_left(self.__active, key)
+            del self.__active[idx]
+        if lot.end is not None and lot.id in self.__seqs:
+            key = (lot.end, self.__seqs[lot.id])
+            self.__keys[lot.id] = key
+            new_idx = bisect_left(self.__active, key)
+            self.__active.insert(new_idx, (*key, lot))
+            idx = min(idx, new_idx)
+        
+        del self.__cum[idx+1:]
+        del self.__sums[idx+1:]
+        for _, _, alot in self.__active[idx:]:
+            total = self.__sums[-1].copy()
+            total.add(alot.yds)
+            self.__sums.append(total)
+            self.__cum.append(total.value)
+
+        for func in self.__listeners:
+            func(self)
\ No newline at end of file
@@ -1,14 +1,19 @@
+from typing import Protocol
 import datetime as dt
 from app.support import HasID, SuperImmut, SuperView
 from app.style import FabricStyle, GreigeStyle
 from app.style.fabric.color import Color, ShadeGrade
 from app.materials.inventory import PortLoad
 
+class _Req(Protocol):
+    def _update_lot(self, lot: 'DyeLot') -> None: ...
+    def unassign(self, lview: 'DyeLotView') -> 'DyeLot': ...
+
 class DyeLot(HasID[str], SuperImmut,
              attrs=('_prefix','id','ports','item','greige','shade','cycle_time',
                     'start','end','yds','lbs','min_date'),
-             priv_attrs=('id','start','fin_time','view'),
-             frozen=('*id','*fin_time','*view','ports','item','cycle_time',
+             priv_attrs=('id','start','fin_time','view','req'),
+             frozen=('*id','*fin_time','*view','*req','ports','item','cycle_time',
                      'min_date')):
     """
     A class for DyeLot objects. Can be linked to multiple jobs
@@ -32,10 +37,12 @@ class DyeLot(HasID[str], SuperImmut,
         """
         ...
     @classmethod
-    def new_lot(cls, item: FabricStyle, ports: list[PortLoad]) -> 'DyeLot':
+    def new_lot(cls, item: FabricStyle, ports: list[PortLoad],
+                req: _Req | None = None) -> 'DyeLot':
         """
         Create a new DyeLot for a particular fabric item using the
-        provided roll pieces.
+        provided roll pieces. If a requirement is given, it is told
+        whenever the new lot is scheduled or unscheduled.
         """
         ...
     ports: tuple[PortLoad, ...]
@@ -44,7 +51,8 @@ class DyeLot(HasID[str], SuperImmut,
     min_date: dt.datetime
     def __init__(self, id: str, ports: tuple[PortLoad, ...], item: FabricStyle,
                  start: dt.datetime | None, cycle_time: dt.timedelta,
-                 fin_time: dt.timedelta, min_date: dt.datetime) -> None:
+                 fin_time: dt.timedelta, min_date: dt.datetime,
+                 req: _Req | None = None) -> None:
         """
         Initialize a new DyeLot object.
 
@@ -64,6 +72,10 @@ class DyeLot(HasID[str], SuperImmut,
             fin_time:
               The amount of time required to finish the item after
               dyeing.
+            min_date:
+              The earliest date this lot can start.
+            req:
+              The requirement this lot was assigned to, if any.
         """
         ...
     def __repr__(self) -> str: ...
@@ -103,6 +115,9 @@ class DyeLot(HasID[str], SuperImmut,
     def view(self) -> 'DyeLotView':
         """A live, read-only view of this object."""
         ...
+    def release(self) -> None:
+        """Unassigns this dyelot from its requirement, if it has one."""
+        ...
 
 class DyeLotView(SuperView[DyeLot],
                  attrs=('_prefix','id','ports','item','greige','shade','cycle_time',
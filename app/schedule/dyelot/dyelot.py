@@ -10,8 +10,8 @@ _CTR = 0
 class DyeLot(HasID[str], SuperImmut,
              attrs=('_prefix','id','ports','item','greige','shade','cycle_time',
                     'start','end','yds','lbs','min_date'),
-             priv_attrs=('id','start','fin_time','view'),
-             frozen=('*id','*fin_time','*view','ports','item','cycle_time','min_date')):
+             priv_attrs=('id','start','fin_time','view','req'),
+             frozen=('*id','*fin_time','*view','*req','ports','item','cycle_time','min_date')):
     
     @classmethod
     def from_adaptive(cls, id, item, start, end):
@@ -29,16 +29,16 @@ class DyeLot(HasID[str], SuperImmut,
                    start)
     
     @classmethod
-    def new_lot(cls, item: fabric.FabricStyle, ports):
+    def new_lot(cls, item: fabric.FabricStyle, ports, req = None):
         globals()['_CTR'] += 1
         new_id = f'LOT{globals()['_CTR']:05}'
         min_date = max(map(lambda pl: pl.avail_date, ports)) + dt.timedelta(days=1)
         return cls(new_id, tuple(ports), item, None, item.cycle_time, dt.timedelta(hours=16),
-                   min_date)
+                   min_date, req=req)
 
-    def __init__(self, id, ports, item, start, cycle_time, fin_time, min_date):
+    def __init__(self, id, ports, item, start, cycle_time, fin_time, min_date, req = None):
         SuperImmut.__init__(self, priv={'id': id, 'start': start, 'fin_time': fin_time,
-                                        'view': DyeLotView(self)},
+                                        'view': DyeLotView(self), 'req': req},
                             ports=ports, item=item, cycle_time=cycle_time,
                             min_date=min_date)
         
@@ -74,7 +74,10 @@ class DyeLot(HasID[str], SuperImmut,
     def start(self, new):
         if not (new is None or self.__start is None):
             raise RuntimeError('A DyeLot cannot be linked to more than one active Job at a time')
+        prev = self.__start
         self.__start = new
+        if self.__req is not None and prev != new:
+            self.__req._update_lot(self)
     
     @property
     def end(self):
@@ -93,6 +96,10 @@ class DyeLot(HasID[str], SuperImmut,
     def view(self):
         return self.__view
     
+    def release(self):
+        if self.__req is not None:
+            self.__req.unassign(self.__view)
+    
 class DyeLotView(SuperView[DyeLot],
                  attrs=('_prefix','id','ports','item','greige','shade','cycle_time',
                         'start','end','yds','lbs','min_date'),
@@ -1,8 +1,8 @@
 #!/usr/bin/env python
 
 from .job import Job
-from .jetsched import JetSched
+from .jetsched import JetSched, JobPlan, SchedProbe
 from .jet import Jet
-from .jets import init, get_jets, get_by_alt_id
+from .jets import init, read_jets, get_jets, get_by_alt_id
 
-__all__ = ['Job', 'JetSched', 'Jet', 'init', 'get_jets', 'get_by_alt_id']
\ No newline at end of file
+__all__ = ['Job', 'JetSched', 'JobPlan', 'SchedProbe', 'Jet', 'init', 'read_jets', 'get_jets', 'get_by_alt_id']
\ No newline at end of file
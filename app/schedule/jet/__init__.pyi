@@ -1,16 +1,17 @@
 from app.schedule.jet.job import Job as Job
-from app.schedule.jet.jetsched import JetSched as JetSched
+from app.schedule.jet.jetsched import JetSched as JetSched, JobPlan as JobPlan, \
+    SchedProbe as SchedProbe
 
 import datetime as dt
-from app.support import HasID, SuperImmut, FloatRange, DateRange
+from app.support import HasID, SuperImmut, FloatRange, DateRange, WorkCalendar
 from app.support.logging import HasLogger
 from app.schedule import DyeLot
 
 class Jet(HasLogger, HasID[str], SuperImmut,
           attrs=('_logger','_prefix','id','logger','n_ports','load_rng','date_rng',
-                 'jobs','n_new_jobs','cur_sched'),
-          priv_attrs=('id','init_sched','cur_sched'),
-          frozen=('*id','*init_sched','n_ports','load_rng','date_rng')):
+                 'jobs','n_new_jobs','cur_sched','calendar'),
+          priv_attrs=('id','init_sched','cur_sched','calendar'),
+          frozen=('*id','*init_sched','*calendar','n_ports','load_rng','date_rng')):
     """
     A class for Jet objects. They have frozen 'n_ports',
     'load_rng', and 'date_rng' attributes.
@@ -38,6 +39,10 @@ class Jet(HasLogger, HasID[str], SuperImmut,
         """
         ...
     @property
+    def calendar(self) -> WorkCalendar:
+        """The working time calendar shared by this jet's schedules."""
+        ...
+    @property
     def jobs(self) -> tuple[Job, ...]:
         """All the jobs currently scheduled to this jet."""
         ...
@@ -86,6 +91,19 @@ def init(start: dt.datetime, end: dt.datetime) -> None:
     """
     ...
 
+def read_jets(start: dt.datetime, end: dt.datetime) -> dict[str, Jet]:
+    """
+    Builds a fresh set of jets from the jet table, keyed by their
+    alternate ids. Unlike 'init', the jets are not registered with
+    this sub-module, so each call returns new, empty jets.
+
+        start:
+          The earliest date to schedule a new job.
+        end:
+          The latest date to schedule a new job.
+    """
+    ...
+
 def get_jets() -> list[Jet]: ...
 
 def get_by_alt_id(id: str) -> Jet | None: ...
\ No newline at end of file
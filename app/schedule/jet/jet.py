@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 
-from app.support import HasID, SuperImmut, FloatRange, DateRange
+from app.support import HasID, SuperImmut, FloatRange, DateRange, WorkCalendar
 from app.support.logging import Logger, HasLogger, logged_meth
 from ..dyelot import DyeLot
 from .jetsched import JetSched
@@ -28,9 +28,9 @@ def insert_ret(res):
 
 class Jet(HasLogger, HasID[str], SuperImmut,
           attrs=('_logger','_prefix','id','logger','n_ports','load_rng','date_rng',
-                 'jobs','n_new_jobs','cur_sched'),
-          priv_attrs=('id','init_sched','cur_sched'),
-          frozen=('*id','*init_sched','n_ports','load_rng','date_rng')):
+                 'jobs','n_new_jobs','cur_sched','calendar'),
+          priv_attrs=('id','init_sched','cur_sched','calendar'),
+          frozen=('*id','*init_sched','*calendar','n_ports','load_rng','date_rng')):
     
     _logger = Logger()
 
@@ -40,7 +40,9 @@ class Jet(HasLogger, HasID[str], SuperImmut,
     
     def __init__(self, id, n_ports, min_load, max_load, start, end):
         date_rng = DateRange(start, end)
-        SuperImmut.__init__(self, priv={'id': id, 'init_sched': JetSched(date_rng),
+        calendar = WorkCalendar()
+        SuperImmut.__init__(self, priv={'id': id, 'calendar': calendar,
+                                        'init_sched': JetSched(date_rng, calendar=calendar),
                                         'cur_sched': None},
                             n_ports=n_ports, load_rng=FloatRange(min_load, max_load),
                             date_rng=date_rng)
@@ -57,6 +59,10 @@ class Jet(HasLogger, HasID[str], SuperImmut,
     def logger(self):
         return type(self)._logger
     
+    @property
+    def calendar(self):
+        return self.__calendar
+    
     @property
     def jobs(self) -> tuple[Job, ...]:
         if self.__cur_sched is None:
@@ -78,7 +84,7 @@ class Jet(HasLogger, HasID[str], SuperImmut,
         self.__cur_sched = JetSched(DateRange(max(self.date_rng.minval,
                                                   self.__init_sched.last_job_end),
                                               self.date_rng.maxval),
-                                    prev_sched=self.__init_sched)
+                                    prev_sched=self.__init_sched, calendar=self.__calendar)
     
     def get_start_idx(self, lots: tuple[DyeLot, ...], due_date: datetime):
         curjobs = self.__cur_sched.jobs
@@ -93,29 +99,10 @@ class Jet(HasLogger, HasID[str], SuperImmut,
         if self.__cur_sched is None:
             raise RuntimeError('Cannot call \'insert\' method before initializing a new schedule')
         
-        newsched = self.__cur_sched.copy()
-        cur_reg_jobs = self.__cur_sched.jobs
-        cur_jobs = self.__cur_sched.full_sched
-
-        if idx > 0:
-            last_job_before = cur_reg_jobs[idx-1]
-            for job in cur_jobs:
-                newsched.add_job(job)
-                if job.id == last_job_before.id:
-                    break
-        
-        min_date = max(map(lambda l: l.min_date, lots))
-        if not newsched.can_add(lots) or (newsched.last_job_end < min_date and \
-            idx < len(cur_reg_jobs)):
+        probe = self.__cur_sched.probe_insert(lots, idx)
+        if probe is None:
             return None, []
-    
-        newjobs = []
-        newjobs.append(newsched.add_lots(lots, idx))
-        for job in self.__cur_sched.jobs[idx:]:
-            if newsched.can_add(tuple(job.lots)):
-                newjobs.append(newsched.add_lots(tuple(job.lots), -1))
-        
-        return newsched, newjobs
+        return probe.build()
     
     def set_sched(self, newsched: JetSched):
         temp = self.__cur_sched
@@ -7,10 +7,8 @@ from .jet import Jet
 _JET_MAP = {}
 _ALT_JET_MAP = {}
 
-def init(start: dt.datetime, end: dt.datetime):
-    if len(globals()['_JET_MAP']) > 0 and len(globals()['_ALT_JET_MAP']) > 0:
-        return
-
+def read_jets(start: dt.datetime, end: dt.datetime) -> dict[str, Jet]:
+    ret: dict[str, Jet] = {}
     with open(os.path.join(os.path.dirname(__file__), 'jets.csv')) as infile:
         for line in infile:
             line = line.strip()
@@ -21,9 +19,16 @@ def init(start: dt.datetime, end: dt.datetime):
             min_load = float(min_load)
             max_load = float(max_load)
 
-            newjet = Jet(jet_id, n_ports, min_load, max_load, start, end)
-            _JET_MAP[jet_id] = newjet
-            _ALT_JET_MAP[alt_id] = newjet
+            ret[alt_id] = Jet(jet_id, n_ports, min_load, max_load, start, end)
+    return ret
+
+def init(start: dt.datetime, end: dt.datetime):
+    if len(globals()['_JET_MAP']) > 0 and len(globals()['_ALT_JET_MAP']) > 0:
+        return
+
+    for alt_id, newjet in read_jets(start, end).items():
+        _JET_MAP[newjet.id] = newjet
+        _ALT_JET_MAP[alt_id] = newjet
 
 def get_jets():
     return list(globals()['_JET_MAP'].values())
@@ -1,5 +1,5 @@
 #!/usr/bin/env python
 
-from .jetsched import JetSched
+from .jetsched import JetSched, JobPlan, SchedProbe
 
-__all__ = ['JetSched']
\ No newline at end of file
+__all__ = ['JetSched', 'JobPlan', 'SchedProbe']
\ No newline at end of file
@@ -1,20 +1,24 @@
+from typing import NamedTuple
 import datetime as dt
-from app.support import HasID, SuperImmut, DateRange
+from app.support import HasID, SuperImmut, DateRange, WorkCalendar
 from app.style import FabricStyle, GreigeStyle
+from app.style.fabric.color import Color, ShadeGrade
 from app.materials import PortLoad
 from app.schedule import DyeLot
 from app.schedule.jet import Job
 
 class JetSched(HasID[int], SuperImmut,
                attrs=('_prefix','id','soil_level','jobs_since_strip','rem_time',
-                      'last_job_end','jobs'),
-               priv_attrs=('id','init_sched','soil','jss','date_rng','jobs'),
-               frozen=('*id','*init_sched','*date_rng')):
+                      'last_job_end','jobs','calendar'),
+               priv_attrs=('id','init_sched','soil','jss','date_rng','calendar','jobs','states',
+                           'reg_pos'),
+               frozen=('*id','*init_sched','*date_rng','*calendar')):
     """
     A class for JetSched objects. Represents one version of a schedule
     on a jet. Schedules can only be added to.
     """
-    def __init__(self, date_rng: DateRange, prev_sched: 'JetSched | None' = None) -> None:
+    def __init__(self, date_rng: DateRange, prev_sched: 'JetSched | None' = None,
+                 calendar: WorkCalendar | None = None) -> None:
         """
         Initialize a new JetSched object.
 
@@ -23,9 +27,16 @@ class JetSched(HasID[int], SuperImmut,
             prev_sched: (default None)
               The schedule before this one on a jet. Represents the jobs
               already scheduled to the jet on adaptive.
+            calendar: (default None)
+              The working time calendar of the jet. Defaults to one
+              that only blacks out Sundays.
         """
         ...
     @property
+    def calendar(self) -> WorkCalendar:
+        """The working time calendar used for 'rem_time'."""
+        ...
+    @property
     def soil_level(self) -> int:
         """The soil level of the jet after running this schedule."""
         ...
@@ -71,6 +82,35 @@ class JetSched(HasID[int], SuperImmut,
     def add_lots(self, lots: tuple[DyeLot, ...], idx: int) -> Job:
         """Creates a job object from the provided lots, adds them to the schedule, and returns the job."""
         ...
+    def prefix_len(self, idx: int) -> int:
+        """
+        The number of jobs (including strips) that come before the
+        non-strip job at the given index.
+        """
+        ...
+    def state_at(self, n: int) -> tuple[int, int, Job | None]:
+        """
+        The soil level, jobs since strip and last job after the first
+        'n' jobs (including strips) of this schedule. These are recorded
+        as jobs are added, so this does not replay the schedule.
+        """
+        ...
+    def probe_insert(self, lots: tuple[DyeLot, ...], idx: int) -> 'SchedProbe | None':
+        """
+        Work out what inserting a job with the given lots at the given
+        index would do, without creating any Job, DyeLot or JetSched
+        objects. Resumes from the recorded state at the insertion
+        point. 'Jet.insert' builds its schedule from this probe.
+
+            lots:
+              The dyelots that would go in the new job.
+            idx:
+              The index at which to insert the new job.
+
+        Returns a SchedProbe describing the resulting schedule if there
+        is space and None otherwise.
+        """
+        ...
     def activate(self) -> None:
         """Activate all the jobs in this schedule."""
         ...
@@ -83,4 +123,92 @@ class JetSched(HasID[int], SuperImmut,
         schedule (if deactivated). Returns a dictionary mapping greige
         styles to released port loads.
         """
+        ...
+
+class JobPlan(NamedTuple):
+    """A job in a SchedProbe that has not been created."""
+    item: FabricStyle
+    lots: tuple[DyeLot, ...]
+    start: dt.datetime
+    end: dt.datetime
+    @property
+    def greige(self) -> GreigeStyle: ...
+    @property
+    def color(self) -> Color: ...
+    @property
+    def shade(self) -> ShadeGrade: ...
+    def activate(self) -> None:
+        """Set the start date of the lots in this job to the planned start."""
+        ...
+    def deactivate(self) -> None:
+        """Clear the start date of the lots in this job."""
+        ...
+
+class SchedProbe:
+    """
+    The result of 'JetSched.probe_insert'. Keeps the jobs of the base
+    schedule before the insertion index and plans the rest as JobPlan
+    objects. Can be activated on a jet in place of a JetSched to cost
+    the insertion; 'build' turns it into the real schedule.
+    """
+    base: JetSched
+    lots: tuple[DyeLot, ...]
+    idx: int
+    n_prefix: int
+    prefix_last: Job | None
+    plans: list[JobPlan]
+    def __init__(self, base: JetSched, lots: tuple[DyeLot, ...], idx: int, n_prefix: int,
+                 soil: int, jss: int, prefix_last: Job | None, date_rng: DateRange) -> None: ...
+    @property
+    def prefix(self) -> tuple[Job, ...]:
+        """The jobs of the base schedule kept before the insertion."""
+        ...
+    @property
+    def soil_level(self) -> int:
+        """The soil level of the jet after running this schedule."""
+        ...
+    @property
+    def jobs_since_strip(self) -> int:
+        """The number of jobs run since the last strip cycle."""
+        ...
+    @property
+    def last_job_end(self) -> dt.datetime:
+        """
+        The end date and time of the last job in this schedule.
+        Skips weekends as necessary.
+        """
+        ...
+    @property
+    def rem_time(self) -> dt.timedelta:
+        """The remaining time available for new jobs on this schedule."""
+        ...
+    @property
+    def jobs(self) -> tuple[Job | JobPlan, ...]:
+        """The non-strip jobs in this schedule."""
+        ...
+    @property
+    def full_sched(self) -> tuple[Job | JobPlan, ...]:
+        """All the jobs in this schedule."""
+        ...
+    def get_needed_strip(self, item: FabricStyle) -> FabricStyle | None:
+        """Get the strip required (if any) before running the given item."""
+        ...
+    def can_add(self, lots: tuple[DyeLot, ...]) -> bool:
+        """Returns True iff there is space in the schedule to run the given lots as a job."""
+        ...
+    def add_lots(self, lots: tuple[DyeLot, ...]) -> JobPlan:
+        """Plans a job (and any strip needed before it) for the provided lots at the end of the schedule."""
+        ...
+    def build(self) -> tuple[JetSched, list[Job]]:
+        """
+        Create the schedule this probe describes. Keeps the prefix jobs,
+        creates a Job (and strip lot) for every plan, and returns the new
+        JetSched and a list of the new non-strip jobs.
+        """
+        ...
+    def activate(self) -> None:
+        """Activate all the jobs in this schedule."""
+        ...
+    def deactivate(self) -> None:
+        """Deactivate all the jobs in this schedule."""
         ...
\ No newline at end of file
@@ -1,9 +1,9 @@
 #!/usr/bin/env python
 
-from typing import Callable
+from typing import NamedTuple, Callable
 import datetime as dt
 
-from app.support import HasID, SuperImmut, DateRange
+from app.support import HasID, SuperImmut, DateRange, WorkCalendar
 from app.style import fabric, color, GreigeStyle
 from ..job import Job
 from ...dyelot import DyeLot
@@ -15,13 +15,47 @@ def _first_monday_after(date: dt.datetime):
     monday = date + dt.timedelta(days=days_to_mon)
     return dt.datetime(year=monday.year, month=monday.month, day=monday.day)
 
+def _skip_weekend(lje: dt.datetime):
+    if lje.weekday() > 4 and (lje.weekday() == 6 or lje.hour >= 20):
+        return _first_monday_after(lje)
+    return lje
+
+def _needed_strip(item: fabric.FabricStyle, soil: int, jss: int, last_job):
+    strip_id = item.get_strip(soil)
+    strip = None if strip_id is None else fabric.get_style(strip_id)
+    if strip is None and (jss >= 9 or \
+        last_job is not None and item.color.shade == fabric.color.LIGHT and \
+        last_job.color.shade == fabric.color.BLACK):
+        strip = fabric.get_style('STRIP')
+    
+    return strip
+
+def _can_add(sched: 'JetSched | SchedProbe', lots: tuple[DyeLot, ...]):
+    total_cycle = lots[0].cycle_time - dt.timedelta(hours=4)
+    strip = sched.get_needed_strip(lots[0].item)
+
+    if not strip is None:
+        total_cycle += strip.cycle_time
+    
+    return total_cycle <= sched.rem_time
+
+def _lots_start(lots: tuple[DyeLot, ...], lje: dt.datetime):
+    min_date = max(map(lambda l: l.min_date, lots))
+    if min_date.weekday() == 6:
+        min_date += dt.timedelta(days=1)
+    return max(min_date, lje)
+
 class JetSched(HasID[int], SuperImmut,
                attrs=('_prefix','id','soil_level','jobs_since_strip','rem_time',
-                      'last_job_end','jobs'),
-               priv_attrs=('id','init_sched','soil','jss','date_rng','jobs'),
-               frozen=('*id','*init_sched','*date_rng')):
+                      'last_job_end','jobs','calendar'),
+               priv_attrs=('id','init_sched','soil','jss','date_rng','calendar','jobs','states',
+                           'reg_pos'),
+               frozen=('*id','*init_sched','*date_rng','*calendar')):
     
-    def __init__(self, date_rng: DateRange, prev_sched = None):
+    def __init__(self, date_rng: DateRange, prev_sched = None,
+                 calendar: WorkCalendar | None = None):
+        if calendar is None:
+            calendar = WorkCalendar()
         init_soil, init_jobs = 0, 0
         if prev_sched:
             init_soil = prev_sched.soil_level
@@ -30,7 +64,9 @@ class JetSched(HasID[int], SuperImmut,
         globals()['_CTR'] += 1
         SuperImmut.__init__(self, priv={'id': globals()['_CTR'], 'init_sched': prev_sched,
                                         'soil': init_soil, 'jss': init_jobs,
-                                        'date_rng': date_rng, 'jobs': []})
+                                        'date_rng': date_rng, 'calendar': calendar,
+                                        'jobs': [],
+                                        'states': [(init_soil, init_jobs)], 'reg_pos': []})
     
     @property
     def _prefix(self):
@@ -40,6 +76,10 @@ class JetSched(HasID[int], SuperImmut,
     def id(self):
         return self.__id
     
+    @property
+    def calendar(self):
+        return self.__calendar
+    
     @property
     def soil_level(self):
         return self.__soil
@@ -50,35 +90,13 @@ class JetSched(HasID[int], SuperImmut,
     
     @property
     def last_job_end(self):
-        lje: dt.datetime = dt.datetime.fromtimestamp(0)
         if not self.__jobs:
-            lje = self.__date_rng.minval
-        else:
-            lje = self.__jobs[-1].end
-
-        if lje.weekday() > 4 and (lje.weekday() == 6 or lje.hour >= 20):
-            return _first_monday_after(lje)
-        return lje
+            return _skip_weekend(self.__date_rng.minval)
+        return _skip_weekend(self.__jobs[-1].end)
     
     @property
     def rem_time(self):
-        lje = self.last_job_end
-        rem_rng = DateRange(lje, self.__date_rng.maxval)
-        first_mon = _first_monday_after(lje)
-        cur_wknd = DateRange(first_mon - dt.timedelta(hours=24), first_mon)
-        rem_t = rem_rng.maxval - lje
-
-        while rem_rng.overlaps(cur_wknd):
-            rem_t -= dt.timedelta(hours=24)
-            if cur_wknd.minval < rem_rng.minval:
-                rem_t += (rem_rng.minval - cur_wknd.minval)
-            if cur_wknd.maxval > rem_rng.maxval:
-                rem_t += (cur_wknd.maxval - rem_rng.maxval)
-            
-            cur_wknd = DateRange(cur_wknd.minval + dt.timedelta(days=7),
-                                 cur_wknd.maxval + dt.timedelta(days=7))
-        
-        return rem_t
+        return self.__calendar.work_time(self.last_job_end, self.__date_rng.maxval)
     
     @property
     def jobs(self) -> tuple[Job, ...]:
@@ -91,26 +109,14 @@ class JetSched(HasID[int], SuperImmut,
         return tuple(self.__jobs)
     
     def copy(self):
-        return JetSched(self.__date_rng, prev_sched=self.__init_sched)
+        return JetSched(self.__date_rng, prev_sched=self.__init_sched, calendar=self.__calendar)
     
     def get_needed_strip(self, item: fabric.FabricStyle):
-        strip_id = item.get_strip(self.soil_level)
-        strip = None if strip_id is None else fabric.get_style(strip_id)
-        if strip is None and (self.jobs_since_strip >= 9 or \
-            self.full_sched and item.color.shade == fabric.color.LIGHT and \
-            self.full_sched[-1].color.shade == fabric.color.BLACK):
-            strip = fabric.get_style('STRIP')
-        
-        return strip
+        last_job = self.__jobs[-1] if self.__jobs else None
+        return _needed_strip(item, self.soil_level, self.jobs_since_strip, last_job)
     
     def can_add(self, lots: tuple[DyeLot, ...]):
-        total_cycle = lots[0].cycle_time - dt.timedelta(hours=4)
-        strip = self.get_needed_strip(lots[0].item)
-
-        if not strip is None:
-            total_cycle += strip.cycle_time
-        
-        return total_cycle <= self.rem_time
+        return _can_add(self, lots)
     
     def add_job(self, job: Job, force = False):
         if not force and job.start + dt.timedelta(minutes=1) < self.last_job_end:
@@ -123,22 +129,46 @@ class JetSched(HasID[int], SuperImmut,
             self.__jss = 0
         else:
             self.__jss += 1
+            self.__reg_pos.append(len(self.__jobs) - 1)
 
         self.__soil += job.color.soil
         self.__soil = max(self.__soil, 0)
+        self.__states.append((self.__soil, self.__jss))
 
     def add_lots(self, lots: tuple[DyeLot, ...], idx: int):
         strip = self.get_needed_strip(lots[0].item)
         if not strip is None:
             strip_job = Job([DyeLot.new_strip(strip, self.last_job_end)], self.last_job_end)
             self.add_job(strip_job)
-        min_date = max(map(lambda l: l.min_date, lots))
-        if min_date.weekday() == 6:
-            min_date += dt.timedelta(days=1)
-        new_job = Job(lots, max(min_date, self.last_job_end), idx=idx)
+        new_job = Job(lots, _lots_start(lots, self.last_job_end), idx=idx)
         self.add_job(new_job)
         return new_job
     
+    def prefix_len(self, idx: int):
+        if idx == 0:
+            return 0
+        return self.__reg_pos[idx-1] + 1
+    
+    def state_at(self, n: int) -> tuple[int, int, Job | None]:
+        soil, jss = self.__states[n]
+        return soil, jss, (self.__jobs[n-1] if n > 0 else None)
+    
+    def probe_insert(self, lots: tuple[DyeLot, ...], idx: int):
+        n_prefix = self.prefix_len(idx)
+        probe = SchedProbe(self, lots, idx, n_prefix, *self.state_at(n_prefix), self.__date_rng)
+
+        min_date = max(map(lambda l: l.min_date, lots))
+        if not probe.can_add(lots) or (probe.last_job_end < min_date and \
+            idx < len(self.__reg_pos)):
+            return None
+        
+        probe.add_lots(lots)
+        for pos in self.__reg_pos[idx:]:
+            job_lots = tuple(self.__jobs[pos].lots)
+            if probe.can_add(job_lots):
+                probe.add_lots(job_lots)
+        return probe
+    
     def activate(self):
         for job in self.jobs:
             job.activate()
@@ -156,4 +186,133 @@ class JetSched(HasID[int], SuperImmut,
                 if lot.greige not in avail:
                     avail[lot.greige] = []
                 avail[lot.greige] += list(lot.ports)
-        return avail
\ No newline at end of file
+        return avail
+
+class JobPlan(NamedTuple):
+    item: fabric.FabricStyle
+    lots: tuple[DyeLot, ...]
+    start: dt.datetime
+    end: dt.datetime
+
+    @property
+    def greige(self):
+        return self.item.greige
+    
+    @property
+    def color(self):
+        return self.item.color
+    
+    @property
+    def shade(self):
+        return self.item.color.shade
+    
+    def activate(self):
+        Job.start_lots(self.lots, self.start)
+    
+    def deactivate(self):
+        Job.start_lots(self.lots, None)
+
+class SchedProbe:
+
+    def __init__(self, base: JetSched, lots: tuple[DyeLot, ...], idx: int, n_prefix: int,
+                 soil: int, jss: int, prefix_last: Job | None, date_rng: DateRange):
+        self.base = base
+        self.lots = lots
+        self.idx = idx
+        self.n_prefix = n_prefix
+        self.prefix_last = prefix_last
+        self.plans: list[JobPlan] = []
+        self.soil = soil
+        self.jss = jss
+        self.date_rng = date_rng
+
+    def __repr__(self):
+        return f'SchedProbe(base={self.base}, lots=[{', '.join([l.id for l in self.lots])}], idx={self.idx})'
+
+    @property
+    def soil_level(self):
+        return self.soil
+    
+    @property
+    def jobs_since_strip(self):
+        return self.jss
+    
+    @property
+    def last_job(self) -> Job | JobPlan | None:
+        if self.plans:
+            return self.plans[-1]
+        return self.prefix_last
+    
+    @property
+    def last_job_end(self):
+        last_job = self.last_job
+        if last_job is None:
+            return _skip_weekend(self.date_rng.minval)
+        return _skip_weekend(last_job.end)
+    
+    @property
+    def rem_time(self):
+        return self.base.calendar.work_time(self.last_job_end, self.date_rng.maxval)
+    
+    @property
+    def jobs(self) -> tuple[Job | JobPlan, ...]:
+        filt_func: Callable[[Job | JobPlan], bool] = \
+            lambda j: j.color.shade not in (color.STRIP, color.HEAVYSTRIP)
+        return tuple(filter(filt_func, self.full_sched))
+    
+    @property
+    def prefix(self) -> tuple[Job, ...]:
+        return self.base.full_sched[:self.n_prefix]
+    
+    @property
+    def full_sched(self) -> tuple[Job | JobPlan, ...]:
+        return self.prefix + tuple(self.plans)
+    
+    def get_needed_strip(self, item: fabric.FabricStyle):
+        return _needed_strip(item, self.soil, self.jss, self.last_job)
+    
+    def can_add(self, lots: tuple[DyeLot, ...]):
+        return _can_add(self, lots)
+    
+    def _advance(self, job: Job | JobPlan):
+        if job.shade in (color.STRIP, color.HEAVYSTRIP):
+            self.jss = 0
+        else:
+            self.jss += 1
+        self.soil = max(self.soil + job.color.soil, 0)
+
+    def _add_plan(self, plan: JobPlan):
+        self.plans.append(plan)
+        self._advance(plan)
+
+    def add_lots(self, lots: tuple[DyeLot, ...]):
+        strip = self.get_needed_strip(lots[0].item)
+        if not strip is None:
+            lje = self.last_job_end
+            self._add_plan(JobPlan(strip, tuple(), lje, lje + strip.cycle_time))
+        start = _lots_start(lots, self.last_job_end)
+        plan = JobPlan(lots[0].item, lots, start, start + lots[0].cycle_time)
+        self._add_plan(plan)
+        return plan
+    
+    def build(self) -> tuple[JetSched, list[Job]]:
+        newsched = self.base.copy()
+        for job in self.prefix:
+            newsched.add_job(job)
+        
+        newjobs: list[Job] = []
+        for plan in self.plans:
+            if not plan.lots:
+                newsched.add_job(Job([DyeLot.new_strip(plan.item, plan.start)], plan.start))
+                continue
+            newjobs.append(Job(plan.lots, plan.start, idx=-1 if newjobs else self.idx))
+            newsched.add_job(newjobs[-1])
+        return newsched, newjobs
+    
+    def activate(self):
+        for job in self.jobs:
+            job.activate()
+    
+    def deactivate(self):
+        for job in self.jobs:
+            job.deactivate()
\ No newline at end of file
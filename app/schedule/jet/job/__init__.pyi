@@ -1,3 +1,4 @@
+from typing import Iterable
 import datetime as dt
 from app.style import GreigeStyle, FabricStyle
 from app.style.fabric.color import Color, ShadeGrade
@@ -12,5 +13,9 @@ class Job:
     start: dt.datetime
     end: dt.datetime
     def __init__(self, dyelots: list[DyeLot], start: dt.datetime, idx: int | None = None) -> None: ...
+    @staticmethod
+    def start_lots(lots: 'Iterable[DyeLot]', start: dt.datetime | None) -> None:
+        """Sets the start date of the given lots (None to unschedule them)."""
+        ...
     def activate(self) -> None: ...
     def deactivate(self) -> None: ...
\ No newline at end of file
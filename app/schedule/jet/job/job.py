@@ -27,12 +27,15 @@ class Job:
         self.color = self.lots[0].color
         self.shade = self.lots[0].shade
 
+    @staticmethod
+    def start_lots(lots, start: datetime | None):
+        for lot in lots:
+            lot.start = start
+
     def activate(self):
-        for lot in self.lots:
-            lot.start = self.start
+        Job.start_lots(self.lots, self.start)
         
     def deactivate(self):
-        for lot in self.lots:
-            lot.start = None
+        Job.start_lots(self.lots, None)
 
 
@@ -3,6 +3,6 @@
 from . import color
 from .color import Color
 from .fabric import FabricStyle
-from .styles import init, get_style
+from .styles import init, get_style, get_styles
 
-__all__ = ['color', 'Color', 'FabricStyle', 'init', 'get_style']
\ No newline at end of file
+__all__ = ['color', 'Color', 'FabricStyle', 'init', 'get_style', 'get_styles']
\ No newline at end of file
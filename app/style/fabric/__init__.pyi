@@ -66,4 +66,11 @@ def get_style(id: str) -> FabricStyle | None:
     """
     Returns the FabricStyle object with the given id, or None if it does not exist.
     """
+    ...
+
+def get_styles() -> list[FabricStyle]:
+    """
+    Returns every loaded FabricStyle object, including the strip and
+    empty cycles.
+    """
     ...
\ No newline at end of file
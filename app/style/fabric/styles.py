@@ -44,4 +44,7 @@ def init():
 def get_style(id):
     if id not in globals()['_FABRIC_STYLES']:
         return None
-    return globals()['_FABRIC_STYLES'][id]
\ No newline at end of file
+    return globals()['_FABRIC_STYLES'][id]
+
+def get_styles():
+    return list(globals()['_FABRIC_STYLES'].values())
\ No newline at end of file
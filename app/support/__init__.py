@@ -3,8 +3,10 @@
 from .supers import *
 from .protocols import *
 from .range import *
+from .exactsum import *
+from .worktime import *
 from . import grouped, logging
 
 __all__ = ['SuperImmut', 'SuperView', 'setter_like', 'HasID', 'grouped',
            'ContRange', 'FloatRange', 'DateRange', 'min_float_rng', 'max_float_rng',
-           'logging']
\ No newline at end of file
+           'ExactSum', 'WorkCalendar', 'logging']
\ No newline at end of file
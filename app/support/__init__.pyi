@@ -3,4 +3,6 @@ from app.support.supers import SuperImmut as SuperImmut, SuperView as SuperView,
 from app.support.protocols import HasID as HasID
 from app.support.range import ContRange as ContRange, FloatRange as FloatRange, DateRange as DateRange, \
     min_float_rng as min_float_rng, max_float_rng as max_float_rng
+from app.support.exactsum import ExactSum as ExactSum
+from app.support.worktime import WorkCalendar as WorkCalendar
 from app.support import grouped as grouped, logging as logging
\ No newline at end of file
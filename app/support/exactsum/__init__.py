@@ -0,0 +1,5 @@
+#!/usr/bin/env python
+
+from .exactsum import ExactSum
+
+__all__ = ['ExactSum']
\ No newline at end of file
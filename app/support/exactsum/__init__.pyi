@@ -0,0 +1,28 @@
+class ExactSum:
+    """
+    A running total of floats that is kept exactly, so its value does
+    not depend on the order values were added or removed in. Reading
+    the value rounds the exact total once.
+    """
+    def __init__(self, *vals: float) -> None:
+        """
+        Initialize a new ExactSum object.
+
+            vals:
+              The starting values of the total.
+        """
+        ...
+    def __repr__(self) -> str: ...
+    def copy(self) -> 'ExactSum':
+        """Returns a new ExactSum with the same total."""
+        ...
+    @property
+    def value(self) -> float:
+        """The total, correctly rounded to the nearest float."""
+        ...
+    def add(self, val: float) -> None:
+        """Adds a value to the total."""
+        ...
+    def sub(self, val: float) -> None:
+        """Removes a value from the total."""
+        ...
\ No newline at end of file
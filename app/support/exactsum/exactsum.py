@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+
+_SCALE = 1074
+
+class ExactSum:
+
+    def __init__(self, *vals: float):
+        self.__total = 0
+        for val in vals:
+            self.add(val)
+    
+    def __repr__(self):
+        return f'ExactSum({self.value})'
+    
+    def copy(self):
+        other = ExactSum()
+        other.__total = self.__total
+        return other
+    
+    @property
+    def value(self):
+        return self.__total / (1 << _SCALE)
+    
+    def add(self, val: float):
+        num, den = float(val).as_integer_ratio()
+        self.__total += num << (_SCALE - den.bit_length() + 1)
+    
+    def sub(self, val: float):
+        num, den = float(val).as_integer_ratio()
+        self.__total -= num << (_SCALE - den.bit_length() + 1)
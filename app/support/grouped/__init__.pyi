@@ -2,7 +2,7 @@ from app.support.grouped.data import Data as Data, DataView as DataView, match_p
     repr_props as repr_props
 from app.support.grouped.atom import Atom as Atom
 
-from typing import Hashable, Unpack, Generator
+from typing import Hashable, Unpack, Generator, Callable, Any
 from app.support import SuperImmut, SuperView
 
 class Grouped[T: Hashable, U: Hashable](SuperImmut):
@@ -76,13 +76,32 @@ class Grouped[T: Hashable, U: Hashable](SuperImmut):
         """Returns a generator of the individual items contained in this Grouped object."""
         ...
     def get(self, id: T) -> DataView[T]:
-        """Get the view of a Data object by its id."""
+        """Get the view of a Data object by its id, without walking the subgroups."""
         ...
     def add(self, data: Data[T]) -> None:
         """Add the provided data to this object."""
         ...
     def remove(self, dview: DataView[T], remkey: bool = False) -> Data[T]:
-        """Remove data from this object using its view."""
+        """
+        Remove data from this object using its view. Subgroups left empty
+        are dropped from iteration; unless 'remkey' is True they keep their
+        position, so data added back under the same key returns to it.
+        """
+        ...
+    def _leaf(self, id: T) -> Atom[T]: ...
+    def _revive(self, subkey: U, data: Data[T]) -> 'Grouped[T] | Atom[T]': ...
+    def _prune(self, subkey: U, remkey: bool) -> None: ...
+    def _update(self, dview: DataView[T], func: Callable[[Data[T]], Any]) \
+        -> tuple[Data[T], Any, bool]: ...
+    def update[R](self, dview: DataView[T], func: Callable[[Data[T]], R]) -> R:
+        """
+        Mutate the viewed data in place by calling 'func' on it and
+        return the result. The data only moves between subgroups if
+        one of its grouping attributes changed, in which case it ends
+        up where 'remove' and 'add' would have put it. Raises a
+        ValueError, after removing the data, if it no longer has this
+        object's bound attributes.
+        """
         ...
     def view(self) -> 'GroupedView[T, U]':
         """Returns a live, read-only view of this object."""
@@ -102,7 +121,7 @@ class GroupedView[T: Hashable, U: Hashable](SuperView[Grouped[T, U]]):
               and 'depth' are added automatically.
             funcs:
               The functions of the viewed object. 'make_group', 'iterkeys',
-              'itervalues', 'get', 'add', and 'remove' are added
+              'itervalues', 'get', 'add', 'remove', and 'update' are added
               automatically.
             dunders:
               The "dunder" or "magic" functions to use from the viewed type.
@@ -160,4 +179,7 @@ class GroupedView[T: Hashable, U: Hashable](SuperView[Grouped[T, U]]):
         ...
     def remove(self, dview: DataView[T]) -> Data[T]:
         """Remove data from this object using its view."""
+        ...
+    def update[R](self, dview: DataView[T], func: Callable[[Data[T]], R]) -> R:
+        """Mutate the viewed data in place; see Grouped.update."""
         ...
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Hashable, Unpack, Generator
+from typing import Hashable, Unpack, Generator, Callable, Any
 from app.support import SuperImmut
 from app.support.grouped import Data, DataView
 
@@ -63,9 +63,18 @@ class Atom[T: Hashable](SuperImmut, attrs=('depth','n_items'), priv_attrs=('prop
     def get(self, id: T) -> DataView[T]:
         """Get the view of a Data object by its id."""
         ...
+    def _leaf(self, id: T) -> 'Atom[T]': ...
     def add(self, data: Data[T]) -> None:
         """Add the provided data to this object."""
         ...
     def remove(self, dview: DataView[T], remkey: bool = False) -> Data[T]:
         """Remove data from this object using its view."""
+        ...
+    def _update(self, dview: DataView[T], func: Callable[[Data[T]], Any]) \
+        -> tuple[Data[T], Any, bool]:
+        """
+        Call 'func' on the data outside of the group. If the data no
+        longer has this atom's restricted attributes it is dropped and
+        the third element of the result is True.
+        """
         ...
\ No newline at end of file
@@ -73,6 +73,9 @@ class Atom[T: Hashable](SuperImmut, attrs=('depth','n_items'), priv_attrs=('prop
             raise ValueError(f'Object does not contain data with id={repr(id)}')
         return self.__data.view()
     
+    def _leaf(self, id: T):
+        return self
+
     def add(self, data: Data[T]):
         if not match_props(data, self.__props):
             msg = 'All data in this atom must have the following properties:\n'
@@ -84,6 +87,22 @@ class Atom[T: Hashable](SuperImmut, attrs=('depth','n_items'), priv_attrs=('prop
         data._set_in_group(True)
         self.__data = data
 
+    def _update(self, dview: DataView[T], func):
+        if len(self) == 0 or self.__data != dview:
+            raise ValueError(f'Object does not contain data with id={repr(dview.id)}')
+        data = self.__data
+        data._set_in_group(False)
+        try:
+            ret = func(data)
+        except BaseException:
+            data._set_in_group(True)
+            raise
+        if not match_props(data, self.__props):
+            self.__data = None
+            return data, ret, True
+        data._set_in_group(True)
+        return data, ret, False
+
     def remove(self, dview: DataView[T], remkey = False):
         if len(self) == 0 or self.__data != dview:
             raise ValueError(f'Object does not contain data with id={repr(dview.id)}')
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 from typing import Hashable, Unpack
+import bisect
 
 from ..supers import SuperImmut, SuperView, setter_like
 from .atom import Atom
@@ -9,7 +10,9 @@ from .data import Data, DataView, match_props, repr_props
 class Grouped[T: Hashable, U: Hashable](SuperImmut):
     
     def __init_subclass__(cls, attrs = tuple(), priv_attrs = tuple(), frozen = tuple()):
-        privs = tuple(map(lambda a: f'_Grouped__{a}', ['ids_map','props','unbound','groups','view']))
+        privs = tuple(map(lambda a: f'_Grouped__{a}', ['ids_map','props','unbound','groups','view',
+                                                       'seqs','order','dormant','n_seq',
+                                                       'count']))
         priv_frozen = tuple(map(lambda a: f'_Grouped__{a}', ['unbound','props','view']))
         super().__init_subclass__(attrs=('n_items','depth')+privs+attrs,
                                   priv_attrs=priv_attrs, frozen=priv_frozen+frozen)
@@ -25,28 +28,28 @@ class Grouped[T: Hashable, U: Hashable](SuperImmut):
             raise ValueError(msg)
         
         SuperImmut.__init__(self, _Grouped__ids_map={}, _Grouped__props=kwargs,
-                            _Grouped__unbound=args, _Grouped__groups={}, _Grouped__view=view)
+                            _Grouped__unbound=args, _Grouped__groups={}, _Grouped__view=view,
+                            _Grouped__seqs={}, _Grouped__order=[], _Grouped__dormant={},
+                            _Grouped__n_seq=0,
+                            _Grouped__count=0)
     
     def __len__(self):
-        groups: dict[U, 'Grouped[T] | Atom[T]'] = self.__groups
-        return sum(map(lambda grp: 0 if len(grp) == 0 else 1, groups.values()))
+        return len(self.__groups)
     
     def __iter__(self):
-        groups: dict[U, 'Grouped[T] | Atom[T]'] = self.__groups
-        for key in groups:
-            if len(groups[key]) > 0:
-                yield key
+        order: list[tuple[int, U]] = self.__order
+        for _, key in order:
+            yield key
 
     def __contains__(self, key):
-        groups: dict[U, 'Grouped[T] | Atom[T]'] = self.__groups
-        return key in groups and len(groups[key]) > 0
+        return key in self.__groups
     
     def __getitem__(self, key):
         if not type(key) is tuple:
             key = (key,)
         if len(key) == 0:
             return self.view()
-        if key[0] not in self.__groups or len(self.__groups[key[0]]) == 0:
+        if key[0] not in self.__groups:
             raise KeyError(f'Object does not contain items with {self.__unbound[0]}={repr(key[0])}')
         try:
             return self.__groups[key[0]][key[1:]]
@@ -59,9 +62,11 @@ class Grouped[T: Hashable, U: Hashable](SuperImmut):
     
     def __repr__(self):
         contents: list[str] = []
+        if not self.__groups:
+            return ''
 
         if self.depth == 1:
-            for val in self.__groups.values():
+            for _, val in self._items():
                 vrep = repr(val)
                 if not vrep: continue
                 contents.append('  ' + vrep)
@@ -69,8 +74,7 @@ class Grouped[T: Hashable, U: Hashable](SuperImmut):
             max_k = max(map(lambda k: len(repr(k)), self.__groups.keys()))
             kprefix = ' '*(max_k+4)
 
-            for key, val in self.__groups.items():
-                if len(val) == 0: continue
+            for key, val in self._items():
                 krep = repr(key)
                 vrep = repr(val)
 
@@ -92,36 +96,58 @@ class Grouped[T: Hashable, U: Hashable](SuperImmut):
     
     @property
     def n_items(self):
-        groups: dict[U, 'Grouped[T] | Atom[T]'] = self.__groups
-        return sum(map(lambda grp: grp.n_items, groups.values()))
+        return self.__count
     
     def make_group(self, data: Data[T], **kwargs) -> 'Grouped[T] | Atom[T]':
         raise NotImplementedError()
     
+    def _items(self):
+        groups: dict[U, 'Grouped[T] | Atom[T]'] = self.__groups
+        order: list[tuple[int, U]] = self.__order
+        for _, key in order:
+            yield key, groups[key]
+    
     def iterkeys(self):
-        if self.depth == 1:
-            for key in self:
-                yield (key,)
-        else:
-            for key in self:
-                for remkey in self[key].iterkeys():
-                    yield (key, *remkey)
+        for key, grp in self._items():
+            for remkey in grp.iterkeys():
+                yield (key, *remkey)
     
     def itervalues(self):
-        if self.depth == 1:
-            for key in self:
-                yield self[key]
-        else:
-            for key in self:
-                yield from self[key].itervalues()
+        for _, grp in self._items():
+            yield from grp.itervalues()
     
     def get(self, id: T) -> DataView[T]:
-        groups: dict[U, 'Grouped[T] | Atom[T]'] = self.__groups
-        id_map: dict[T, U] = self.__ids_map
-
+        id_map: dict[T, Atom[T]] = self.__ids_map
         if id not in id_map:
             raise ValueError(f'Object does not contain data with id={repr(id)}')
-        return groups[id_map[id]].get(id)
+        return id_map[id].get(id)
+    
+    def _leaf(self, id: T) -> Atom[T]:
+        return self.__ids_map[id]
+    
+    def _revive(self, subkey: U, data: Data[T]) -> 'Grouped[T] | Atom[T]':
+        groups: dict[U, 'Grouped[T] | Atom[T]'] = self.__groups
+        seqs: dict[U, int] = self.__seqs
+        grp = self.__dormant.pop(subkey, None)
+        if grp is None:
+            grp = self.make_group(data, **self.__props)
+        
+        if subkey not in seqs:
+            self.__n_seq += 1
+            seqs[subkey] = self.__n_seq
+        
+        groups[subkey] = grp
+        bisect.insort(self.__order, (seqs[subkey], subkey), key=lambda e: e[0])
+        return grp
+    
+    def _prune(self, subkey: U, remkey: bool):
+        grp = self.__groups.pop(subkey)
+        order: list[tuple[int, U]] = self.__order
+        del order[bisect.bisect_left(order, self.__seqs[subkey], key=lambda e: e[0])]
+        if remkey:
+            del self.__seqs[subkey]
+        else:
+            self.__dormant[subkey] = grp
     
     @setter_like
     def add(self, data: Data[T]):
@@ -132,23 +158,58 @@ class Grouped[T: Hashable, U: Hashable](SuperImmut):
         
         groups: dict[U, 'Grouped[T] | Atom[T]'] = self.__groups
         subkey: U = getattr(data, self.__unbound[0])
-        if subkey not in groups:
-            groups[subkey] = self.make_group(data, **self.__props)
+        if subkey in groups:
+            grp = groups[subkey]
+            before = grp.n_items
+        else:
+            grp = self._revive(subkey, data)
+            before = 0
         
-        groups[subkey].add(data)
-        self.__ids_map[data.id] = subkey
+        grp.add(data)
+        self.__count += grp.n_items - before
+        self.__ids_map[data.id] = grp._leaf(data.id)
 
     @setter_like
     def remove(self, dview: DataView[T], remkey = False):
         groups: dict[U, 'Grouped[T] | Atom[T]'] = self.__groups
         subkey: U = getattr(dview, self.__unbound[0])
-        if subkey not in groups or len(groups[subkey]) == 0:
+        if subkey not in groups:
             raise ValueError(f'Object does not contain data with {self.__unbound[0]}={repr(subkey)}')
         
         ret = groups[subkey].remove(dview, remkey=remkey)
-        if remkey and len(groups[subkey]) == 0:
-            del groups[subkey]
+        self.__count -= 1
         del self.__ids_map[dview.id]
+        if len(groups[subkey]) == 0:
+            self._prune(subkey, remkey)
+        return ret
+    
+    def _update(self, dview: DataView[T], func):
+        groups: dict[U, 'Grouped[T] | Atom[T]'] = self.__groups
+        subkey: U = getattr(dview, self.__unbound[0])
+        if subkey not in groups:
+            raise ValueError(f'Object does not contain data with {self.__unbound[0]}={repr(subkey)}')
+        
+        data, ret, moved = groups[subkey]._update(dview, func)
+        if not moved:
+            self.__ids_map[data.id] = groups[subkey]._leaf(data.id)
+            return data, ret, False
+        
+        self.__count -= 1
+        del self.__ids_map[data.id]
+        if len(groups[subkey]) == 0:
+            self._prune(subkey, False)
+        if not match_props(data, self.__props):
+            return data, ret, True
+        Grouped.add(self, data)
+        return data, ret, False
+    
+    @setter_like
+    def update(self, dview: DataView[T], func):
+        data, ret, moved = self._update(dview, func)
+        if moved:
+            msg = 'Updated data no longer has the following properties and was removed:\n'
+            msg += repr_props(self.__props)
+            raise ValueError(msg)
         return ret
     
     def view(self) -> 'GroupedView[T, U]':
@@ -158,5 +219,6 @@ class GroupedView[T: Hashable, U: Hashable](SuperView[Grouped[T, U]]):
     
     def __init_subclass__(cls, attrs = tuple(), funcs = tuple(), dunders = tuple()):
         super().__init_subclass__(attrs=('depth','n_items')+attrs,
-                                  funcs=('make_group','iterkeys','itervalues','get','add','remove')+funcs,
+                                  funcs=('make_group','iterkeys','itervalues','get','add','remove',
+                                         'update')+funcs,
                                   dunders=('len','iter','contains','getitem','repr')+dunders)
\ No newline at end of file
@@ -1,7 +1,8 @@
 #!/usr/bin/env python
 
 from .logging import Process, Logger, HasLogger, FailedYield, ProcessDesc, \
-    logged_func, logged_meth, logged_generator
+    logged_func, logged_meth, logged_generator, LogSink, Profile, ProfileStats, OFF, TRACE, ALL
 
-__all__ = ['Process', 'Logger', 'HasLogger', 'FailedYield', 'ProcessDesc',
-           'logged_func', 'logged_meth', 'logged_generator']
\ No newline at end of file
+__all__ = ['Process', 'Logger', 'HasLogger', 'FailedYield', 'ProcessDesc', 'LogSink',
+           'Profile', 'ProfileStats', 'logged_func', 'logged_meth', 'logged_generator', 'OFF',
+           'TRACE', 'ALL']
\ No newline at end of file
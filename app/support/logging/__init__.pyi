@@ -1,6 +1,11 @@
-from typing import Protocol, TypedDict, Callable, Concatenate, Generator
+from typing import Protocol, TypedDict, Callable, Concatenate, Generator, Hashable, Iterable, \
+    Any
 from abc import abstractmethod
 
+OFF: int # record nothing; the logged decorators call straight through
+TRACE: int # record only calls on the target ids and everything they call
+ALL: int # record every call
+
 class Process:
     id: int
     caller: int
@@ -8,17 +13,105 @@ class Process:
     desc1: str
     desc2: str
     desc3: str
+    added: bool # whether this process has been added to a Logger
     def __init__(self, caller: int, name: str) -> None: ...
     def set_desc(self, desc1: str = '', desc2: str = '', desc3: str = '') -> None: ...
 
+class LogSink(Protocol):
+    """Receives the processes recorded by a Logger, in id order."""
+    @abstractmethod
+    def write(self, p: Process) -> None: ...
+    @abstractmethod
+    def close(self) -> None: ...
+
+class ProfileStats:
+    """The aggregated timings of every call to one function."""
+    name: str # the qualified name of the function
+    calls: int
+    wall: float # inclusive wall-clock seconds; recursive calls are counted once
+    self_wall: float # exclusive wall-clock seconds, not counting logged callees
+    cpu: float # inclusive process CPU seconds
+    self_cpu: float # exclusive process CPU seconds
+    def __init__(self, name: str) -> None: ...
+
+class Profile:
+    """
+    Aggregates the time spent in the logged decorators by function
+    name and by call stack. Only totals are kept, so a profile stays
+    small however many calls it sees. A generator is timed while it
+    runs between yields, under the stack of whoever resumed it.
+    """
+    stats: dict[str, ProfileStats]
+    paths: list[tuple[int, str]] # (parent path, name) of each distinct call stack; 0 is the root
+    path_wall: list[float] # exclusive wall-clock seconds spent in each call stack
+    def __init__(self) -> None: ...
+    def enter(self, name: str, call: bool = True) -> None:
+        """
+        Start timing the named function. If 'call' is False, this
+        resumes an earlier call and the call count is left alone.
+        """
+        ...
+    def exit(self) -> None:
+        """Stop timing the innermost function and add its times."""
+        ...
+    def stack(self, path: int) -> str:
+        """The names on the given call stack, outermost first, joined by semicolons."""
+        ...
+    def collapsed(self) -> list[str]:
+        """
+        The exclusive wall time of every call stack in the collapsed
+        stack format read by flame graph tools, in microseconds.
+        """
+        ...
+
 class Logger:
+    """
+    Collects the processes recorded by the logged decorators. Nothing
+    is recorded unless the level is raised above OFF, and the
+    description formatters only run for processes that are recorded.
+    Processes are passed on in id order as soon as no unfinished
+    process can precede them: to the sink if there is one, otherwise
+    to 'processes'.
+    """
     processes: list[Process]
     callers: list[int]
-    def __init__(self) -> None: ...
+    level: int # one of OFF, TRACE or ALL
+    targets: set[Hashable] # the ids traced at level TRACE
+    sink: LogSink | None # where recorded processes are written
+    pending: list[tuple[int, Process]] # heap of processes waiting on earlier ones
+    unadded: list[int] # ids of callers that have not been added yet
+    profile: Profile | None # where the logged decorators add their timings, if anywhere
+    def __init__(self, level: int = OFF, targets: Iterable[Hashable] = (),
+                 sink: LogSink | None = None, profile: Profile | None = None) -> None: ...
+    def configure(self, level: int, targets: Iterable[Hashable] = ()) -> None:
+        """Set the level and the ids to trace at level TRACE."""
+        ...
+    def records(self, args: tuple[Any, ...]) -> bool:
+        """
+        Whether a call with the given arguments should be recorded.
+        At level TRACE, a call is recorded if it is nested in a recorded
+        call or one of its arguments has an id in 'targets'.
+        """
+        ...
+    def set_profile(self, profile: Profile | None) -> None:
+        """
+        Time every logged call in the given profile, independent of
+        the level, or stop profiling if it is None.
+        """
+        ...
+    def set_sink(self, sink: LogSink | None) -> None:
+        """Flush the pending processes and write later ones to the given sink."""
+        ...
     def add_process(self, p: Process) -> None: ...
     def push_caller(self, p: Process) -> None: ...
     def pop_caller(self) -> int: ...
     def peek_caller(self) -> int: ...
+    def flush(self) -> None:
+        """Pass on all pending processes, even if earlier ones are unfinished."""
+        ...
+    def close(self) -> None:
+        """Flush and close the sink."""
+        ...
 
 class HasLogger(Protocol):
     @classmethod
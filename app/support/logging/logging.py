@@ -2,9 +2,14 @@
 
 from typing import Protocol, Callable, Generator, Any
 from abc import abstractmethod
+import heapq, time
 
 _CTR = 0
 
+OFF = 0
+TRACE = 1
+ALL = 2
+
 class Process:
 
     def __init__(self, caller, name):
@@ -13,40 +18,168 @@ class Process:
         self.caller = caller
         self.name = name
         self.desc1, self.desc2, self.desc3 = '', '', ''
+        self.added = False
 
     def set_desc(self, desc1 = '', desc2 = '', desc3 = ''):
         self.desc1 = desc1
         self.desc2 = desc2
         self.desc3 = desc3
 
-class Logger:
+class LogSink(Protocol):
+
+    @abstractmethod
+    def write(self, p: Process):
+        raise NotImplementedError()
     
+    @abstractmethod
+    def close(self):
+        raise NotImplementedError()
+
+class ProfileStats:
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.wall = 0.0
+        self.self_wall = 0.0
+        self.cpu = 0.0
+        self.self_cpu = 0.0
+
+    def __repr__(self):
+        return f'ProfileStats(name={repr(self.name)}, calls={self.calls}, wall={self.wall:.3f})'
+
+class Profile:
+
     def __init__(self):
+        self.stats: dict[str, ProfileStats] = {}
+        self.paths: list[tuple[int, str]] = [(-1, '')]
+        self.path_wall: list[float] = [0.0]
+        self._path_ids: dict[tuple[int, str], int] = {}
+        self._frames: list[list] = []
+        self._active: dict[str, int] = {}
+
+    def enter(self, name, call = True):
+        parent = self._frames[-1][0] if self._frames else 0
+        key = (parent, name)
+        path = self._path_ids.get(key)
+        if path is None:
+            path = len(self.paths)
+            self._path_ids[key] = path
+            self.paths.append(key)
+            self.path_wall.append(0.0)
+        self._active[name] = self._active.get(name, 0) + 1
+        self._frames.append([path, name, call, 0.0, 0.0, time.perf_counter(), time.process_time()])
+
+    def exit(self):
+        wall1, cpu1 = time.perf_counter(), time.process_time()
+        path, name, call, child_wall, child_cpu, wall0, cpu0 = self._frames.pop()
+        wall, cpu = wall1 - wall0, cpu1 - cpu0
+
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = ProfileStats(name)
+        if call:
+            stats.calls += 1
+        self._active[name] -= 1
+        if not self._active[name]:
+            stats.wall += wall
+            stats.cpu += cpu
+        stats.self_wall += wall - child_wall
+        stats.self_cpu += cpu - child_cpu
+        self.path_wall[path] += wall - child_wall
+
+        if self._frames:
+            self._frames[-1][3] += wall
+            self._frames[-1][4] += cpu
+
+    def stack(self, path):
+        names: list[str] = []
+        while path > 0:
+            path, name = self.paths[path]
+            names.append(name)
+        return ';'.join(reversed(names))
+
+    def collapsed(self):
+        lines: list[str] = []
+        for path in range(1, len(self.paths)):
+            usecs = round(self.path_wall[path] * 1e6)
+            if usecs > 0:
+                lines.append(f'{self.stack(path)} {usecs}')
+        return lines
+
+class Logger:
+    
+    def __init__(self, level = OFF, targets = tuple(), sink: LogSink | None = None,
+                 profile: Profile | None = None):
         self.processes: list[Process] = []
         self.callers = [0]
+        self.level = level
+        self.targets = set(targets)
+        self.sink = sink
+        self.pending: list[tuple[int, Process]] = []
+        self.unadded: list[int] = []
+        self.profile = profile
+
+    def configure(self, level, targets = tuple()):
+        self.level = level
+        self.targets = set(targets)
+
+    def records(self, args):
+        if self.level == ALL or len(self.callers) > 1:
+            return True
+        if self.level == TRACE:
+            return any(map(lambda a: getattr(a, 'id', None) in self.targets, args))
+        return False
+
+    def set_profile(self, profile: Profile | None):
+        self.profile = profile
 
-    def _get_insert_idx(self, id: int, lo: int, hi: int):
-        if hi <= lo:
-            return lo
-        
-        mid = int((lo + hi) / 2)
-        if id > self.processes[mid].id:
-            return self._get_insert_idx(id, mid+1, hi)
-        return self._get_insert_idx(id, lo, mid)
+    def set_sink(self, sink: LogSink | None):
+        self.flush()
+        self.sink = sink
+
+    def _emit(self, p: Process):
+        if self.sink is None:
+            self.processes.append(p)
+        else:
+            self.sink.write(p)
+
+    def _drain(self):
+        while self.pending and (not self.unadded or self.pending[0][0] < self.unadded[0]):
+            self._emit(heapq.heappop(self.pending)[1])
 
     def add_process(self, p: Process):
-        idx = self._get_insert_idx(p.id, 0, len(self.processes))
-        self.processes.insert(idx, p)
+        p.added = True
+        if p.id in self.unadded:
+            self.unadded.remove(p.id)
+        heapq.heappush(self.pending, (p.id, p))
+        self._drain()
     
     def push_caller(self, p: Process):
         self.callers.append(p.id)
+        if not p.added:
+            self.unadded.append(p.id)
     
     def pop_caller(self):
-        return self.callers.pop()
+        id = self.callers.pop()
+        if id in self.unadded:
+            self.unadded.remove(id)
+            self._drain()
+        return id
     
     def peek_caller(self):
         return self.callers[-1]
     
+    def flush(self):
+        while self.pending:
+            self._emit(heapq.heappop(self.pending)[1])
+    
+    def close(self):
+        self.flush()
+        if self.sink is not None:
+            self.sink.close()
+            self.sink = None
+    
 class HasLogger(Protocol):
 
     @classmethod
@@ -74,6 +207,20 @@ class FailedYield:
 ProcessDesc = dict
 
 def _log_func_call(lgr: Logger, desc_args, desc_ret, func, *args, **kwargs):
+    prof = lgr.profile
+    if prof is None:
+        return _log_call(lgr, desc_args, desc_ret, func, *args, **kwargs)
+    
+    prof.enter(func.__qualname__)
+    try:
+        return _log_call(lgr, desc_args, desc_ret, func, *args, **kwargs)
+    finally:
+        prof.exit()
+
+def _log_call(lgr: Logger, desc_args, desc_ret, func, *args, **kwargs):
+    if lgr.level == OFF or not lgr.records(args):
+        return func(*args, **kwargs)
+
     callp = Process(lgr.peek_caller(), func.__name__)
     callp.set_desc(**desc_args(*args, **kwargs))
     lgr.add_process(callp)
@@ -101,37 +248,70 @@ def logged_meth(desc_args, desc_ret):
         return wrapper
     return deco
 
+def _skip_failures(gen: Generator[FailedYield | Any]):
+    for val in gen:
+        if isinstance(val, FailedYield): continue
+        yield val
+
+def _log_generator(lgr: Logger, desc_args, desc_yld, func, slf, *args, **kwargs):
+    if not lgr.records((slf, *args)):
+        yield from _skip_failures(func(slf, *args, **kwargs))
+        return
+
+    genp = Process(lgr.peek_caller(), func.__name__)
+    genp.set_desc(**desc_args(slf, *args, **kwargs))
+    lgr.add_process(genp)
+    gen = func(slf, *args, **kwargs)
+
+    while True:
+        nextp = Process(genp.caller, f'next({func.__name__})')
+        lgr.push_caller(nextp)
+
+        try:
+            val = next(gen)
+            lgr.add_process(nextp)
+            valp = Process(nextp.id, '')
+
+            if isinstance(val, FailedYield):
+                valp.name = 'yield_failure'
+                valp.set_desc(**(val.as_dict()))
+                lgr.add_process(valp)
+                lgr.pop_caller()
+                continue
+
+            valp.name = 'yield_value'
+            valp.set_desc(**desc_yld(val))
+            lgr.add_process(valp)
+            lgr.pop_caller()
+            yield val
+        except StopIteration:
+            nextp.name = f'terminate({func.__name__})'
+            lgr.pop_caller()
+            return
+
+def _profile_generator(prof: Profile, name: str, gen: Generator):
+    call = True
+    while True:
+        prof.enter(name, call)
+        call = False
+        try:
+            val = next(gen)
+        except StopIteration:
+            return
+        finally:
+            prof.exit()
+        yield val
+
 def logged_generator(desc_args, desc_yld):
     def deco(func: Callable[[*tuple[Any, ...]], Generator[FailedYield | Any]]):
         def wrapper(slf: HasLogger, *args, **kwargs):
-            genp = Process(slf.logger.peek_caller(), func.__name__)
-            genp.set_desc(**desc_args(slf, *args, **kwargs))
-            slf.logger.add_process(genp)
-            gen = func(slf, *args, **kwargs)
-
-            while True:
-                nextp = Process(genp.caller, f'next({func.__name__})')
-                slf.logger.push_caller(nextp)
-
-                try:
-                    val = next(gen)
-                    slf.logger.add_process(nextp)
-                    valp = Process(nextp.id, '')
-                    slf.logger.add_process(valp)
-
-                    if isinstance(val, FailedYield):
-                        valp.name = 'yield_failure'
-                        valp.set_desc(**(val.as_dict()))
-                        slf.logger.pop_caller()
-                        continue
-
-                    valp.name = 'yield_value'
-                    valp.set_desc(**desc_yld(val))
-                    slf.logger.pop_caller()
-                    yield val
-                except StopIteration:
-                    nextp.name = f'terminate({func.__name__})'
-                    slf.logger.pop_caller()
-                    return
+            lgr = slf.logger
+            if lgr.level == OFF:
+                gen = _skip_failures(func(slf, *args, **kwargs))
+            else:
+                gen = _log_generator(lgr, desc_args, desc_yld, func, slf, *args, **kwargs)
+            if lgr.profile is None:
+                return gen
+            return _profile_generator(lgr.profile, func.__qualname__, gen)
         return wrapper
     return deco
\ No newline at end of file
@@ -26,8 +26,8 @@ class SuperImmut:
             msg += ' not declared as part of private or public attributes'
             raise ValueError(msg)
         
-        cls._attrs = tuple(all_attrs)
-        cls._frozen = tuple(mangled_frz)
+        cls._attrs = frozenset(all_attrs)
+        cls._frozen = frozenset(mangled_frz)
     
     def __init__(self, priv: dict[str] = {}, **kwargs):
         for a, val in priv.items():
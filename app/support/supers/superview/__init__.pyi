@@ -18,7 +18,8 @@ class SuperView[T]:
         Initialize a new subclass of SuperView.
 
             attrs:
-              The viewed attributes of the linked object.
+              The viewed attributes of the linked object. Each one becomes a
+              read-only property on the subclass.
             funcs:
               The functions of the viewed object.
             dunders:
@@ -32,4 +33,11 @@ class SuperView[T]:
             link:
               The viewed object.
         """
+        ...
+    def __reduce__(self) -> tuple[type, tuple[T]]:
+        """
+        Pickle views by their linked object, so that a view is rebuilt
+        around its (possibly still unpickling) link rather than from its
+        own state.
+        """
         ...
\ No newline at end of file
@@ -2,16 +2,24 @@
 
 def _copy_link_func(name: str):
     def func(slf, *args, **kwargs):
-        lnk = object.__getattribute__(slf, '_link')
-        lnk_func = getattr(lnk, name)
-        if hasattr(lnk_func, '_setter_like') and lnk_func._setter_like == 1:
+        lnk_func = getattr(slf._link, name)
+        if getattr(lnk_func, '_setter_like', 0) == 1:
             cls = type(slf)
             raise RuntimeError(f'\'{cls.__name__}\' objects cannot call methods that mutate the objects they view')
         return lnk_func(*args, **kwargs)
     return func
 
+def _copy_link_attr(name: str):
+    def fget(slf):
+        return getattr(slf._link, name)
+    def fset(slf, value):
+        raise AttributeError(f'\'{name}\' is a viewed attribute on another object')
+    return property(fget, fset)
+
 class SuperView[T]:
 
+    __slots__ = ('_link',)
+
     def __init_subclass__(cls, attrs: tuple[str, ...] = tuple(), funcs: tuple[str, ...] = tuple(),
                           dunders: tuple[str, ...] = tuple()):
         super().__init_subclass__()
@@ -21,22 +29,11 @@ class SuperView[T]:
 
         for name in cls._funcs + cls._dunders:
             setattr(cls, name, _copy_link_func(name))
+        for name in cls._attrs:
+            setattr(cls, name, _copy_link_attr(name))
     
     def __init__(self, link: T):
-        super(SuperView, self).__setattr__('_link', link)
-    
-    def __getattribute__(self, name: str):
-        if name in ('_attrs', '_funcs', '_dunders'):
-            return super(SuperView, self).__getattribute__(name)
-        
-        lnk = super(SuperView, self).__getattribute__('_link')
-        attrs = super(SuperView, self).__getattribute__('_attrs')
-
-        if name in attrs:
-            return getattr(lnk, name)
-        return super(SuperView, self).__getattribute__(name)
+        self._link = link
     
-    def __setattr__(self, name: str, value):
-        if name in type(self)._attrs:
-            raise AttributeError(f'\'{name}\' is a viewed attribute on another object')
-        super(SuperView, self).__setattr__(name, value)
\ No newline at end of file
+    def __reduce__(self):
+        return (type(self), (self._link,))
\ No newline at end of file
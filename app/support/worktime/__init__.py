@@ -0,0 +1,5 @@
+#!/usr/bin/env python
+
+from .worktime import WorkCalendar
+
+__all__ = ['WorkCalendar']
\ No newline at end of file
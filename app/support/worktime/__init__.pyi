@@ -0,0 +1,15 @@
+import datetime as dt
+
+class WorkCalendar:
+    """
+    Working time on a jet. Sundays are always unavailable. The
+    Sunday time between two dates is computed in closed form, so
+    lookups do not depend on how far apart the dates are.
+    """
+    def __repr__(self) -> str: ...
+    def work_time(self, start: dt.datetime, end: dt.datetime) -> dt.timedelta:
+        """
+        The available time between 'start' and 'end'. Negative if
+        'end' is before 'start'.
+        """
+        ...
\ No newline at end of file
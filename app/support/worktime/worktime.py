@@ -0,0 +1,21 @@
+#!/usr/bin/env python
+
+import datetime as dt
+
+_DAY = dt.timedelta(days=1)
+_WEEK = dt.timedelta(days=7)
+_SUNDAY = dt.datetime(2023, 1, 1)
+
+def _sunday_time(date: dt.datetime):
+    weeks, rem = divmod(date - _SUNDAY, _WEEK)
+    return weeks*_DAY + min(rem, _DAY)
+
+class WorkCalendar:
+    
+    def __repr__(self):
+        return 'WorkCalendar()'
+    
+    def work_time(self, start: dt.datetime, end: dt.datetime):
+        if end <= start:
+            return end - start
+        return (end - start) - (_sunday_time(end) - _sunday_time(start))
\ No newline at end of file
@@ -0,0 +1,10 @@
+#!/usr/bin/env python
+
+from .generate import Tier, TIERS, Scenario, pick_items, make_roll, make_inventory, \
+    make_demand, make_jets, make_scenario
+from .stages import StageStats, StageTimer
+from .run import STAGES, run_scenario, format_report
+
+__all__ = ['Tier', 'TIERS', 'Scenario', 'pick_items', 'make_roll', 'make_inventory',
+           'make_demand', 'make_jets', 'make_scenario', 'StageStats', 'StageTimer', 'STAGES',
+           'run_scenario', 'format_report']
\ No newline at end of file
@@ -0,0 +1,121 @@
+from typing import NamedTuple
+from types import ModuleType
+import random, datetime as dt
+from app.style import GreigeStyle, FabricStyle
+from app.materials import Inventory, Roll
+from app.schedule import Req, Demand, Jet
+
+class Tier(NamedTuple):
+    """A scaling tier for the benchmarks."""
+    name: str
+    n_rolls: int # the number of greige rolls in inventory
+    n_orders: int # the number of orders in the demand
+
+TIERS: dict[str, Tier] # the standard tiers: small, medium and large
+
+class Scenario(NamedTuple):
+    """Everything 'make_schedule' needs for one synthetic run."""
+    tier: Tier
+    inv: Inventory
+    reqs: list[Req]
+    dmnd: Demand
+    jets: list[Jet]
+    start: dt.datetime # the Monday the run is scheduled from
+    end: dt.datetime # the last date the jets accept new jobs
+
+def pick_items(rng: random.Random, n_orders: int) -> list[FabricStyle]:
+    """
+    Picks enough fabric items at random to spread 'n_orders' orders
+    about ten to an item.
+    """
+    ...
+
+def make_roll(rng: random.Random, num: int, grg: GreigeStyle, start: dt.datetime) -> Roll:
+    """
+    Makes a random roll of the given greige style. Most rolls are
+    full-sized; the rest are port-sized, partial or oversized rolls.
+    About 30% of them arrive during the first two weeks after 'start'.
+    """
+    ...
+
+def make_inventory(rng: random.Random, greiges: list[GreigeStyle], n_rolls: int,
+                   start: dt.datetime) -> Inventory:
+    """
+    Makes an Inventory of 'n_rolls' random rolls spread evenly over
+    the given greige styles.
+    """
+    ...
+
+def make_demand(rng: random.Random, items: list[FabricStyle], n_orders: int,
+                start: dt.datetime) -> tuple[list[Req], Demand]:
+    """
+    Makes one Req per item with 'n_orders' orders in total between
+    them. Orders are due on distinct weekdays from one week before
+    'start' to five weeks after it.
+    """
+    ...
+
+def make_jets(start: dt.datetime, end: dt.datetime) -> list[Jet]:
+    """
+    Makes a fresh, empty set of jets from the jet table with new
+    schedules initialized.
+    """
+    ...
+
+def make_scenario(tier: Tier, start: dt.datetime, seed: int = 0,
+                  weeks: int = 3) -> Scenario:
+    """
+    Generates a reproducible Scenario for the given tier.
+
+        tier:
+          The number of rolls and orders to generate.
+        start:
+          The Monday to schedule from.
+        seed: (default 0)
+          The seed for the random generator.
+        weeks: (default 3)
+          The number of weeks the jets accept new jobs for.
+    """
+    ...
+
+class StageStats:
+    """The accumulated measurements of one stage."""
+    name: str
+    calls: int # the number of calls to the stage
+    wall: float # the total wall time spent in the stage, in seconds
+    peak: int # the peak memory traced above the stage's starting memory, in bytes
+    def __init__(self, name: str) -> None: ...
+
+class StageTimer:
+    """
+    Wraps the named module-level functions of a module for the
+    duration of a 'with' block and accumulates their call counts,
+    wall times and peak traced memory. Callers look these functions
+    up through the module globals, so nested stages are timed as
+    well. Tracing memory slows every stage down, so wall times are
+    only comparable between runs that agree on 'memory'.
+    """
+    module: ModuleType
+    stats: dict[str, StageStats]
+    memory: bool
+    peak: int # the peak memory traced during the whole block, in bytes
+    def __init__(self, module: ModuleType, names: tuple[str, ...],
+                 memory: bool = True) -> None: ...
+    def __enter__(self) -> StageTimer: ...
+    def __exit__(self, *exc) -> bool: ...
+
+STAGES: tuple[str, ...] # the scheduler functions that are timed
+
+def run_scenario(scen: Scenario, memory: bool = True, output: bool = True) \
+    -> tuple[dict[str, StageStats], int]:
+    """
+    Schedules the scenario and, if 'output' is True, writes the
+    results to a temporary Excel workbook. Returns the measurements
+    of each stage and the overall peak traced memory in bytes.
+    """
+    ...
+
+def format_report(scen: Scenario, stats: dict[str, StageStats], peak: int,
+                  memory: bool = True) -> str:
+    """Formats the measurements of one run as a table."""
+    ...
\ No newline at end of file
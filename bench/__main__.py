@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+
+import sys, argparse
+
+import scheduler
+from .generate import TIERS, make_scenario
+from .run import run_scenario, format_report
+
+def main(argv: list[str]):
+    parser = argparse.ArgumentParser(prog='python -m bench',
+                                     description='Times the scheduling pipeline on synthetic data.')
+    parser.add_argument('tiers', nargs='*', choices=list(TIERS))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-memory', action='store_true',
+                        help='skip memory tracing, which slows every stage down')
+    parser.add_argument('--no-output', action='store_true',
+                        help='skip writing the Excel output')
+    args = parser.parse_args(argv)
+
+    for name in args.tiers or ('small', 'medium'):
+        scen = make_scenario(TIERS[name], scheduler.MONDAY, seed=args.seed)
+        stats, peak = run_scenario(scen, memory=not args.no_memory, output=not args.no_output)
+        print(format_report(scen, stats, peak, memory=not args.no_memory), flush=True)
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
\ No newline at end of file
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+
+from typing import NamedTuple
+import random, datetime as dt
+
+from app import style
+from app.style import GreigeStyle, FabricStyle
+from app.materials import roll, Inventory, Roll
+from app.schedule import Req, Demand, Jet, jet
+
+class Tier(NamedTuple):
+    name: str
+    n_rolls: int
+    n_orders: int
+
+TIERS = {
+    'small': Tier('small', 100, 50),
+    'medium': Tier('medium', 1000, 500),
+    'large': Tier('large', 10000, 5000)
+}
+
+class Scenario(NamedTuple):
+    tier: Tier
+    inv: Inventory
+    reqs: list[Req]
+    dmnd: Demand
+    jets: list[Jet]
+    start: dt.datetime
+    end: dt.datetime
+
+_ORDERS_PER_ITEM = 10
+_BUCKET_YDS = (400, 800, 1500, 3000, 5000)
+
+def pick_items(rng: random.Random, n_orders: int) -> list[FabricStyle]:
+    style.greige.init()
+    style.fabric.init()
+
+    items = [f for f in style.fabric.get_styles() if f.greige.id != 'NONE']
+    n_items = min(len(items), max(1, -(-n_orders // _ORDERS_PER_ITEM)))
+    return sorted(rng.sample(items, n_items), key=lambda f: f.id)
+
+def make_roll(rng: random.Random, num: int, grg: GreigeStyle, start: dt.datetime) -> Roll:
+    r = rng.random()
+    if r < 0.6:
+        lbs = rng.uniform(grg.roll_rng.minval, grg.roll_rng.maxval)
+    elif r < 0.75:
+        lbs = rng.uniform(grg.port_rng.minval, grg.port_rng.maxval)
+    elif r < 0.9:
+        lbs = rng.uniform(60, grg.port_rng.minval)
+    else:
+        lbs = rng.uniform(grg.roll_rng.maxval, grg.roll_rng.maxval*1.4)
+
+    avail_date = dt.datetime.fromtimestamp(0)
+    if rng.random() >= 0.7:
+        avail_date = start + dt.timedelta(days=rng.randint(1, 9))
+
+    if rng.random() < 0.5:
+        return Roll(f'FS{num:06}', grg, lbs, avail_date, roll.FAIRYSTONE)
+    return Roll(f'WF{num:06}', grg, lbs, avail_date, roll.WHITEVILLE)
+
+def make_inventory(rng: random.Random, greiges: list[GreigeStyle], n_rolls: int,
+                   start: dt.datetime) -> Inventory:
+    inv = Inventory()
+    for i in range(n_rolls):
+        inv.add(make_roll(rng, i+1, greiges[i % len(greiges)], start))
+    return inv
+
+def make_demand(rng: random.Random, items: list[FabricStyle], n_orders: int,
+                start: dt.datetime) -> tuple[list[Req], Demand]:
+    days = [start + dt.timedelta(weeks=wk, days=d) for wk in range(-1, 5) for d in range(5)]
+    reqs: list[Req] = []
+    dmnd = Demand()
+
+    for i, item in enumerate(items):
+        n_item = n_orders // len(items) + (i < n_orders % len(items))
+        dates = sorted(rng.sample(days, min(n_item, len(days))))
+        x = Req(item, [(date, rng.choice(_BUCKET_YDS)) for date in dates])
+        for o in x.orders:
+            dmnd.add(o)
+        reqs.append(x)
+    
+    return reqs, dmnd
+
+def make_jets(start: dt.datetime, end: dt.datetime) -> list[Jet]:
+    jets = list(jet.read_jets(start, end).values())
+    for j in jets:
+        j.init_new_sched()
+    return jets
+
+def make_scenario(tier: Tier, start: dt.datetime, seed: int = 0,
+                  weeks: int = 3) -> Scenario:
+    rng = random.Random(seed)
+    end = start + dt.timedelta(weeks=weeks)
+
+    items = pick_items(rng, tier.n_orders)
+    greiges = sorted({f.greige for f in items}, key=lambda g: g.id)
+    inv = make_inventory(rng, greiges, tier.n_rolls, start)
+    reqs, dmnd = make_demand(rng, items, tier.n_orders, start)
+
+    return Scenario(tier, inv, reqs, dmnd, make_jets(start, end), start, end)
\ No newline at end of file
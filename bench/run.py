@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+
+import io, os, contextlib, tempfile, datetime as dt, pandas as pd
+
+import scheduler
+from .generate import Scenario
+from .stages import StageStats, StageTimer
+
+STAGES = ('make_schedule', 'get_all_lots', 'get_best_job', 'get_jet_loads', 'write_output')
+
+def run_scenario(scen: Scenario, memory: bool = True, output: bool = True) \
+    -> tuple[dict[str, StageStats], int]:
+    stages = STAGES if output else STAGES[:-1]
+    if output:
+        inv_df, dmnd_df = scheduler.get_input_tables(scen.inv, scen.dmnd)
+    friday = scen.start + dt.timedelta(days=4 - scen.start.weekday())
+
+    with tempfile.TemporaryDirectory() as tmpdir, \
+        contextlib.redirect_stdout(io.StringIO()), \
+        StageTimer(scheduler, stages, memory=memory) as timer:
+        scheduler.make_schedule(scen.dmnd, scen.reqs, scen.inv, scen.jets,
+                                friday + dt.timedelta(weeks=2))
+        if output:
+            writer = pd.ExcelWriter(os.path.join(tmpdir, 'output.xlsx'),
+                                    datetime_format='MM/DD HH:MM:SS')
+            scheduler.write_output(writer, tmpdir, inv_df, dmnd_df, scen.inv, scen.dmnd,
+                                   scen.jets, scheduler.LOGGER)
+            writer.close()
+
+    return timer.stats, timer.peak
+
+def format_report(scen: Scenario, stats: dict[str, StageStats], peak: int,
+                  memory: bool = True) -> str:
+    n_jobs = sum(j.n_new_jobs for j in scen.jets)
+    lines = [
+        f'tier={scen.tier.name} rolls={scen.tier.n_rolls} orders={scen.tier.n_orders} '
+        f'jets={len(scen.jets)} new jobs={n_jobs}',
+        f'  {'stage':<16}{'calls':>8}{'wall (s)':>12}{'peak (MiB)':>12}'
+    ]
+    for stage in stats.values():
+        peak_str = f'{stage.peak / 2**20:.2f}' if memory else '-'
+        lines.append(f'  {stage.name:<16}{stage.calls:>8}{stage.wall:>12.3f}{peak_str:>12}')
+    if memory:
+        lines.append(f'  overall peak traced memory: {peak / 2**20:.2f} MiB')
+    return '\n'.join(lines)
\ No newline at end of file
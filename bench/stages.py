@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+from types import ModuleType
+import time, tracemalloc
+
+class StageStats:
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.wall = 0.0
+        self.peak = 0
+
+    def __repr__(self):
+        return f'StageStats(name={repr(self.name)}, calls={self.calls}, wall={self.wall:.3f})'
+
+class _Frame:
+
+    def __init__(self, stats: StageStats, base: int):
+        self.stats = stats
+        self.base = base
+        self.peak = 0
+        self.start = time.perf_counter()
+
+class StageTimer:
+
+    def __init__(self, module: ModuleType, names: tuple[str, ...], memory: bool = True):
+        self.module = module
+        self.stats = {name: StageStats(name) for name in names}
+        self.memory = memory
+        self.peak = 0
+        self._originals = {}
+        self._frames: list[_Frame] = []
+
+    def _fold(self):
+        cur, peak = tracemalloc.get_traced_memory()
+        for frame in self._frames:
+            frame.peak = max(frame.peak, peak - frame.base)
+        self.peak = max(self.peak, peak)
+        tracemalloc.reset_peak()
+        return cur
+
+    def _enter(self, name: str):
+        base = self._fold() if self.memory else 0
+        self._frames.append(_Frame(self.stats[name], base))
+
+    def _exit(self):
+        if self.memory:
+            self._fold()
+        frame = self._frames.pop()
+        frame.stats.calls += 1
+        frame.stats.wall += time.perf_counter() - frame.start
+        frame.stats.peak = max(frame.stats.peak, frame.peak)
+
+    def _wrap(self, name: str, func):
+        def wrapper(*args, **kwargs):
+            self._enter(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._exit()
+        return wrapper
+
+    def __enter__(self):
+        for name in self.stats:
+            func = getattr(self.module, name)
+            self._originals[name] = func
+            setattr(self.module, name, self._wrap(name, func))
+        if self.memory:
+            tracemalloc.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self.memory:
+            self._fold()
+            tracemalloc.stop()
+        for name, func in self._originals.items():
+            setattr(self.module, name, func)
+        self._originals.clear()
+        return False
\ No newline at end of file
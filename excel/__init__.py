@@ -1,5 +1,7 @@
 #!/usr/bin/env python
 
 from .info import ExcelInfo, ParsedDataInfo, init, get_excel_info
+from .cache import read_sheet, clear_cache
 
-__all__ = ['ExcelInfo', 'ParsedDataInfo', 'init', 'get_excel_info']
\ No newline at end of file
+__all__ = ['ExcelInfo', 'ParsedDataInfo', 'init', 'get_excel_info', 'read_sheet',
+           'clear_cache']
\ No newline at end of file
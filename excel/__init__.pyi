@@ -1,5 +1,5 @@
 from typing import TypedDict, Literal
-import os
+import os, pandas as pd
 
 type ParsedKey = Literal['fabric_items', 'greige_sizes', 'greige_translation', 'inventory',
                          'adaptive_orders', 'pa_demand_plan', 'jet_info', 'ship_dates',
@@ -34,4 +34,27 @@ class ParsedDataInfo(TypedDict):
 
 def init() -> None: ...
 
-def get_excel_info(name: ParsedKey) -> tuple[os.PathLike, PandasKWArgs]: ...
\ No newline at end of file
+def get_excel_info(name: ParsedKey) -> tuple[os.PathLike, PandasKWArgs]: ...
+
+def read_sheet(name: ParsedKey, use_cache: bool = True) -> pd.DataFrame:
+    """
+    Reads the named sheet from data_info.txt. The first read of a
+    sheet is saved to a Feather file (or a pickle if Feather cannot
+    hold it) in datasrc/cache. The file is keyed by the workbook path
+    and the read arguments, and the workbook's modification time and
+    size. Later reads load the saved file instead of parsing the
+    workbook again, until the workbook changes. Files saved for an
+    older version of the workbook are deleted only once the new file
+    has been written; if it cannot be written, they are kept. Each
+    call returns a fresh copy, so callers can modify it.
+
+        name:
+          The name of the sheet's section in data_info.txt.
+        use_cache: (default True)
+          If False, always parse the workbook and save nothing.
+    """
+    ...
+
+def clear_cache() -> None:
+    """Forgets every cached sheet and deletes the saved files."""
+    ...
\ No newline at end of file
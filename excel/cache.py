@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+
+import os, pickle, hashlib, pandas as pd
+
+from .info import ParsedKey, PandasKWArgs, get_excel_info, _nth_parent
+
+CACHE_DIR = os.path.join(_nth_parent(__file__, 2), 'datasrc', 'cache')
+
+_FRAMES: dict[str, pd.DataFrame] = {}
+
+def _digest(*parts) -> str:
+    return hashlib.sha1(repr(parts).encode()).hexdigest()[:16]
+
+def cache_keys(fpath: os.PathLike, pdargs: PandasKWArgs) -> tuple[str, str]:
+    fpath = os.path.abspath(fpath)
+    sel_key = _digest(fpath, sorted(pdargs.items(), key=lambda kv: kv[0]))
+    stat = os.stat(fpath)
+    return sel_key, _digest(stat.st_mtime_ns, stat.st_size, pd.__version__)
+
+def _load_cached(base: str) -> pd.DataFrame | None:
+    for ext, reader in (('.feather', pd.read_feather), ('.pkl', pd.read_pickle)):
+        if not os.path.isfile(base + ext): continue
+        try:
+            return reader(base + ext)
+        except (ImportError, ValueError, TypeError, OSError, EOFError):
+            return None
+    return None
+
+def _write_cached(base: str, df: pd.DataFrame) -> str | None:
+    tmppath = base + '.tmp'
+    try:
+        for ext, writer in (('.feather', df.to_feather), ('.pkl', df.to_pickle)):
+            try:
+                writer(tmppath)
+                os.replace(tmppath, base + ext)
+                return base + ext
+            except (ImportError, ValueError, TypeError, NotImplementedError, AttributeError,
+                    pickle.PicklingError, OSError):
+                continue
+        return None
+    finally:
+        if os.path.isfile(tmppath):
+            os.remove(tmppath)
+
+def _drop_stale(sel_key: str, keep: str) -> None:
+    for fname in os.listdir(CACHE_DIR):
+        if fname.startswith(sel_key + '-') and fname != os.path.basename(keep):
+            os.remove(os.path.join(CACHE_DIR, fname))
+
+def read_sheet(name: ParsedKey, use_cache: bool = True) -> pd.DataFrame:
+    fpath, pdargs = get_excel_info(name)
+    if not use_cache:
+        return pd.read_excel(fpath, **pdargs)
+
+    sel_key, ver_key = cache_keys(fpath, pdargs)
+    key = f'{sel_key}-{ver_key}'
+    if key not in _FRAMES:
+        base = os.path.join(CACHE_DIR, key)
+        df = _load_cached(base)
+        if df is None:
+            df = pd.read_excel(fpath, **pdargs)
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            written = _write_cached(base, df)
+            if written is not None:
+                _drop_stale(sel_key, written)
+        _FRAMES[key] = df
+    
+    return _FRAMES[key].copy()
+
+def clear_cache() -> None:
+    _FRAMES.clear()
+    if not os.path.isdir(CACHE_DIR):
+        return
+    for fname in os.listdir(CACHE_DIR):
+        os.remove(os.path.join(CACHE_DIR, fname))
\ No newline at end of file
@@ -71,8 +71,7 @@ def write_csv(key: InfoKey) -> None:
     outpath = get_out_path(key)
     outfile = open(outpath, mode='w+')
 
-    inpath, pdargs = excel.get_excel_info(key)
-    df = pd.read_excel(inpath, **pdargs)
+    df = excel.read_sheet(key)
     match key:
         case 'fabric_items':
             df = run_fabric_converts(df)
@@ -14,10 +14,10 @@ __all__ = ['make_sched_args', 'make_sched_ret', 'all_lots_args', 'all_lots_ret',
            'best_job_args', 'best_job_ret', 'cost_args', 'cost_ret', 'sc_cost_args',
            'sc_cost_ret', 'late_cost_args', 'late_cost_ret', 'inv_cost_args',
            'inv_cost_ret', 'used_cost_args', 'used_cost_ret', 'order_cost_args',
-           'order_cost_ret']
+           'order_cost_ret', 'order_costs_args', 'order_costs_ret']
 
 def make_sched_args(dmnd: Demand, reqs: list[Req], inv: Inventory, jets: list[Jet],
-                    next_avail: dt.datetime) \
+                    next_avail: dt.datetime, pool = None) \
     -> ProcessDesc:
     return {
         'desc1': 'Generating the current schedule'
@@ -29,7 +29,8 @@ def make_sched_ret(res: None) -> ProcessDesc:
     }
 
 def sched_ord_args(order: Order, dmnd: Demand, reqs: list[Req], inv: Inventory,
-                   jets: list[Jet], next_avail: dt.datetime) -> ProcessDesc:
+                   jets: list[Jet], next_avail: dt.datetime, pool = None,
+                   fills = None) -> ProcessDesc:
     return {
         'desc1': f'Attempting to fulfill {order}',
         'desc2': f'due date={order.due_date.strftime('%m/%d')}',
@@ -42,7 +43,8 @@ def sched_ord_ret(res: tuple[Order, bool]) -> ProcessDesc:
         'desc1': f'remaining unscheduled yards={min(order.init_yds,order.total_yds):.2f}'
     }
 
-def all_lots_args(order: Order, dmnd: Demand, inv: Inventory, jets: list[Jet]) -> ProcessDesc:
+def all_lots_args(order: Order, dmnd: Demand, inv: Inventory, jets: list[Jet],
+                  pool = None, fills = None) -> ProcessDesc:
     return {
         'desc1': f'Getting all possible dyelots to assign to {order}',
         'desc2': f'greige={order.greige}, color={order.color}'
@@ -51,7 +53,8 @@ def all_lots_args(order: Order, dmnd: Demand, inv: Inventory, jets: list[Jet]) -
 def all_lots_ret(res: dict[Jet, list[tuple[DyeLot, *tuple[DyeLot, ...], Snapshot]]]) -> ProcessDesc:
     return {}
 
-def single_lots_args(order: Order, inv: Inventory, jets: list[Jet]) -> ProcessDesc:
+def single_lots_args(order: Order, inv: Inventory, jets: list[Jet], pool = None,
+                     fills = None) -> ProcessDesc:
     return {
         'desc1': f'Getting all possible single dyelots to assign to {order}'
     }
@@ -59,7 +62,7 @@ def single_lots_args(order: Order, inv: Inventory, jets: list[Jet]) -> ProcessDe
 def single_lots_ret(res: dict[Jet, tuple[DyeLot, Snapshot]]) -> ProcessDesc:
     return {}
 
-def gsl_loop_args(order: Order, inv: Inventory, jet: Jet) -> ProcessDesc:
+def gsl_loop_args(order: Order, inv: Inventory, jet: Jet, fills = None) -> ProcessDesc:
     return {
         'desc1': f'Creating dyelot for {jet.id} to assign to {order}'
     }
@@ -82,7 +85,7 @@ def paired_lots_args(o1: Order, o2: Order, inv: Inventory, jets: list[Jet]) -> P
 def paired_lots_ret(res: dict[Jet, tuple[DyeLot, DyeLot, Snapshot]]) -> ProcessDesc:
     return {}
 
-def gpl_loop_args(o1: Order, o2: Order, inv: Inventory, jet: Jet) -> ProcessDesc:
+def gpl_loop_args(o1: Order, o2: Order, inv: Inventory, jet: Jet, fills = None) -> ProcessDesc:
     return {
         'desc1': f'Creating dyelot for {jet.id} to assign to {o1} and {o2}'
     }
@@ -98,7 +101,8 @@ def gpl_loop_ret(res: tuple[DyeLot, DyeLot, Snapshot] | str) -> ProcessDesc:
     }
 
 def jload_args(inv: Inventory, greige: GreigeStyle, jet: Jet,
-               max_date: dt.datetime | None = None, create: bool = False) -> ProcessDesc:
+               max_date: dt.datetime | None = None, create: bool = False,
+               fills = None) -> ProcessDesc:
     return {
         'desc1': f'Searching inventory for {greige} to load {jet.id}'
     }
@@ -115,7 +119,7 @@ def jload_ret(res: tuple[Snapshot | None, list[PortLoad]]) -> ProcessDesc:
 
 def best_job_args(lots_map: dict[Jet, list[tuple[DyeLot, tuple[DyeLot, ...], Snapshot]]],
                   order: Order, dmnd: Demand, reqs: list[Req], inv: Inventory,
-                  next_avail: dt.datetime) -> ProcessDesc:
+                  next_avail: dt.datetime, pool = None) -> ProcessDesc:
     return {
         'desc1': f'Finding best job for {order}'
     }
@@ -135,7 +139,8 @@ def best_job_ret(res: tuple[Jet, Snapshot | None, JetSched, float] | None) -> Pr
     }
 
 def cost_args(jet: Jet, sched: JetSched, order: Order, dmnd: Demand, reqs: list[Req],
-              snap: Snapshot, inv: Inventory, next_avail: dt.datetime) -> ProcessDesc:
+              snap: Snapshot, inv: Inventory, next_avail: dt.datetime,
+              model = None) -> ProcessDesc:
     if sched == jet.cur_sched:
         return {
             'desc1': f'Getting the total cost for the current schedule of {jet.id}',
@@ -173,6 +178,16 @@ def order_cost_ret(res: float) -> ProcessDesc:
         'desc1': f'late cost={res:.2f}'
     }
 
+def order_costs_args(orders: list[Order | OrderView], next_avail: dt.datetime) -> ProcessDesc:
+    return {
+        'desc1': f'Calculating late and not-scheduled costs for {len(orders)} orders'
+    }
+
+def order_costs_ret(res: list[float]) -> ProcessDesc:
+    return {
+        'desc1': f'total late cost={sum(res):.2f}'
+    }
+
 def late_cost_args(order: Order, dmnd: Demand, next_avail: dt.datetime) -> ProcessDesc:
     return {
         'desc1': 'Getting the cost of late and not-scheduled orders'
@@ -1,10 +1,11 @@
 #!/usr/bin/env python
 
-from typing import TypedDict, Literal
-import re, datetime as dt, pandas as pd
+from typing import TypedDict, Literal, NamedTuple
+import os, re, csv, datetime as dt, pandas as pd
 
-from app.support.logging import Logger
-from app.materials import Inventory, Snapshot, RollAlloc, PortLoad
+from app.support.logging import Logger, LogSink, Process, Profile
+from app.style import GreigeStyle
+from app.materials import Inventory, Snapshot, RollView, RollAlloc, PortLoad
 from app.schedule import DyeLot, Demand, Jet, Job
 
 def add_back_piece(inv: Inventory, piece: RollAlloc, snapshot: Snapshot) -> None:
@@ -13,14 +14,78 @@ def add_back_piece(inv: Inventory, piece: RollAlloc, snapshot: Snapshot) -> None
     inv.add(roll)
 
 def apply_snapshot(inv: Inventory, snap: Snapshot | None, temp: bool = True) -> None:
-    views = list(inv.itervalues())
-    for rview in views:
-        roll = inv.remove(rview)
-        if temp:
-            roll.snapshot = snap
-        else:
-            roll.apply_snap(snap)
-        inv.add(roll)
+    if temp:
+        inv.set_snapshot(snap)
+    else:
+        inv.apply_snap(snap)
+
+def release_candidates(lots_map: dict[Jet, list[tuple[DyeLot, *tuple[DyeLot, ...],
+                                                     Snapshot | None]]],
+                       keep: Snapshot | None) -> None:
+    seen: set[int] = set()
+    for tups in lots_map.values():
+        for tup in tups:
+            if id(tup) in seen: continue
+            seen.add(id(tup))
+            snap: Snapshot | None = tup[-1]
+            if snap is None:
+                for lot in tup[:-1]:
+                    lot.release()
+            elif snap is not keep:
+                snap.release_lots()
+
+class PortPlan(NamedTuple):
+    roll1: tuple[str, float]
+    roll2: tuple[str, float] | None
+    lbs: float
+    avail_date: dt.datetime
+
+class LoadPlan(NamedTuple):
+    new_rolls: list[tuple[str, GreigeStyle, float, dt.datetime]]
+    lots: list[list[PortPlan]]
+    in_snap: bool
+
+def get_port_plans(loads: list[PortLoad]) -> list[PortPlan]:
+    ports: list[PortPlan] = []
+    for load in loads:
+        roll2 = None
+        if load.roll2:
+            roll2 = (load.roll2.roll_id, load.roll2.lbs)
+        ports.append(PortPlan((load.roll1.roll_id, load.roll1.lbs), roll2, load.lbs,
+                              load.avail_date))
+    return ports
+
+def get_load_plan(new_rolls: list[RollView], lots: tuple[DyeLot, ...],
+                  snap: Snapshot | None) -> LoadPlan:
+    rolls_plan = [(r.id, r.item, r.init_wt, r.avail_date) for r in new_rolls]
+    lots_plan = [get_port_plans(lot.ports) for lot in lots]
+    return LoadPlan(rolls_plan, lots_plan, snap is not None)
+
+def replay_load_plan(inv: Inventory, plan: LoadPlan) \
+    -> tuple[Snapshot | None, list[list[PortLoad]]]:
+    id_map: dict[str, str] = {}
+    for id, greige, lbs, avail_date in plan.new_rolls:
+        id_map[id] = inv.add_new_roll(greige, lbs, avail_date).id
+    
+    snap = Snapshot()
+    inv.set_snapshot(snap)
+
+    def get_piece(roll_id: str, lbs: float) -> RollAlloc:
+        rview = inv.get(id_map.get(roll_id, roll_id))
+        if not plan.in_snap:
+            return RollAlloc(rview.id, lbs, rview.avail_date, rview.plant)
+        return inv.update(rview, lambda r: r.allocate(lbs, snapshot=snap))
+
+    lots_loads: list[list[PortLoad]] = []
+    for ports in plan.lots:
+        loads: list[PortLoad] = []
+        for port in ports:
+            piece1 = get_piece(*port.roll1)
+            piece2 = None if port.roll2 is None else get_piece(*port.roll2)
+            loads.append(PortLoad(piece1, piece2, port.lbs, port.avail_date))
+        lots_loads.append(loads)
+    
+    return (snap if plan.in_snap else None), lots_loads
 
 class InvTable(TypedDict):
     greige: list[str]
@@ -159,6 +224,27 @@ class LogsTable(TypedDict):
     desc2: list[str]
     desc3: list[str]
 
+class ProfileTable(TypedDict):
+    calls: list[int]
+    wall: list[float]
+    self_wall: list[float]
+    cpu: list[float]
+    self_cpu: list[float]
+
+def get_profile_table(profile: Profile) -> tuple[list[str], ProfileTable]:
+    names: list[str] = []
+    table = ProfileTable(calls=[], wall=[], self_wall=[], cpu=[], self_cpu=[])
+
+    for stats in sorted(profile.stats.values(), key=lambda s: s.self_wall, reverse=True):
+        names.append(stats.name)
+        table['calls'].append(stats.calls)
+        table['wall'].append(stats.wall)
+        table['self_wall'].append(stats.self_wall)
+        table['cpu'].append(stats.cpu)
+        table['self_cpu'].append(stats.self_cpu)
+    
+    return names, table
+
 def df_cols_to_string(df: pd.DataFrame, *args: *tuple[str, ...]) -> pd.DataFrame:
     for col in args:
         df[col] = df[col].astype('string')
@@ -298,40 +384,78 @@ def get_late_tables(dmnd: Demand) -> tuple[LateData, LateDetailData, MissingData
     
     return (order_ids, late_table), (late_ids, late_detail), (miss_ids, miss_table)
 
+class LogSplit:
+
+    def __init__(self):
+        self.pnum = 1
+        self.date = None
+        self.date_idx = 0
+    
+    @property
+    def fname(self) -> str:
+        if self.pnum >= 5:
+            return f'p{self.pnum}_logs_{self.date_idx}.tsv'
+        return f'p{self.pnum}_logs.tsv'
+    
+    def starts_new(self, process: Process) -> bool:
+        if process.name != 'schedule_order':
+            return False
+        
+        x: re.Match = re.match(r'.*Order\(id=(.*)\)', process.desc1)
+        order_id: str = x.group(1)
+        prefix = order_id[1:3]
+        pnum = int(prefix[1:])
+
+        x: re.Match = re.match(r'.*=(.*)', process.desc2)
+        day: str = x.group(1)
+
+        if not (pnum > self.pnum or pnum >= 5 and day != self.date):
+            return False
+        
+        if self.pnum >= 5:
+            self.date_idx += 1
+            if pnum > self.pnum:
+                self.date_idx = 0
+        self.pnum = pnum
+        self.date = day
+        return True
+
+class LogFiles(LogSink):
+
+    def __init__(self, logpath: str):
+        self.logpath = logpath
+        self.split = LogSplit()
+        self.open_file()
+    
+    def open_file(self):
+        self.file = open(os.path.join(self.logpath, self.split.fname), 'w', newline='')
+        self.writer = csv.writer(self.file, delimiter='\t', lineterminator='\n')
+        self.writer.writerow(['process_id', 'caller', 'name', 'desc1', 'desc2', 'desc3'])
+    
+    def write(self, p: Process):
+        if self.split.starts_new(p):
+            self.file.close()
+            self.open_file()
+        self.writer.writerow([p.id, p.caller, p.name, p.desc1, p.desc2, p.desc3])
+    
+    def close(self):
+        self.file.close()
+
 def get_logs_table(lgr: Logger) -> list[tuple[str, list[int], LogsTable]]:
     tables: list[tuple[str, list[int], LogsTable]] = []
 
-    cur_pnum = 1
-    cur_date = None
-    date_idx = 0
+    split = LogSplit()
+    fname = split.fname
     cur_ids: list[int] = []
     cur_table = LogsTable(caller=[], name=[], desc1=[], desc2=[], desc3=[])
 
-    for process in sorted(lgr.processes, key=lambda p: p.id):
-        if process.name == 'schedule_order':
-            x: re.Match = re.match(r'.*Order\(id=(.*)\)', process.desc1)
-            order_id: str = x.group(1)
-            prefix = order_id[1:3]
-            pnum = int(prefix[1:])
-
-            x: re.Match = re.match(r'.*=(.*)', process.desc2)
-            day: str = x.group(1)
-            
-            if pnum > cur_pnum or pnum >= 5 and day != cur_date:
-                if cur_pnum >= 5:
-                    fname = f'p{cur_pnum}_logs_{date_idx}.tsv'
-                    date_idx += 1
-                    if pnum > cur_pnum:
-                        date_idx = 0
-                else:
-                    fname = f'p{cur_pnum}_logs.tsv'
-
-                tables.append((fname, cur_ids, cur_table))
-                cur_ids: list[int] = []
-                cur_table = LogsTable(caller=[], name=[], desc1=[], desc2=[],
-                                      desc3=[])
-                cur_pnum = pnum
-                cur_date = day
+    for process in lgr.processes:
+        if split.starts_new(process):
+            tables.append((fname, cur_ids, cur_table))
+            fname = split.fname
+            cur_ids: list[int] = []
+            cur_table = LogsTable(caller=[], name=[], desc1=[], desc2=[],
+                                  desc3=[])
 
         cur_ids.append(process.id)
         cur_table['caller'].append(process.caller)
@@ -340,10 +464,6 @@ def get_logs_table(lgr: Logger) -> list[tuple[str, list[int], LogsTable]]:
         cur_table['desc2'].append(process.desc2)
         cur_table['desc3'].append(process.desc3)
     
-    if cur_pnum >= 5:
-        fname = f'p{cur_pnum}_logs_{date_idx}.tsv'
-    else:
-        fname = f'p{cur_pnum}_logs.tsv'
     tables.append((fname, cur_ids, cur_table))
     
     return tables
\ No newline at end of file
@@ -24,8 +24,7 @@ Roll.set_logger(LOGGER)
 def agg_sched_info[T, U](start: dt.datetime, get_val: Callable[[pd.DataFrame, int], U],
                          reducer: Callable[[T, U], T], initial: T) -> T:
     res: T = initial
-    fpath, pdargs = excel.get_excel_info('adaptive_orders')
-    df = pd.read_excel(fpath, **pdargs)
+    df = excel.read_sheet('adaptive_orders')
 
     for i in df.index:
         if df.loc[i, 'StartTime'] > start:
@@ -36,8 +35,7 @@ def agg_sched_info[T, U](start: dt.datetime, get_val: Callable[[pd.DataFrame, in
 def load_inv(start: dt.datetime) -> tuple[Inventory, dict[style.GreigeStyle, float]]:
     inv = Inventory()
 
-    fpath, pdargs = excel.get_excel_info('inventory')
-    inv_df = pd.read_excel(fpath, **pdargs)
+    inv_df = excel.read_sheet('inventory')
 
     # def _reducer(res: set[str], val: str) -> set[str]:
     #     res.add(val)
@@ -63,12 +61,10 @@ def load_inv(start: dt.datetime) -> tuple[Inventory, dict[style.GreigeStyle, flo
                  dt.datetime.fromtimestamp(0), plt)
         inv.add(r)
 
-    fpath, pdargs = excel.get_excel_info('incoming_si_greige')
-    si_df = pd.read_excel(fpath, **pdargs)
+    si_df = excel.read_sheet('incoming_si_greige')
     si_df['greige'] = si_df['greige'].str.upper()
 
-    fpath, pdargs = excel.get_excel_info('incoming_wv_greige')
-    wv_df = pd.read_excel(fpath, **pdargs)
+    wv_df = excel.read_sheet('incoming_wv_greige')
     wv_df['greige'] = wv_df['greige'].str.upper()
 
     today = dt.datetime.now()
@@ -179,10 +175,7 @@ def load_demand(start: dt.datetime) -> tuple[list[Req], Demand]:
     reqs: list[Req] = []
     dmnd = Demand()
 
-    ship_path, ship_args = excel.get_excel_info('ship_dates')
-    reqs_path, reqs_args = excel.get_excel_info('pa_min_reqs')
-
-    ship_df = pd.read_excel(ship_path, **ship_args)
+    ship_df = excel.read_sheet('ship_dates')
     ship_df = ship_df[ship_df['Ply1 Item'] != '0']
 
     days_map = {
@@ -213,7 +206,7 @@ def load_demand(start: dt.datetime) -> tuple[list[Req], Demand]:
     
     # not_avail = agg_sched_info(start, _get_val, _reducer, {})
 
-    reqs_df = pd.read_excel(reqs_path, **reqs_args)
+    reqs_df = excel.read_sheet('pa_min_reqs')
     reqs_df['Ship Day'] = reqs_df['Ply1 Item'].apply(lambda x: _map_ship_day(x, ship_days_data))
 
     today = dt.datetime.now()
@@ -268,8 +261,7 @@ def load_demand(start: dt.datetime) -> tuple[list[Req], Demand]:
 def load_jets(start: dt.datetime, end: dt.datetime) -> list[Jet]:
     jet.init(start, end)
 
-    fpath, pdargs = excel.get_excel_info('adaptive_orders')
-    df = pd.read_excel(fpath, **pdargs)
+    df = excel.read_sheet('adaptive_orders')
     df = df[~(df['StartTime'].isna() | df['EndTime'].isna())]
 
     for i in df.index:
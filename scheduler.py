@@ -1,16 +1,19 @@
 #!/usr/bin/env python
 
 from typing import Generator
-import sys, os, math, datetime as dt, pandas as pd
+from concurrent.futures import Future, ProcessPoolExecutor
+import os, io, math, bisect, heapq, pickle, tempfile, argparse, datetime as dt, pandas as pd
 
 from app import style
-from app.support import logging
-from app.style import GreigeStyle, color
+from app.support import logging, FloatRange
+from app.style import GreigeStyle, FabricStyle, color
 from app.materials import Inventory, PortLoad, Snapshot
-from app.schedule import DyeLot, Order, OrderView, Req, Demand, Jet, JetSched
+from app.schedule import DyeLot, Order, OrderView, Req, Demand, Jet, JetSched, SchedProbe
 
 from helpers import add_back_piece, apply_snapshot, get_init_tables, get_sched_tables, \
-    get_late_tables, get_new_inv, get_logs_table, df_cols_to_string
+    get_late_tables, get_new_inv, get_logs_table, df_cols_to_string, LoadPlan, \
+    get_load_plan, replay_load_plan, release_candidates, LogFiles, get_port_plans, \
+    get_profile_table
 from formatters import *
 from loaddata import load_inv, load_demand, load_jets, LOGGER
 
@@ -37,17 +40,46 @@ def try_load_jet(inv: Inventory, loads: Generator[PortLoad], jet: Jet, snapshot:
     
     return ret
 
+class FillCache:
+    """
+    Remembers the results of 'get_jet_loads' across jets with the same
+    load range and port count. Entries are keyed on the Inventory
+    version of the greige, so a committed change to any of its rolls
+    misses the cache. Searches that commit changes themselves (such as
+    creating new rolls) are not stored. A hit replays the stored plan
+    onto a fresh snapshot.
+    """
+
+    def __init__(self):
+        self.plans: dict[tuple, LoadPlan] = {}
+
+    def key(self, inv: Inventory, greige: GreigeStyle, jet: Jet, max_date: dt.datetime | None,
+            create: bool) -> tuple:
+        return greige, jet.load_rng, jet.n_ports, max_date, create, inv.version(greige)
+
 @logging.logged_func(LOGGER, jload_args, jload_ret)
 def get_jet_loads(inv: Inventory, greige: GreigeStyle, jet: Jet,
-                  max_date: dt.datetime | None = None, create: bool = False) \
+                  max_date: dt.datetime | None = None, create: bool = False,
+                  fills: FillCache | None = None) -> tuple[Snapshot | None, list[PortLoad]]:
+    if fills is None:
+        return search_jet_loads(inv, greige, jet, max_date, create)
+    
+    key = fills.key(inv, greige, jet, max_date, create)
+    if key in fills.plans:
+        snap, lots_loads = replay_load_plan(inv, fills.plans[key])
+        return snap, lots_loads[0]
+    
+    snap, loads = search_jet_loads(inv, greige, jet, max_date, create)
+    if inv.version(greige) == key[-1]:
+        fills.plans[key] = LoadPlan([], [get_port_plans(loads)], snap is not None)
+    return snap, loads
+
+def search_jet_loads(inv: Inventory, greige: GreigeStyle, jet: Jet,
+                     max_date: dt.datetime | None, create: bool) \
     -> tuple[Snapshot | None, list[PortLoad]]:
     snap = Snapshot()
     max_ret: list[PortLoad] = []
-    
-    for rview in inv.itervalues():
-        roll = inv.remove(rview)
-        roll.snapshot = snap
-        inv.add(roll)
+    inv.set_snapshot(snap)
 
     for start in inv.get_starts(greige, jet.load_rng):
         pl_gen = inv.get_port_loads(greige, snap, jet.load_rng,
@@ -69,8 +101,215 @@ def get_jet_loads(inv: Inventory, greige: GreigeStyle, jet: Jet,
 
     return None, max_ret
 
+class StylePickler(pickle.Pickler):
+    """
+    Pickles the registered greige and fabric styles by id, so they are
+    never copied and unpickle as the styles of the receiving process.
+    """
+
+    def persistent_id(self, obj):
+        if isinstance(obj, GreigeStyle) and style.greige.get_style(obj.id) is obj:
+            return 'greige', obj.id
+        if isinstance(obj, FabricStyle) and style.fabric.get_style(obj.id) is obj:
+            return 'fabric', obj.id
+        return None
+
+class StyleUnpickler(pickle.Unpickler):
+
+    def persistent_load(self, pid):
+        kind, id = pid
+        return getattr(style, kind).get_style(id)
+
+class SchedPool:
+    """
+    A process pool whose workers each keep their own copy of the
+    scheduling state. The state is pickled once and handed to every
+    worker as it starts. From then on, each change the parent makes to
+    the state (taking an order out of demand or putting it back,
+    replaying a candidate plan, choosing and committing a job) is
+    appended to an operations log. Tasks carry the length of the log
+    when they were submitted, and a worker replays the operations it
+    has not seen yet before running one.
+    """
+
+    def __init__(self, n_workers: int, dmnd: Demand, reqs: list[Req], inv: Inventory,
+                 jets: list[Jet]):
+        self.jet_idx = {jet: i for i, jet in enumerate(jets)}
+        self.cands: dict[int, int] = {}
+        self.n_ops = 0
+        self.tmpdir = tempfile.TemporaryDirectory()
+        logpath = os.path.join(self.tmpdir.name, 'ops.pickle')
+        self.logfile = open(logpath, 'wb')
+
+        buf = io.BytesIO()
+        StylePickler(buf).dump((dmnd, reqs, inv, jets))
+        self.executor = ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                            initargs=(buf.getvalue(), logpath))
+
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self) -> None:
+        self.executor.shutdown(cancel_futures=True)
+        self.logfile.close()
+        self.tmpdir.cleanup()
+
+    def log(self, *op) -> None:
+        StylePickler(self.logfile).dump(op)
+        self.logfile.flush()
+        self.n_ops += 1
+    
+    def submit(self, func, *args) -> Future:
+        return self.executor.submit(func, self.n_ops, *args)
+    
+    def replay(self, orders: tuple[Order, ...], inv: Inventory, plan: LoadPlan) \
+        -> tuple[DyeLot, *tuple[DyeLot, ...], Snapshot]:
+        tup = replay_candidate(orders, inv, plan)
+        self.cands[id(tup)] = len(self.cands)
+        self.log('replay', tuple(map(lambda o: o.id, orders)), plan)
+        return tup
+    
+    def lots_index(self, lots_map: dict[Jet, list[tuple[DyeLot, *tuple[DyeLot, ...],
+                                                         Snapshot]]]) \
+        -> list[tuple[int, list[int]]]:
+        return [(self.jet_idx[jet], [self.cands[id(tup)] for tup in tups])
+                for jet, tups in lots_map.items()]
+    
+    def choose(self, jet: Jet, tup: tuple[DyeLot, *tuple[DyeLot, ...], Snapshot] | None,
+               idx: int | None) -> None:
+        self.log('choose', self.jet_idx[jet], None if tup is None else self.cands[id(tup)],
+                 idx)
+    
+    def commit(self, lots_map: dict[Jet, list[tuple[DyeLot, *tuple[DyeLot, ...],
+                                                     Snapshot]]]) -> None:
+        self.log('commit', self.lots_index(lots_map))
+        self.cands.clear()
+
+class Replica:
+    """
+    A worker's copy of the scheduling state. Catches up by replaying
+    the operations log of its SchedPool, and keeps its own FillCache
+    for the searches it runs.
+    """
+
+    def __init__(self, blob: bytes, logpath: str):
+        self.dmnd, self.reqs, self.inv, self.jets = StyleUnpickler(io.BytesIO(blob)).load()
+        self.orders: dict[str, Order] = {o.id: o for req in self.reqs for o in req.orders}
+        self.cands: list[tuple[DyeLot, *tuple[DyeLot, ...], Snapshot]] = []
+        self.chosen: tuple[Jet, Snapshot | None, JetSched, float] | None = None
+        self.fills = FillCache()
+        self.logfile = open(logpath, 'rb')
+        self.n_ops = 0
+
+    def sync(self, n_ops: int) -> bool:
+        if n_ops < self.n_ops:
+            return False
+        while self.n_ops < n_ops:
+            name, *args = StyleUnpickler(self.logfile).load()
+            getattr(self, name)(*args)
+            self.n_ops += 1
+        return True
+    
+    def lots_map(self, lots_idx: list[tuple[int, list[int]]]) \
+        -> dict[Jet, list[tuple[DyeLot, *tuple[DyeLot, ...], Snapshot]]]:
+        return {self.jets[i]: [self.cands[c] for c in cands] for i, cands in lots_idx}
+    
+    def remove(self, order_id: str) -> None:
+        self.dmnd.remove(self.dmnd.get(order_id))
+    
+    def add(self, order_id: str) -> None:
+        self.dmnd.add(self.orders[order_id])
+    
+    def replay(self, order_ids: tuple[str, ...], plan: LoadPlan) -> None:
+        orders = tuple(map(lambda id: self.orders[id], order_ids))
+        self.cands.append(replay_candidate(orders, self.inv, plan))
+    
+    def choose(self, jet_idx: int, cand_idx: int | None, idx: int | None) -> None:
+        tup = None if cand_idx is None else self.cands[cand_idx]
+        self.chosen = insert_job(self.inv, self.jets[jet_idx], tup, idx, 0.0)
+    
+    def commit(self, lots_idx: list[tuple[int, list[int]]]) -> None:
+        commit_job(self.lots_map(lots_idx), self.chosen, self.inv)
+        self.cands.clear()
+        self.chosen = None
+
+_REPLICA: Replica | None = None
+
+def _init_worker(blob: bytes, logpath: str) -> None:
+    LOGGER.processes.clear()
+    LOGGER.configure(logging.OFF)
+    globals()['_REPLICA'] = Replica(blob, logpath)
+
+def replay_candidate(orders: tuple[Order, ...], inv: Inventory, plan: LoadPlan) \
+    -> tuple[DyeLot, *tuple[DyeLot, ...], Snapshot]:
+    snap, lots_loads = replay_load_plan(inv, plan)
+    lots = tuple(map(lambda o, loads: o.assign(loads, snap), orders, lots_loads))
+    return *lots, snap
+
+def plan_candidate(loop_name: str, orders: tuple[Order, ...], inv: Inventory, jet: Jet,
+                   fills: FillCache | None = None) -> LoadPlan | str:
+    checkpoint = inv.checkpoint()
+    res = _CANDIDATE_LOOPS[loop_name](*orders, inv, jet, fills=fills)
+    if type(res) is str:
+        return res
+    
+    try:
+        return get_load_plan(inv.new_rolls(checkpoint), res[:-1], res[-1])
+    finally:
+        release_candidates({jet: [res]}, None)
+        inv.rollback(checkpoint)
+
+def _candidate_task(n_ops: int, loop_name: str, order_ids: tuple[str, ...],
+                    jet_idx: int) -> LoadPlan | str | None:
+    rep: Replica = globals()['_REPLICA']
+    if not rep.sync(n_ops):
+        return None
+    
+    orders = tuple(map(lambda id: rep.orders[id], order_ids))
+    return plan_candidate(loop_name, orders, rep.inv, rep.jets[jet_idx], fills=rep.fills)
+
+def get_candidates(loop_name: str, orders: tuple[Order, ...], inv: Inventory, jets: list[Jet],
+                   classes: dict[Jet, Jet], pool: SchedPool) \
+    -> list[tuple[DyeLot, *tuple[DyeLot, ...], Snapshot] | str]:
+    results: list[tuple[DyeLot, *tuple[DyeLot, ...], Snapshot] | str] = []
+    order_ids = tuple(map(lambda o: o.id, orders))
+    while len(results) < len(jets):
+        shared: dict[Jet, tuple[DyeLot, *tuple[DyeLot, ...], Snapshot] | str] = {}
+        firsts: dict[Jet, Jet] = {}
+        for jet in jets[len(results):]:
+            if classes[jet] not in firsts:
+                firsts[classes[jet]] = jet
+        futures = {jet: pool.submit(_candidate_task, loop_name, order_ids, pool.jet_idx[jet])
+                   for jet in firsts.values()}
+        
+        for jet in jets[len(results):]:
+            if jet not in futures:
+                results.append(shared[classes[jet]])
+                continue
+
+            plan: LoadPlan | str | None = futures[jet].result()
+            if plan is None:
+                plan = plan_candidate(loop_name, orders, inv, jet)
+            if type(plan) is str:
+                shared[classes[jet]] = plan
+                results.append(plan)
+                continue
+
+            results.append(pool.replay(orders, inv, plan))
+            if plan.new_rolls:
+                break
+            shared[classes[jet]] = results[-1]
+        
+        for fut in futures.values():
+            fut.cancel()
+    
+    return results
+
 @logging.logged_func(LOGGER, gpl_loop_args, gpl_loop_ret)
-def gpl_loop(o1: Order, o2: Order, inv: Inventory, jet: Jet) \
+def gpl_loop(o1: Order, o2: Order, inv: Inventory, jet: Jet, fills: FillCache | None = None) \
     -> tuple[DyeLot, DyeLot, Snapshot] | str:
     if not (o1.item.can_run_on_jet(jet.id) and o2.item.can_run_on_jet(jet.id)):
         return 'Jet cannot run items'
@@ -86,82 +325,121 @@ def gpl_loop(o1: Order, o2: Order, inv: Inventory, jet: Jet) \
 
     max_due = min(o1.due_date, o2.due_date) - dt.timedelta(days=1)
     min_arrival = MONDAY + dt.timedelta(weeks=1, days=3)
-    snap, loads = get_jet_loads(inv, o1.greige, jet, max_date=max_due)
+    snap, loads = get_jet_loads(inv, o1.greige, jet, max_date=max_due, fills=fills)
     if snap is None:
         if o1.greige == style.greige.get_style('AU3426 WIDE'):
             snap, loads = get_jet_loads(inv, style.greige.get_style('AU3426'), jet,
-                                        max_date=max_due)
+                                        max_date=max_due, fills=fills)
         
         if snap is None:
             snap, loads = get_jet_loads(inv, o1.greige, jet,
                                         max_date=min_arrival,
-                                        create=True)
+                                        create=True, fills=fills)
     
     ports1 = round((min_o1_ports / min_total_ports) * jet.n_ports)
-    lot1 = o1.assign(loads[:ports1])
-    lot2 = o2.assign(loads[ports1:])
+    lot1 = o1.assign(loads[:ports1], snap)
+    lot2 = o2.assign(loads[ports1:], snap)
     
     return lot1, lot2, snap
 
-def get_paired_lots(o1: Order, o2: Order, inv: Inventory, jets: list[Jet]) \
+def jet_classes(jets: list[Jet], *items: FabricStyle) -> dict[Jet, Jet]:
+    firsts: dict[tuple[int, FloatRange, bool], Jet] = {}
+    ret: dict[Jet, Jet] = {}
+    for jet in jets:
+        key = (jet.n_ports, jet.load_rng, all(map(lambda i: i.can_run_on_jet(jet.id), items)))
+        if key not in firsts:
+            firsts[key] = jet
+        ret[jet] = firsts[key]
+    return ret
+
+def share_fills(jets: list[Jet], classes: dict[Jet, Jet], inv: Inventory, greige: GreigeStyle,
+                fill) -> list[tuple[DyeLot, *tuple[DyeLot, ...], Snapshot] | str]:
+    results: list[tuple[DyeLot, *tuple[DyeLot, ...], Snapshot] | str] = []
+    shared: dict[Jet, tuple[DyeLot, *tuple[DyeLot, ...], Snapshot] | str] = {}
+    for jet in jets:
+        if classes[jet] in shared:
+            results.append(shared[classes[jet]])
+            continue
+
+        version = inv.version(greige)
+        results.append(fill(jet))
+        if inv.version(greige) != version:
+            shared.clear()
+        else:
+            shared[classes[jet]] = results[-1]
+    return results
+
+def get_paired_lots(o1: Order, o2: Order, inv: Inventory, jets: list[Jet],
+                    pool: SchedPool | None = None, fills: FillCache | None = None) \
     -> dict[Jet, tuple[DyeLot, DyeLot, Snapshot]]:
     lots_map: dict[Jet, tuple[DyeLot, DyeLot, Snapshot]] = {}
+    classes = jet_classes(jets, o1.item, o2.item)
 
-    for jet in jets:
-        res = gpl_loop(o1, o2, inv, jet)
+    if pool is None:
+        results = share_fills(jets, classes, inv, o1.greige,
+                              lambda jet: gpl_loop(o1, o2, inv, jet, fills=fills))
+    else:
+        results = get_candidates('gpl_loop', (o1, o2), inv, jets, classes, pool)
+
+    for jet, res in zip(jets, results):
         if type(res) is str: continue
         lots_map[jet] = res
     
     return lots_map
 
 @logging.logged_func(LOGGER, gsl_loop_args, gsl_loop_ret)
-def gsl_loop(order: Order, inv: Inventory, jet: Jet) -> tuple[DyeLot, Snapshot] | str:
+def gsl_loop(order: Order, inv: Inventory, jet: Jet, fills: FillCache | None = None) \
+    -> tuple[DyeLot, Snapshot] | str:
     if not order.item.can_run_on_jet(jet.id):
         return 'Jet cannot run item'
     grg_due = order.due_date - dt.timedelta(days=1)
     min_arrival = MONDAY + dt.timedelta(weeks=1, days=3)
-    snap, loads = get_jet_loads(inv, order.greige, jet, max_date=grg_due)
+    snap, loads = get_jet_loads(inv, order.greige, jet, max_date=grg_due, fills=fills)
     flag = False
     if snap is None:
         flag = True
         if order.greige == style.greige.get_style('AU3426 WIDE'):
             snap, loads = get_jet_loads(inv, style.greige.get_style('AU3426'), jet,
-                                        max_date=grg_due)
+                                        max_date=grg_due, fills=fills)
         
         if snap is None:
             snap, loads = get_jet_loads(inv, order.greige, jet,
                                         max_date=min_arrival,
-                                        create=True)
+                                        create=True, fills=fills)
         # return 'Could not fill jet'
-    return order.assign(loads), snap
+    return order.assign(loads, snap), snap
+
+_CANDIDATE_LOOPS = {'gsl_loop': gsl_loop, 'gpl_loop': gpl_loop}
 
 @logging.logged_func(LOGGER, single_lots_args, single_lots_ret)
-def get_single_lots(order: Order, inv: Inventory, jets: list[Jet]) \
+def get_single_lots(order: Order, inv: Inventory, jets: list[Jet],
+                    pool: SchedPool | None = None, fills: FillCache | None = None) \
     -> dict[Jet, tuple[DyeLot, Snapshot]]:
     lots_map: dict[Jet, tuple[DyeLot, Snapshot]] = {}
+    classes = jet_classes(jets, order.item)
     
-    for jet in jets:
-        ret = gsl_loop(order, inv, jet)
+    if pool is None:
+        rets = share_fills(jets, classes, inv, order.greige,
+                           lambda jet: gsl_loop(order, inv, jet, fills=fills))
+    else:
+        rets = get_candidates('gsl_loop', (order,), inv, jets, classes, pool)
+
+    for jet, ret in zip(jets, rets):
         if type(ret) is str: continue
         lots_map[jet] = ret
     
     return lots_map
 
-def get_order_pairs(order: Order, dmnd: Demand) -> list[tuple[Order, Order]]:
-    to_remove: list[OrderView] = list(dmnd.get_matches(order))
-    ret: list[tuple[Order, Order]] = []
-    for oview in to_remove:
-        o2 = dmnd.remove(oview)
-        ret.append((order, o2))
-        dmnd.add(o2)
-    return ret
+def get_order_pairs(order: Order, dmnd: Demand) -> list[tuple[Order, OrderView]]:
+    return [(order, o2) for o2 in dmnd.get_matches(order)]
 
 @logging.logged_func(LOGGER, desc_args=all_lots_args, desc_ret=all_lots_ret)
-def get_all_lots(order: Order, dmnd: Demand, inv: Inventory,
-                 jets: list[Jet]) -> dict[Jet, list[tuple[DyeLot, *tuple[DyeLot, ...], Snapshot]]]:
+def get_all_lots(order: Order, dmnd: Demand, inv: Inventory, jets: list[Jet],
+                 pool: SchedPool | None = None, fills: FillCache | None = None) \
+    -> dict[Jet, list[tuple[DyeLot, *tuple[DyeLot, ...], Snapshot]]]:
     lots_map: dict[Jet, list[tuple[DyeLot, *tuple[DyeLot, ...], Snapshot]]] = {}
 
-    single_lots = get_single_lots(order, inv, jets)
+    single_lots = get_single_lots(order, inv, jets, pool=pool, fills=fills)
     for single_lot in single_lots:
         if single_lot in lots_map:
             lots_map[single_lot].append(single_lots[single_lot])
@@ -170,7 +448,8 @@ def get_all_lots(order: Order, dmnd: Demand, inv: Inventory,
 
     pairs = get_order_pairs(order, dmnd)
     for pair in pairs:
-        paired_lots = get_paired_lots(pair[0], pair[1], inv, jets)
+        o2 = dmnd.get_order(pair[1].id)
+        paired_lots = get_paired_lots(pair[0], o2, inv, jets, pool=pool, fills=fills)
         for paired_lot in paired_lots:
             if paired_lot in lots_map:
                 lots_map[paired_lot].append(paired_lots[paired_lot])
@@ -211,55 +490,59 @@ def sched_cost(jet: Jet) -> tuple[float, float, float]:
             
     return strip_cost, not_seq_cost, non_black_9
 
-@logging.logged_func(LOGGER, order_cost_args, order_cost_ret)
-def order_cost(order: Order | OrderView, next_avail: dt.datetime) -> float:
+_LATE_BOUNDS = tuple(dt.timedelta(days=d) for d in (4, 5, 6, 10))
+_LATE_START_COSTS = (1000, 1500, 2500, 5000)
+_LATE_SCALES = (.01, .015, .025, .5)
+
+def _order_cost(order: Order | OrderView, next_avail: dt.datetime) -> float:
     if order.yds < 200:
         return 0
 
     table = order.late_table(next_avail)
-    first_row = table[0]
-    first_yds, first_delta = first_row
+    first_delta = table[0][1]
+    idx = bisect.bisect_right(_LATE_BOUNDS, first_delta)
     cost = 0.0
-    days_late_idxs = [4,5,6,10]
-    start_cost_map = {4: 1000, 5:1500, 6:2500, 10:5000}
-    scaling_map = {4:.01, 5: .015, 6: .025, 10: .5, 11: 1}
-    found_idx = False
-    index = 0
-    
-    for idx in days_late_idxs:
-        if first_delta < dt.timedelta(days=idx) and not found_idx:
-            cost += start_cost_map[idx]
-            found_idx = True
-            index = idx
-    if not found_idx:
+    if idx < len(_LATE_BOUNDS):
+        cost += _LATE_START_COSTS[idx]
+    else:
         cost += first_delta.days*1000
-        index = 11
-    
-    for row in table:
-        found_idx = False
-        for idx in days_late_idxs:
-            if row[1] < dt.timedelta(days=idx) and not found_idx:
-                found_idx = True
-                scalar = scaling_map[idx]
-        if not found_idx:
-            scalar = 0.1*row[1].days
-        
-        cost += row[0] * scalar
+
+    for yds, delta in table:
+        idx = bisect.bisect_right(_LATE_BOUNDS, delta)
+        if idx < len(_LATE_BOUNDS):
+            cost += yds * _LATE_SCALES[idx]
+        else:
+            cost += yds * (0.1*delta.days)
 
     if order.total_lbs > 0 and order.due_date >= next_avail:
         cost += 5000 + max(min(order.total_lbs, order.init_lbs), 500)
     return cost
 
+@logging.logged_func(LOGGER, order_cost_args, order_cost_ret)
+def order_cost(order: Order | OrderView, next_avail: dt.datetime) -> float:
+    return _order_cost(order, next_avail)
+
+@logging.logged_func(LOGGER, order_costs_args, order_costs_ret)
+def order_costs(orders: list[Order | OrderView], next_avail: dt.datetime) -> list[float]:
+    """
+    The 'order_cost' of each of the given orders, logged as one call.
+    Each row of a late table is bucketed by a binary search over the day
+    thresholds.
+    """
+    return [_order_cost(order, next_avail) for order in orders]
+
 @logging.logged_func(LOGGER, late_cost_args, late_cost_ret)
 def late_cost(order: Order, dmnd: Demand, next_avail: dt.datetime) -> tuple[float, float]:
-    cur_late = order_cost(order, next_avail)
-    rem_late = 0.0
     end_cur_wk = order.due_date + dt.timedelta(days=5-order.due_date.weekday())
-
+    others: list[OrderView] = []
     for date in dmnd:
         if date > end_cur_wk: continue
-        for other_order in dmnd[date].itervalues():
-            rem_late += order_cost(other_order, next_avail)
+        others += list(dmnd[date].itervalues())
+
+    cur_late, *rem_costs = order_costs([order, *others], next_avail)
+    rem_late = 0.0
+    for other_cost in rem_costs:
+        rem_late += other_cost
             
     return cur_late, rem_late
 
@@ -285,62 +568,122 @@ def excess_inv_cost(order: Order, reqs: list[Req]) -> tuple[float, float]:
 
 @logging.logged_func(LOGGER, used_cost_args, used_cost_ret)
 def used_inv_cost(inv: Inventory, extras: dict[GreigeStyle, list[PortLoad]], dmnd: Demand) -> float:
-    needed_grg: dict[GreigeStyle, dict[dt.datetime, float]] = {}
-    p4date = dt.datetime.fromtimestamp(0)
-    for order in dmnd.itervalues():
-        if order.pnum == 4:
-            p4date = order.due_date
-        rem_lbs = min(order.init_lbs, order.total_lbs)
-        if rem_lbs <= 0: continue
-        if order.greige not in needed_grg:
-            needed_grg[order.greige] = {}
-        if order.due_date not in needed_grg[order.greige]:
-            needed_grg[order.greige][order.due_date] = 0
-        needed_grg[order.greige][order.due_date] += rem_lbs
-    
-    avail_grg: dict[GreigeStyle, float] = {}
-    for grg in inv:
-        if grg not in avail_grg:
-            avail_grg[grg] = 0
-        for rview in inv[grg].itervalues():
-            avail_grg[grg] += rview.lbs
-    for grg in extras:
-        if grg not in avail_grg:
-            avail_grg[grg] = 0
-        avail_grg[grg] += sum(map(lambda p: p.lbs, extras[grg]))
-
-    used_cost = 0
-    for grg in needed_grg:
-        if grg not in avail_grg:
-            avail_grg[grg] = 0
-
-        dates = sorted(needed_grg[grg].keys())
-        for date in dates:
-            rem_needed = max(0, needed_grg[grg][date] - avail_grg[grg])
-            avail_grg[grg] -= needed_grg[grg][date]
-            days_late = (p4date - date).total_seconds() / (3600*24) + 1
-            if days_late < 4:
-                used_cost += rem_needed * 2.5 * 0.005
-            elif days_late < 5:
-                used_cost += rem_needed * 2.5 * 0.007
-            elif days_late < 6:
-                used_cost += rem_needed * 2.5 * 0.012
-            elif days_late < 10:
-                used_cost += rem_needed * 2.5 * 0.025
-            else:
-                used_cost += rem_needed * 2.5 * 0.5
+    p4date = dmnd.last_due_date(4)
+    if p4date is None:
+        p4date = dt.datetime.fromtimestamp(0)
+
+    used_costs: list[float] = []
+    for grg in dmnd.needed_greige():
+        avail = inv.avail_lbs(grg)
+        if grg in extras:
+            avail = math.fsum([avail, *map(lambda p: p.lbs, extras[grg])])
+        used_costs += greige_used_costs(dmnd.needed_lbs(grg), avail, p4date)
+    
+    return math.fsum(used_costs)
+
+def greige_used_costs(needed: list[tuple[dt.datetime, float]], avail: float,
+                      p4date: dt.datetime) -> list[float]:
+    costs: list[float] = []
+    for date, lbs in needed:
+        rem_needed = max(0, lbs - avail)
+        avail -= lbs
+        days_late = (p4date - date).total_seconds() / (3600*24) + 1
+        if days_late < 4:
+            costs.append(rem_needed * 2.5 * 0.005)
+        elif days_late < 5:
+            costs.append(rem_needed * 2.5 * 0.007)
+        elif days_late < 6:
+            costs.append(rem_needed * 2.5 * 0.012)
+        elif days_late < 10:
+            costs.append(rem_needed * 2.5 * 0.025)
+        else:
+            costs.append(rem_needed * 2.5 * 0.5)
+    return costs
+
+class CostModel:
+    """
+    Caches the terms of 'cost' that a single insertion cannot change.
+    Scoring a schedule only recomputes the terms of the Reqs whose lots
+    move on the touched jet; every other term is reused. Terms are
+    summed in the same order as 'late_cost' and 'excess_inv_cost', so
+    the totals are identical to a full recompute. 'used_inv_cost' reads
+    the live ledgers on the Inventory and Demand, so it is not cached.
+    """
+
+    def __init__(self, order: Order, dmnd: Demand, reqs: list[Req], next_avail: dt.datetime):
+        self.order = order
+        self.dmnd = dmnd
+        self.reqs = reqs
+        self.next_avail = next_avail
+        self.req_map: dict[FabricStyle, Req] = {req.item: req for req in reqs}
+
+        end_cur_wk = order.due_date + dt.timedelta(days=5-order.due_date.weekday())
+        self.late_orders: list[OrderView] = []
+        for date in dmnd:
+            if date > end_cur_wk: continue
+            self.late_orders += list(dmnd[date].itervalues())
+
+        self.order_costs: dict[str, float] = {}
+        self.req_costs: dict[str, float] = {}
+    
+    def get_order_costs(self, orders: list[Order | OrderView], items: set[FabricStyle]) \
+        -> list[float]:
+        stale = [o for o in orders if o.item in items or o.id not in self.order_costs]
+        fresh = dict(zip(map(lambda o: o.id, stale), order_costs(stale, self.next_avail)))
+        for order in stale:
+            if order.item not in items:
+                self.order_costs[order.id] = fresh[order.id]
+        return [fresh[o.id] if o.id in fresh else self.order_costs[o.id] for o in orders]
     
-    return used_cost
+    def get_req_cost(self, req: Req, items: set[FabricStyle]) -> float:
+        if req.item in items:
+            return req_cost(req)
+        if req.id not in self.req_costs:
+            self.req_costs[req.id] = req_cost(req)
+        return self.req_costs[req.id]
+    
+    def costs(self, inv: Inventory, prevsched: JetSched, sched: JetSched | SchedProbe) \
+        -> tuple[float, float, float, float, float]:
+        if isinstance(sched, SchedProbe):
+            old_jobs, new_jobs = prevsched.full_sched[sched.n_prefix:], sched.plans
+        else:
+            old_jobs, new_jobs = prevsched.full_sched, sched.full_sched
+        old_starts = {lot: job.start for job in old_jobs for lot in job.lots}
+        new_starts = {lot: job.start for job in new_jobs for lot in job.lots}
+        items: set[FabricStyle] = set()
+        for lot in old_starts.keys() | new_starts.keys():
+            if old_starts.get(lot) != new_starts.get(lot):
+                items.add(lot.item)
+        
+        cur_late, *rem_costs = self.get_order_costs([self.order, *self.late_orders], items)
+        rem_late = 0.0
+        for other_cost in rem_costs:
+            rem_late += other_cost
+        
+        cur_inv, rem_inv = 0, 0
+        for req in self.reqs:
+            if self.order.item == req.item:
+                cur_inv += self.get_req_cost(req, items)
+            else:
+                rem_inv += self.get_req_cost(req, items)
+        
+        used_inv = used_inv_cost(inv, prevsched.free_greige(), self.dmnd)
+        
+        return cur_late, rem_late, cur_inv, rem_inv, used_inv
 
 @logging.logged_func(LOGGER, cost_args, cost_ret)
-def cost(jet: Jet, sched: JetSched, order: Order, dmnd: Demand, reqs: list[Req],
-         snap: Snapshot, inv: Inventory, next_avail: dt.datetime) -> float:
+def cost(jet: Jet, sched: JetSched | SchedProbe, order: Order, dmnd: Demand, reqs: list[Req],
+         snap: Snapshot, inv: Inventory, next_avail: dt.datetime,
+         model: CostModel | None = None) -> float:
     apply_snapshot(inv, snap)
     prevsched = jet.set_sched(sched)
 
-    cur_late, rem_late = late_cost(order, dmnd, next_avail)
-    cur_inv, rem_inv = excess_inv_cost(order, reqs)
-    used_inv = used_inv_cost(inv, prevsched.free_greige(), dmnd)
+    if model is None:
+        cur_late, rem_late = late_cost(order, dmnd, next_avail)
+        cur_inv, rem_inv = excess_inv_cost(order, reqs)
+        used_inv = used_inv_cost(inv, prevsched.free_greige(), dmnd)
+    else:
+        cur_late, rem_late, cur_inv, rem_inv, used_inv = model.costs(inv, prevsched, sched)
     strips, not_seq, nb9 = sched_cost(jet)
 
     apply_snapshot(inv, None)
@@ -356,33 +699,87 @@ def cost(jet: Jet, sched: JetSched, order: Order, dmnd: Demand, reqs: list[Req],
 def key_sched(s_and_c: tuple[Jet, Snapshot | None, JetSched, float]):
     return s_and_c[-1]
 
+def jet_costs(jet: Jet, tups: list[tuple[DyeLot, *tuple[DyeLot, ...], Snapshot]], order: Order,
+              dmnd: Demand, reqs: list[Req], inv: Inventory, next_fri: dt.datetime,
+              model: CostModel) \
+    -> Generator[tuple[int | None, int | None, JetSched | SchedProbe, float]]:
+    for tup_idx, tup in enumerate(tups):
+        lots = tup[:-1]
+        snapshot = tup[-1]
+        index = jet.get_start_idx(lots, order.due_date)
+        cur_jet_jobs = jet.cur_sched.jobs
+        for i in range(index, len(cur_jet_jobs)+1):
+            probe = jet.cur_sched.probe_insert(lots, i)
+            if probe is not None:
+                newcost = cost(jet, probe, order, dmnd, reqs, snapshot, inv,
+                               next_fri, model=model)
+                yield tup_idx, i, probe, newcost
+    cur_cost = cost(jet, jet.cur_sched, order, dmnd, reqs, snapshot, inv,
+                    next_fri, model=model)
+    yield None, None, jet.cur_sched, cur_cost
+
+def _score_task(n_ops: int, lots_idx: list[tuple[int, list[int]]], order_id: str,
+                next_fri: dt.datetime, pos: int) -> list[tuple[int | None, int | None, float]]:
+    rep: Replica = globals()['_REPLICA']
+    rep.sync(n_ops)
+    lots_map = rep.lots_map(lots_idx)
+    jet = list(lots_map)[pos]
+    order = rep.orders[order_id]
+    checkpoint = rep.inv.checkpoint()
+    model = CostModel(order, rep.dmnd, rep.reqs, next_fri)
+    try:
+        return [(tup_idx, i, c) for tup_idx, i, _, c in jet_costs(jet, lots_map[jet], order,
+                                                                rep.dmnd, rep.reqs, rep.inv,
+                                                                next_fri, model)]
+    finally:
+        rep.inv.rollback(checkpoint)
+
+def insert_job(inv: Inventory, jet: Jet, tup: tuple[DyeLot, *tuple[DyeLot, ...], Snapshot] | None,
+               idx: int | None, c: float) -> tuple[Jet, Snapshot | None, JetSched, float]:
+    apply_snapshot(inv, None)
+    if tup is None:
+        return jet, None, jet.cur_sched, c
+    newsched, _ = jet.insert(tup[:-1], idx)
+    return jet, tup[-1], newsched, c
+
 @logging.logged_func(LOGGER, best_job_args, best_job_ret)
 def get_best_job(lots_map: dict[Jet, list[tuple[DyeLot, tuple[DyeLot, ...], Snapshot]]],
                  order: Order, dmnd: Demand, reqs: list[Req], inv: Inventory,
-                 next_avail: dt.datetime) \
+                 next_avail: dt.datetime, pool: SchedPool | None = None) \
                     -> tuple[Jet, Snapshot | None, JetSched, float] | None:
-    sched_and_costs: list[tuple[Jet, Snapshot | None, JetSched, float]] = []
+    sched_and_costs: list[tuple[Jet, Snapshot | None, JetSched | SchedProbe, float]] = []
     cur_fri = order.due_date + dt.timedelta(days=4 - order.due_date.weekday())
     next_fri = max(next_avail, cur_fri + dt.timedelta(weeks=2))
+
+    if pool is not None:
+        lots_idx = pool.lots_index(lots_map)
+        futures = [pool.submit(_score_task, lots_idx, order.id, next_fri, pos)
+                   for pos in range(len(lots_map))]
+        idx_costs: list[tuple[Jet, int | None, int | None, float]] = []
+        for jet, fut in zip(lots_map, futures):
+            idx_costs += [(jet, tup_idx, i, c) for tup_idx, i, c in fut.result()]
+        if not idx_costs:
+            return None
+        
+        jet, tup_idx, i, c = sorted(idx_costs, key=key_sched)[0]
+        tup = None if tup_idx is None else lots_map[jet][tup_idx]
+        pool.choose(jet, tup, i)
+        return insert_job(inv, jet, tup, i, c)
+
+    model = CostModel(order, dmnd, reqs, next_fri)
     for jet in lots_map:
-        for tup in lots_map[jet]:
-            lots = tup[:-1]
-            snapshot = tup[-1]
-            index = jet.get_start_idx(lots, order.due_date)
-            cur_jet_jobs = jet.cur_sched.jobs
-            for i in range(index, len(cur_jet_jobs)+1):
-                newsched, _ = jet.insert(lots, i)
-                if newsched is not None:
-                    newcost = cost(jet, newsched, order, dmnd, reqs, snapshot, inv,
-                                   next_fri)
-                    sched_and_costs.append((jet, snapshot, newsched, newcost))
-        cur_cost = cost(jet, jet.cur_sched, order, dmnd, reqs, snapshot, inv,
-                        next_fri)
-        sched_and_costs.append((jet, None, jet.cur_sched, cur_cost))
+        for tup_idx, _, sched, c in jet_costs(jet, lots_map[jet], order, dmnd, reqs, inv,
+                                              next_fri, model):
+            snapshot = None if tup_idx is None else lots_map[jet][tup_idx][-1]
+            sched_and_costs.append((jet, snapshot, sched, c))
     sorted_s_and_c = sorted(sched_and_costs, key=key_sched)
-    if len(sorted_s_and_c) > 0:
-        return sorted_s_and_c[0]
-    return None
+    if len(sorted_s_and_c) == 0:
+        return None
+    
+    jet, snapshot, sched, c = sorted_s_and_c[0]
+    if isinstance(sched, SchedProbe):
+        sched, _ = jet.insert(sched.lots, sched.idx)
+    return jet, snapshot, sched, c
 
 def add_back_free_loads(prevsched: JetSched, inv: Inventory) -> None:
     free_grg = prevsched.free_greige()
@@ -399,42 +796,127 @@ def add_back_free_loads(prevsched: JetSched, inv: Inventory) -> None:
                 roll2.deallocate(load.roll2)
                 inv.add(roll2)
 
-@logging.logged_func(LOGGER, desc_args=sched_ord_args, desc_ret=sched_ord_ret)
-def schedule_order(order: Order, dmnd: Demand, reqs: list[Req], inv: Inventory,
-                   jets: list[Jet], next_avail: dt.datetime) -> tuple[Order, bool]:
-    lots_map = get_all_lots(order, dmnd, inv, jets)
-    ret = get_best_job(lots_map, order, dmnd, reqs, inv, next_avail)
-    if ret is None:
-        return order, False
+def commit_job(lots_map: dict[Jet, list[tuple[DyeLot, *tuple[DyeLot, ...], Snapshot]]],
+               best: tuple[Jet, Snapshot | None, JetSched, float] | None,
+               inv: Inventory) -> bool:
+    if best is None:
+        release_candidates(lots_map, None)
+        return False
     
-    best_jet, best_snap, best_sched, _ = ret
+    best_jet, best_snap, best_sched, _ = best
 
     apply_snapshot(inv, best_snap, temp=False)
+    release_candidates(lots_map, best_snap)
     if best_snap is None:
-        return order, False
+        return False
     
     prevsched = best_jet.set_sched(best_sched)
     add_back_free_loads(prevsched, inv)
-    return order, True
+    return True
+
+@logging.logged_func(LOGGER, desc_args=sched_ord_args, desc_ret=sched_ord_ret)
+def schedule_order(order: Order, dmnd: Demand, reqs: list[Req], inv: Inventory,
+                   jets: list[Jet], next_avail: dt.datetime, pool: SchedPool | None = None,
+                   fills: FillCache | None = None) -> tuple[Order, bool]:
+    lots_map = get_all_lots(order, dmnd, inv, jets, pool=pool, fills=fills)
+    ret = get_best_job(lots_map, order, dmnd, reqs, inv, next_avail, pool=pool)
+    if pool is not None:
+        pool.commit(lots_map)
+    return order, commit_job(lots_map, ret, inv)
+
+class OrderQueue:
+    """
+    The orders left to schedule, in a heap keyed on due date, then on
+    how late the order currently is (its 'order_cost', largest first),
+    then on its initial yards. Requirement listeners re-key the queued
+    orders of a requirement whenever its production changes, so an
+    order that has been partly scheduled only comes straight back out
+    if it is still the most urgent order for its due date.
+
+    Orders for items that no jet can run are never queued, since no
+    lots can be built for them. An order that fails to schedule is not
+    queued again.
+    """
+
+    def __init__(self, dmnd: Demand, reqs: list[Req], jets: list[Jet],
+                 next_avail: dt.datetime):
+        self.reqs = reqs
+        self.next_avail = next_avail
+        self.heap: list[tuple] = []
+        self.entries: dict[str, tuple] = {}
+        self.seqs: dict[str, int] = {}
+        self.stale: dict[Req, None] = {}
+
+        runnable: dict[FabricStyle, bool] = {}
+        for date in sorted(dmnd):
+            for oview in sorted(dmnd[date].itervalues(), key=lambda o: o.init_yds):
+                item = oview.item
+                if item not in runnable:
+                    runnable[item] = any(map(lambda j: item.can_run_on_jet(j.id), jets))
+                if not runnable[item]: continue
+                self.seqs[oview.id] = len(self.seqs)
+                self.push(oview)
+        for req in reqs:
+            req.add_listener(self._prod_changed)
+
+    def _prod_changed(self, req: Req):
+        self.stale[req] = None
+
+    def push(self, oview: OrderView):
+        entry = (oview.due_date, -order_cost(oview, self.next_avail), oview.init_yds,
+                 self.seqs[oview.id], oview)
+        self.entries[oview.id] = entry
+        heapq.heappush(self.heap, entry)
+
+    def pop(self) -> OrderView | None:
+        for req in self.stale:
+            for order in req.orders:
+                if order.id in self.entries:
+                    self.push(order.view())
+        self.stale.clear()
+
+        while self.heap:
+            entry = heapq.heappop(self.heap)
+            oview: OrderView = entry[-1]
+            if self.entries.get(oview.id) is not entry: continue
+            del self.entries[oview.id]
+            return oview
+        return None
+
+    def close(self):
+        for req in self.reqs:
+            req.remove_listener(self._prod_changed)
 
 @logging.logged_func(LOGGER, desc_args=make_sched_args, desc_ret=make_sched_ret)
 def make_schedule(dmnd: Demand, reqs: list[Req], inv: Inventory, jets: list[Jet],
-                  next_avail: dt.datetime) -> None:
-    dates = sorted(dmnd)
-    for date in dates:
-        print(f'Making schedule for orders for {date.strftime('%m/%d')}')
-        views = sorted(dmnd[date].itervalues(), key=lambda o: o.init_yds)
-        for oview in views:
-            print(f'  Making schedule for {oview}')
-            order = dmnd.remove(oview)
+                  next_avail: dt.datetime, pool: SchedPool | None = None) -> None:
+    fills = FillCache() if pool is None else None
+    queue = OrderQueue(dmnd, reqs, jets, next_avail)
+    try:
+        date, prev_id = None, None
+        while (oview := queue.pop()) is not None:
+            if oview.due_date != date:
+                date = oview.due_date
+                print(f'Making schedule for orders for {date.strftime('%m/%d')}')
+            if oview.id != prev_id:
+                print(f'  Making schedule for {oview}')
+            prev_id = oview.id
+
+            if oview.total_yds <= 150: continue
 
-            while order.total_yds > 150:
-                order, cont = schedule_order(order, dmnd, reqs, inv, jets,
-                                             next_avail)
-                if not cont:
-                    break
-            
+            order = dmnd.remove(oview)
+            if pool is not None:
+                pool.log('remove', order.id)
+            order, cont = schedule_order(order, dmnd, reqs, inv, jets,
+                                         next_avail, pool=pool, fills=fills)
             dmnd.add(order)
+            if pool is not None:
+                pool.log('add', order.id)
+
+            if cont:
+                queue.push(oview)
+    finally:
+        queue.close()
 
 def get_input_tables(inv: Inventory, dmnd: Demand) \
     -> tuple[pd.DataFrame, pd.DataFrame]:
@@ -521,6 +1003,9 @@ def write_output(writer: pd.ExcelWriter, logpath: str, inv_df: pd.DataFrame,
                       index_label='bucket_id')
     missing_df.to_excel(writer, sheet_name='not_scheduled', float_format='%.2f', index_label='order_id')
     
+    if lgr.level == logging.OFF or lgr.sink is not None:
+        return
+    
     all_logs = get_logs_table(lgr)
     for tup in all_logs:
         fname, proc_ids, logs_data = tup
@@ -529,7 +1014,15 @@ def write_output(writer: pd.ExcelWriter, logpath: str, inv_df: pd.DataFrame,
         logs_df.to_csv(os.path.join(logpath, fname), sep='\t',
                        index_label='process_id')
 
-def main(start_str: str, end_str: str):
+def write_profile(writer: pd.ExcelWriter, logpath: str, profile: logging.Profile) -> None:
+    names, prof_data = get_profile_table(profile)
+    prof_df = pd.DataFrame(data=prof_data, index=names)
+    prof_df.to_excel(writer, sheet_name='profile', float_format='%.4f', index_label='function')
+
+    with open(os.path.join(logpath, 'profile.folded'), 'w') as outfile:
+        outfile.write('\n'.join(profile.collapsed()))
+
+def main(start_str: str, end_str: str, n_workers: int = 0, trace: tuple[str, ...] = ()):
     outpath = os.path.join(os.path.dirname(__file__), 'datasrc', 'output.xlsx')
     writer = pd.ExcelWriter(outpath, datetime_format='MM/DD HH:MM:SS')
 
@@ -542,13 +1035,39 @@ def main(start_str: str, end_str: str):
     jets = load_jets(start, end)
     print('\rFinished loading data!')
 
+    logpath = os.path.join(os.path.dirname(__file__), 'datasrc')
+    if 'PROFILE' in trace:
+        trace = tuple(t for t in trace if t != 'PROFILE')
+        LOGGER.set_profile(logging.Profile())
+    if trace == ('ALL',):
+        LOGGER.configure(logging.ALL)
+    elif trace:
+        LOGGER.configure(logging.TRACE, trace)
+    if trace:
+        LOGGER.set_sink(LogFiles(logpath))
+
     inv_df, dmnd_df = get_input_tables(inv, dmnd)
     friday = start + dt.timedelta(days=4 - start.weekday())
-    make_schedule(dmnd, reqs, inv, jets, friday + dt.timedelta(weeks=2))
-    write_output(writer, os.path.join(os.path.dirname(__file__), 'datasrc'),
-                 inv_df, dmnd_df, inv, dmnd, jets, LOGGER)
+    if n_workers > 1:
+        with SchedPool(n_workers, dmnd, reqs, inv, jets) as pool:
+            make_schedule(dmnd, reqs, inv, jets, friday + dt.timedelta(weeks=2), pool=pool)
+    else:
+        make_schedule(dmnd, reqs, inv, jets, friday + dt.timedelta(weeks=2))
+    write_output(writer, logpath, inv_df, dmnd_df, inv, dmnd, jets, LOGGER)
+    if LOGGER.profile is not None:
+        write_profile(writer, logpath, LOGGER.profile)
 
     writer.close()
+    LOGGER.close()
 
 if __name__ == '__main__':
-    main(sys.argv[1], sys.argv[2])
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Schedules the demand onto the jets.')
+    parser.add_argument('start', help='the first day of the schedule, in ISO format')
+    parser.add_argument('end', help='the last day of the schedule, in ISO format')
+    parser.add_argument('--workers', type=int, default=0,
+                        help='evaluate candidate lots on a pool of this many processes')
+    parser.add_argument('--trace', nargs='+', default=[], metavar='NAME',
+                        help='function names to trace, ALL to trace every call, '
+                             'and/or PROFILE to time each function')
+    args = parser.parse_args()
+    main(args.start, args.end, args.workers, trace=tuple(args.trace))
\ No newline at end of file
@@ -0,0 +1,19 @@
+#!/usr/bin/env python
+
+import sys, os, datetime as dt
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import style
+
+MONDAY = dt.datetime(2026, 1, 5)
+
+@pytest.fixture(scope='session')
+def styles():
+    style.greige.init()
+    style.fabric.init()
+    srcpath = os.path.join(os.path.dirname(style.fabric.__file__), 'styles.csv')
+    with open(srcpath) as infile:
+        ids = dict.fromkeys(line.split(',')[0].strip() for line in infile if line.strip())
+    return [f for f in map(style.fabric.get_style, ids) if f is not None]
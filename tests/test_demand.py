@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+
+import datetime as dt
+import pytest
+
+from app.schedule import Req, Demand, Order, OrderView
+
+from conftest import MONDAY
+
+WEEK = dt.timedelta(weeks=1)
+
+def _pair(styles):
+    seen = {}
+    for item in styles:
+        key = (item.greige, item.color)
+        if key in seen:
+            return seen[key], item
+        seen[key] = item
+    pytest.skip('no two styles share a greige style and color')
+
+def test_matches_are_views(styles):
+    item1, item2 = _pair(styles)
+    req1, req2 = Req(item1, [(MONDAY, 300)]), Req(item2, [(MONDAY, 200), (MONDAY + WEEK, 200)])
+    dmnd = Demand()
+    for order in req1.orders + req2.orders:
+        dmnd.add(order)
+
+    matches = list(dmnd.get_matches(req1.orders[0]))
+    assert [m.id for m in matches] == [o.id for o in req2.orders]
+    assert all(isinstance(m, OrderView) for m in matches)
+    order = dmnd.get_order(matches[0].id)
+    assert isinstance(order, Order) and order is req2.orders[0]
+
+def test_last_due_date_follows_adds_and_removes(styles):
+    req1 = Req(styles[0], [(MONDAY, 300), (MONDAY + 2*WEEK, 300)])
+    req2 = Req(styles[1], [(MONDAY + WEEK, 300)])
+    dmnd = Demand()
+    assert dmnd.last_due_date(1) is None
+    for order in req1.orders + req2.orders:
+        dmnd.add(order)
+    assert dmnd.last_due_date(1) == MONDAY + WEEK
+    assert dmnd.last_due_date(2) == MONDAY + 2*WEEK
+
+    dmnd.remove(dmnd.get(req2.orders[0].id))
+    assert dmnd.last_due_date(1) == MONDAY
+    dmnd.add(req2.orders[0])
+    assert dmnd.last_due_date(1) == MONDAY + WEEK
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+
+import math, random
+
+from app.support import ExactSum
+
+def test_matches_fsum():
+    rng = random.Random(0)
+    vals = [rng.uniform(-1e6, 1e6) * 10**rng.randint(-8, 8) for _ in range(500)]
+    assert ExactSum(*vals).value == math.fsum(vals)
+
+def test_order_independent():
+    rng = random.Random(1)
+    vals = [rng.uniform(0, 1000) for _ in range(200)]
+    fwd = ExactSum(*vals)
+    rng.shuffle(vals)
+    assert ExactSum(*vals).value == fwd.value
+
+def test_sub_undoes_add():
+    rng = random.Random(2)
+    total = ExactSum(0.1, 0.2, 0.3)
+    vals = [rng.uniform(-50, 50) for _ in range(100)]
+    for val in vals:
+        total.add(val)
+    for val in reversed(vals):
+        total.sub(val)
+    assert total.value == math.fsum([0.1, 0.2, 0.3])
+
+def test_copy_is_independent():
+    total = ExactSum(0.1, 0.2)
+    other = total.copy()
+    other.add(0.3)
+    assert total.value == math.fsum([0.1, 0.2])
+    assert other.value == math.fsum([0.1, 0.2, 0.3])
+
+def test_cancellation():
+    total = ExactSum(1e100, 1.0, -1e100)
+    assert total.value == 1.0
+    assert ExactSum().value == 0
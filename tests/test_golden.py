@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+import io, json, hashlib, contextlib, datetime as dt
+import pytest
+
+pytest.importorskip('pandas')
+
+import scheduler
+from bench.generate import Tier, make_scenario
+
+from conftest import MONDAY
+
+# Fingerprints of the full schedule, remaining inventory and remaining
+# demand for bench scenarios starting on MONDAY. A change here means the
+# scheduler's output changed; update them only for intended changes.
+GOLDEN = {
+    (0, 400, 200): 'b8ddd29af44d5d8f844ea3fbc7259b6c',
+    (1, 400, 200): '58e54a0470141ea3f59d627cbeda0f14',
+    (2, 150, 80): '811c4ef231a370ecbeb559424935366c'
+}
+
+# Fingerprints of the same scenarios scheduled date by date, smallest
+# order first, as make_schedule did before it drove an order queue. They
+# are the baseline scheduler's output and must not change.
+BASELINE = {
+    (0, 400, 200): '0a948b397632bc42792f39c23578119c',
+    (2, 150, 80): 'b801a88ce88cfb32c7fc76174c190062'
+}
+
+def _fingerprint(scen) -> str:
+    jobs = []
+    for cur in scen.jets:
+        for job in cur.jobs:
+            jobs.append((cur.id, str(job.start), str(job.end),
+                         [(l.item.id, [(p.roll1.roll_id, round(p.roll1.lbs, 6),
+                                        p.roll2.roll_id if p.roll2 else None,
+                                        round(p.roll2.lbs, 6) if p.roll2 else None)
+                                       for p in l.ports]) for l in job.lots]))
+    rolls = sorted((r.id, round(r.lbs, 6)) for r in scen.inv.itervalues())
+    orders = sorted((o.id, round(o.yds, 6), round(o.total_yds, 6))
+                    for o in scen.dmnd.itervalues())
+    return hashlib.md5(json.dumps([jobs, rolls, orders]).encode()).hexdigest()
+
+def _sorted_date_schedule(dmnd, reqs, inv, jets, next_avail) -> None:
+    fills = scheduler.FillCache()
+    for date in sorted(dmnd):
+        for oview in sorted(dmnd[date].itervalues(), key=lambda o: o.init_yds):
+            order = dmnd.remove(oview)
+            while order.total_yds > 150:
+                order, cont = scheduler.schedule_order(order, dmnd, reqs, inv, jets, next_avail,
+                                                       fills=fills)
+                if not cont: break
+            dmnd.add(order)
+
+def _baseline(seed: int, n_rolls: int, n_orders: int) -> str:
+    scen = make_scenario(Tier('golden', n_rolls, n_orders), MONDAY, seed=seed)
+    next_avail = MONDAY + dt.timedelta(days=4, weeks=2)
+    with contextlib.redirect_stdout(io.StringIO()):
+        _sorted_date_schedule(scen.dmnd, scen.reqs, scen.inv, scen.jets, next_avail)
+    return _fingerprint(scen)
+
+def _schedule(seed: int, n_rolls: int, n_orders: int, n_workers: int = 0) -> str:
+    scen = make_scenario(Tier('golden', n_rolls, n_orders), MONDAY, seed=seed)
+    next_avail = MONDAY + dt.timedelta(days=4, weeks=2)
+    with contextlib.redirect_stdout(io.StringIO()):
+        if n_workers:
+            with scheduler.SchedPool(n_workers, scen.dmnd, scen.reqs, scen.inv,
+                                     scen.jets) as pool:
+                scheduler.make_schedule(scen.dmnd, scen.reqs, scen.inv, scen.jets,
+                                        next_avail, pool=pool)
+        else:
+            scheduler.make_schedule(scen.dmnd, scen.reqs, scen.inv, scen.jets, next_avail)
+    return _fingerprint(scen)
+
+@pytest.fixture(autouse=True)
+def fixed_monday(monkeypatch):
+    monkeypatch.setattr(scheduler, 'MONDAY', MONDAY)
+
+@pytest.mark.parametrize('case', list(GOLDEN))
+def test_golden_schedule(case):
+    assert _schedule(*case) == GOLDEN[case]
+
+@pytest.mark.parametrize('case', list(BASELINE))
+def test_baseline_schedule(case):
+    assert _baseline(*case) == BASELINE[case]
+
+def test_pool_matches_serial():
+    assert _schedule(2, 150, 80, n_workers=2) == GOLDEN[2, 150, 80]
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+
+import random, datetime as dt
+import pytest
+
+from app.materials import Inventory, Roll, roll
+
+_AVAIL = dt.datetime(2026, 1, 1)
+
+@pytest.fixture(scope='module')
+def greiges(styles):
+    ret = []
+    for item in styles:
+        if item.greige not in ret:
+            ret.append(item.greige)
+    return ret[:3]
+
+def _lbs(grg, size):
+    port, rng = grg.port_rng, grg.roll_rng
+    return {
+        roll.PARTIAL: port.minval / 2,
+        roll.HALF: (port.minval + port.maxval) / 2,
+        roll.SMALL: (port.maxval + rng.minval) / 2,
+        roll.NORMAL: (rng.minval + rng.maxval) / 2,
+        roll.LARGE: rng.maxval * 1.2
+    }[size]
+
+def _roll(id, grg, size):
+    return Roll(id, grg, _lbs(grg, size), _AVAIL, roll.FAIRYSTONE)
+
+def test_prune_and_revive_keep_first_seen_order(greiges):
+    g1, g2 = greiges[:2]
+    inv = Inventory()
+    inv.add(_roll('A', g1, roll.NORMAL))
+    inv.add(_roll('B', g2, roll.NORMAL))
+
+    a = inv.remove(inv.get('A'))
+    assert list(inv) == [g2] and inv.n_items == 1
+    inv.add(a)
+    assert list(inv) == [g1, g2] and inv.n_items == 2
+
+    a = inv.remove(inv.get('A'), remkey=True)
+    inv.add(a)
+    assert list(inv) == [g2, g1]
+
+def test_update_moves_between_size_groups(greiges):
+    grg = greiges[0]
+    inv = Inventory()
+    inv.add(_roll('A', grg, roll.NORMAL))
+    inv.add(_roll('B', grg, roll.SMALL))
+    assert list(inv[grg]) == [roll.NORMAL, roll.SMALL]
+
+    lbs = _lbs(grg, roll.NORMAL) - _lbs(grg, roll.SMALL)
+    piece = inv.update(inv.get('A'), lambda r: r.allocate(lbs))
+    assert inv.get('A').size == roll.SMALL
+    assert list(inv[grg]) == [roll.SMALL]
+    assert list(inv[grg, roll.SMALL]) == ['B', 'A']
+    assert inv.n_items == 2
+
+    inv.update(inv.get('A'), lambda r: r.deallocate(piece))
+    assert inv.get('A').size == roll.NORMAL
+    assert list(inv[grg]) == [roll.NORMAL, roll.SMALL]
+    assert sorted(map(lambda r: r.id, inv.itervalues())) == ['A', 'B']
+
+class _Model:
+
+    def __init__(self):
+        self.rolls: dict[str, tuple] = {}
+        self.seqs: dict = {}
+        self.n_seq = 0
+
+    def seen(self, key):
+        if key not in self.seqs:
+            self.n_seq += 1
+            self.seqs[key] = self.n_seq
+
+    def live(self, pred):
+        keys = {k for k in self.seqs if pred(k)}
+        return sorted(keys, key=lambda k: self.seqs[k])
+
+def test_random_ops_match_model(greiges):
+    rng = random.Random(0)
+    sizes = [roll.PARTIAL, roll.HALF, roll.SMALL, roll.NORMAL, roll.LARGE]
+    inv = Inventory()
+    model = _Model()
+    for step in range(1500):
+        op = rng.random()
+        if op < 0.4 or not model.rolls:
+            grg, size = rng.choice(greiges), rng.choice(sizes)
+            new = _roll(f'R{step:05}', grg, size)
+            inv.add(new)
+            model.rolls[new.id] = (grg, new.size)
+        elif op < 0.7:
+            id = rng.choice(list(model.rolls))
+            remkey = rng.random() < 0.5
+            inv.remove(inv.get(id), remkey=remkey)
+            grg, size = model.rolls.pop(id)
+            if remkey:
+                if not any(map(lambda v: v == (grg, size), model.rolls.values())):
+                    model.seqs.pop((grg, size), None)
+                if not any(map(lambda v: v[0] == grg, model.rolls.values())):
+                    model.seqs.pop(grg, None)
+                    for key in list(model.seqs):
+                        if type(key) is tuple and key[0] == grg:
+                            del model.seqs[key]
+        else:
+            id = rng.choice(list(model.rolls))
+            rview = inv.get(id)
+            inv.update(rview, lambda r: r.allocate(rng.uniform(0, r.lbs / 2)))
+            model.rolls[id] = (rview.item, inv.get(id).size)
+        
+        for grg, size in model.rolls.values():
+            model.seen(grg)
+            model.seen((grg, size))
+
+        assert inv.n_items == len(model.rolls)
+        live_grgs = {v[0] for v in model.rolls.values()}
+        assert list(inv) == model.live(lambda k: k in live_grgs)
+        for grg in live_grgs:
+            live_sizes = {v for v in model.rolls.values() if v[0] == grg}
+            expected = [k[1] for k in model.live(lambda k: k in live_sizes)]
+            assert list(inv[grg]) == expected
+    
+    assert sorted(map(lambda r: r.id, inv.itervalues())) == sorted(model.rolls)
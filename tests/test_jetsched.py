@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+import random, datetime as dt
+import pytest
+
+from app.style.fabric import color
+from app.materials import PortLoad
+from app.schedule import DyeLot, JobPlan, jet
+
+from conftest import MONDAY
+
+_STRIPS = (color.STRIP, color.HEAVYSTRIP)
+
+@pytest.fixture(scope='module')
+def jets():
+    jet.init(MONDAY, MONDAY + dt.timedelta(weeks=3))
+    return jet.get_jets()
+
+def _reference_insert(sched, lots, idx):
+    newsched = sched.copy()
+    reg_jobs = sched.jobs
+    if idx > 0:
+        for job in sched.full_sched:
+            newsched.add_job(job)
+            if job is reg_jobs[idx-1]:
+                break
+    
+    min_date = max(map(lambda l: l.min_date, lots))
+    if not newsched.can_add(lots) or (newsched.last_job_end < min_date and idx < len(reg_jobs)):
+        return None, []
+    
+    newjobs = [newsched.add_lots(lots, idx)]
+    for job in reg_jobs[idx:]:
+        if newsched.can_add(tuple(job.lots)):
+            newjobs.append(newsched.add_lots(tuple(job.lots), -1))
+    return newsched, newjobs
+
+def _desc(job):
+    item = job.item if isinstance(job, JobPlan) else job.lots[0].item
+    lot_ids = () if job.shade in _STRIPS else tuple(map(lambda l: l.id, job.lots))
+    return item.id, lot_ids, job.start, job.end
+
+def _new_lot(rng, item):
+    avail = MONDAY + dt.timedelta(hours=rng.randrange(0, 24*14))
+    return DyeLot.new_lot(item, [PortLoad(None, None, 350, avail)])
+
+def test_probe_and_insert_match_reference(styles, jets):
+    rng = random.Random(0)
+    for cur in jets:
+        cur.init_new_sched()
+        items = [f for f in styles if f.can_run_on_jet(cur.id)]
+        for _ in range(40):
+            lots = (_new_lot(rng, rng.choice(items)),)
+            sched = cur.cur_sched
+            fits = []
+            for idx in range(len(sched.jobs) + 1):
+                probe = sched.probe_insert(lots, idx)
+                newsched, newjobs = cur.insert(lots, idx)
+                refsched, refjobs = _reference_insert(sched, lots, idx)
+                assert (probe is None) == (newsched is None) == (refsched is None)
+                if probe is None: continue
+
+                expected = list(map(_desc, refsched.full_sched))
+                assert list(map(_desc, probe.full_sched)) == expected
+                assert list(map(_desc, newsched.full_sched)) == expected
+                assert list(map(_desc, newjobs)) == list(map(_desc, refjobs))
+                assert newjobs[0].id == refjobs[0].id
+                fits.append(newsched)
+            
+            if fits:
+                cur.set_sched(rng.choice(fits))
+        assert len(cur.cur_sched.jobs) > 5
+
+def test_probe_activation_sets_lot_starts(styles, jets):
+    rng = random.Random(1)
+    cur = jets[0]
+    cur.init_new_sched()
+    items = [f for f in styles if f.can_run_on_jet(cur.id)]
+    lots = (_new_lot(rng, rng.choice(items)),)
+    probe = cur.cur_sched.probe_insert(lots, 0)
+    
+    prev = cur.set_sched(probe)
+    assert lots[0].start == probe.jobs[0].start
+    cur.set_sched(prev)
+    assert lots[0].start is None
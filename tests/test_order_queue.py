@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+import datetime as dt
+import pytest
+
+pytest.importorskip('pandas')
+
+import scheduler
+from app.materials import PortLoad
+from app.schedule import Req, Demand, jet
+
+from conftest import MONDAY
+
+NEXT_AVAIL = MONDAY + dt.timedelta(weeks=3)
+
+@pytest.fixture
+def jets():
+    return list(jet.read_jets(MONDAY, MONDAY + dt.timedelta(weeks=4)).values())
+
+def _demand(reqs: list[Req]):
+    dmnd = Demand()
+    for req in reqs:
+        for order in req.orders:
+            dmnd.add(order)
+    return dmnd
+
+def _runnable(styles, jets):
+    return [f for f in styles if any(map(lambda j: f.can_run_on_jet(j.id), jets))]
+
+def _drain(queue: scheduler.OrderQueue):
+    ret = []
+    while (oview := queue.pop()) is not None:
+        ret.append(oview)
+    return ret
+
+def test_pops_by_due_date_then_lateness(styles, jets):
+    items = _runnable(styles, jets)[:3]
+    reqs = [Req(items[0], [(MONDAY, 1000), (MONDAY + dt.timedelta(weeks=1), 800)]),
+            Req(items[1], [(MONDAY - dt.timedelta(weeks=1), 3000), (MONDAY, 300)]),
+            Req(items[2], [(MONDAY, 5000)])]
+    queue = scheduler.OrderQueue(_demand(reqs), reqs, jets, NEXT_AVAIL)
+    popped = _drain(queue)
+    queue.close()
+
+    keys = list(map(lambda o: (o.due_date, -scheduler.order_cost(o, NEXT_AVAIL), o.init_yds),
+                    popped))
+    assert keys == sorted(keys)
+    assert len(popped) == sum(map(lambda r: len(r.orders), reqs))
+
+def test_rekeys_when_production_changes(styles, jets):
+    items = _runnable(styles, jets)[:2]
+    reqs = [Req(items[0], [(MONDAY, 4000)]), Req(items[1], [(MONDAY, 3000)])]
+    queue = scheduler.OrderQueue(_demand(reqs), reqs, jets, NEXT_AVAIL)
+    
+    lot = reqs[0].assign([PortLoad(None, None, 2000, MONDAY - dt.timedelta(weeks=2))])
+    lot.start = MONDAY - dt.timedelta(weeks=1)
+    assert queue.pop().item == items[1]
+    assert queue.pop().item == items[0]
+    assert queue.pop() is None
+
+    queue.close()
+    lot.start = None
+    assert not queue.stale
+
+def test_skips_items_no_jet_can_run(styles, jets):
+    stuck = [f for f in styles if f not in _runnable(styles, jets)]
+    if not stuck:
+        pytest.skip('every item can run on some jet')
+    item = _runnable(styles, jets)[0]
+    reqs = [Req(stuck[0], [(MONDAY, 2000)]), Req(item, [(MONDAY, 2000)])]
+    queue = scheduler.OrderQueue(_demand(reqs), reqs, jets, NEXT_AVAIL)
+    assert list(map(lambda o: o.item, _drain(queue))) == [item]
+    queue.close()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+
+from app.materials import PortLoad, Snapshot
+from app.schedule import DyeLot, Req
+
+from conftest import MONDAY
+
+def _ports(yds: float = 350):
+    return [PortLoad(None, None, yds, MONDAY)]
+
+def test_release_unassigns_from_req(styles):
+    req = Req(styles[0], [(MONDAY, 2000)])
+    seen = []
+    req.add_listener(seen.append)
+    keep = req.assign(_ports())
+    lot = req.assign(_ports(400))
+    lot.start = MONDAY
+    assert req.total_yds_prod == lot.yds
+    seen.clear()
+
+    lot.release()
+    assert [l.id for l in req.lots] == [keep.id]
+    assert req.total_yds_prod == 0
+    assert seen == [req]
+
+def test_release_without_req_is_noop(styles):
+    lot = DyeLot.new_lot(styles[0], _ports())
+    lot.release()
+    assert lot.start is None
+
+def test_snapshot_releases_only_its_lots(styles):
+    req = Req(styles[0], [(MONDAY, 2000)])
+    committed = req.assign(_ports())
+    committed.start = MONDAY
+    snap = Snapshot()
+    tentative = [req.assign(_ports(300), snapshot=snap), req.assign(_ports(320), snapshot=snap)]
+    tentative[0].start = MONDAY
+    assert snap.lots == tuple(tentative)
+
+    assert snap.release_lots() == tuple(tentative)
+    assert snap.lots == tuple()
+    assert [l.id for l in req.lots] == [committed.id]
+    assert req.total_yds_prod == committed.yds
+    assert snap.release_lots() == tuple()
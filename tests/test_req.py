@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+
+import math, random, datetime as dt
+
+from app.materials import PortLoad
+from app.schedule import Req
+
+from conftest import MONDAY
+
+def _ports(rng: random.Random):
+    return [PortLoad(None, None, rng.uniform(300, 400), MONDAY) for _ in range(rng.randint(1, 4))]
+
+def _expected(active: list, seqs: dict):
+    active = sorted(active, key=lambda l: (l.end, seqs[l.id]))
+    cum = [math.fsum(map(lambda l: l.yds, active[:i+1])) for i in range(len(active))]
+    return active, cum
+
+def test_running_sums_are_exact(styles):
+    rng = random.Random(0)
+    req = Req(styles[0], [(MONDAY + dt.timedelta(weeks=w), 2000) for w in range(4)])
+    seqs: dict[str, int] = {}
+    lots = []
+    for step in range(400):
+        op = rng.random()
+        if op < 0.3 or not lots:
+            lot = req.assign(_ports(rng))
+            seqs[lot.id] = step
+            lots.append(lot)
+        elif op < 0.8:
+            lot = rng.choice(lots)
+            lot.start = None
+            lot.start = MONDAY + dt.timedelta(hours=rng.randrange(0, 24*21, 4))
+        elif op < 0.9:
+            rng.choice(lots).start = None
+        else:
+            lot = lots.pop(rng.randrange(len(lots)))
+            lot.release()
+        
+        active, cum = _expected([l for l in lots if l.start is not None], seqs)
+        assert [l.id for l in req.active_lots] == [l.id for l in active]
+        assert req.cum_yds == tuple(cum)
+        assert req.total_yds_prod == (cum[-1] if cum else 0)
+
+        date = MONDAY + dt.timedelta(hours=rng.randrange(0, 24*24))
+        n_by = sum(1 for l in active if l.end <= date)
+        assert req.total_yds_by(date) == ([0] + cum)[n_by]
+
+def test_listeners_see_each_change(styles):
+    req = Req(styles[0], [(MONDAY, 1000)])
+    seen = []
+    req.add_listener(seen.append)
+    lot = req.assign([PortLoad(None, None, 350, MONDAY)])
+    lot.start = MONDAY
+    lot.release()
+    assert seen == [req, req]
+    req.remove_listener(seen.append)
+    req.assign([PortLoad(None, None, 350, MONDAY)]).start = MONDAY
+    assert len(seen) == 2
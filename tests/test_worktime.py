@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+
+import random, datetime as dt
+
+from app.support import WorkCalendar
+
+_STEP = dt.timedelta(minutes=30)
+_BASE = dt.datetime(2026, 1, 1)
+
+def _grid(rng: random.Random, days: int):
+    return _BASE + rng.randrange(days*48)*_STEP
+
+def _brute_work(start: dt.datetime, end: dt.datetime):
+    total = dt.timedelta(0)
+    date = start
+    while date < end:
+        if date.weekday() != 6:
+            total += _STEP
+        date += _STEP
+    return total
+
+def test_sundays_only():
+    cal = WorkCalendar()
+    sat = dt.datetime(2026, 1, 3)
+    assert cal.work_time(sat, sat + dt.timedelta(days=2)) == dt.timedelta(days=1)
+    assert cal.work_time(sat + dt.timedelta(days=1), sat + dt.timedelta(days=2)) == \
+        dt.timedelta(0)
+
+def test_work_time_matches_brute_force():
+    rng = random.Random(0)
+    cal = WorkCalendar()
+    for _ in range(60):
+        start = _grid(rng, 30)
+        end = start + rng.randint(0, 20*48)*_STEP
+        assert cal.work_time(start, end) == _brute_work(start, end)
+        assert cal.work_time(end, start) <= dt.timedelta(0)